@@ -0,0 +1,157 @@
+try:
+    import speech_recognition as sr
+    SR_AVAILABLE = True
+except ImportError:
+    SR_AVAILABLE = False
+
+import hashlib
+import importlib.util
+
+# Pipeline stages that can each use their own recognition engine
+STAGES = ('trigger', 'command', 'dictation')
+
+
+def _no_speech():
+    """Error raised when a backend heard nothing, matching recognize_google"""
+    if SR_AVAILABLE:
+        return sr.UnknownValueError()
+    return ValueError("No speech recognised")
+
+
+class ASRBackend:
+    """Base class for speech recognition engines
+
+    ``recognize`` takes a speech_recognition AudioData and returns the
+    transcript, raising ``sr.UnknownValueError`` when nothing was
+    understood so callers can treat every engine the same way.
+    """
+    name = None
+
+    def __init__(self, voice_processor):
+        self.voice_processor = voice_processor
+
+    @classmethod
+    def is_installed(cls):
+        """Whether the engine's dependencies are importable"""
+        return True
+
+    @property
+    def cache_id(self):
+        """Identifier of the engine/model, used in transcript cache keys"""
+        return self.name
+
+    def recognize(self, audio, language='en-US'):
+        raise NotImplementedError
+
+
+class GoogleBackend(ASRBackend):
+    """Google Web Speech API (online)"""
+    name = 'google'
+
+    @classmethod
+    def is_installed(cls):
+        return SR_AVAILABLE
+
+    def recognize(self, audio, language='en-US'):
+        return self.voice_processor.recognizer.recognize_google(audio, language=language)
+
+
+class WhisperBackend(ASRBackend):
+    """Local Whisper model, decoded through the batch scheduler"""
+    name = 'whisper'
+
+    @classmethod
+    def is_installed(cls):
+        return importlib.util.find_spec('whisper') is not None
+
+    @property
+    def cache_id(self):
+        return f"whisper-{self.voice_processor.db.get_active_model()}"
+
+    def recognize(self, audio, language='en-US'):
+        text = self.voice_processor.transcribe_whisper(audio, language.split('-')[0].lower())
+        if not text:
+            raise _no_speech()
+        return text
+
+
+class SphinxBackend(ASRBackend):
+    """CMU PocketSphinx (offline)"""
+    name = 'sphinx'
+
+    @classmethod
+    def is_installed(cls):
+        return SR_AVAILABLE and importlib.util.find_spec('pocketsphinx') is not None
+
+    def recognize(self, audio, language='en-US'):
+        return self.voice_processor.recognizer.recognize_sphinx(audio, language=language)
+
+
+class FakeBackend(ASRBackend):
+    """Deterministic backend for tests
+
+    Returns the transcript registered for the exact audio bytes, or
+    ``default``; an empty result raises the usual no-speech error.
+    """
+    name = 'fake'
+
+    def __init__(self, voice_processor=None, transcripts=None, default=''):
+        super().__init__(voice_processor)
+        self.transcripts = {}
+        self.default = default
+        self.calls = 0
+        for audio, text in (transcripts or {}).items():
+            self.transcripts[self._digest(audio)] = text
+
+    @staticmethod
+    def _digest(audio):
+        raw = audio if isinstance(audio, bytes) else audio.get_raw_data()
+        return hashlib.sha1(raw).hexdigest()
+
+    def add(self, audio, text):
+        """Register the transcript to return for an AudioData"""
+        self.transcripts[self._digest(audio)] = text
+
+    def recognize(self, audio, language='en-US'):
+        self.calls += 1
+        text = self.transcripts.get(self._digest(audio), self.default)
+        if not text:
+            raise _no_speech()
+        return text
+
+
+BACKENDS = {
+    GoogleBackend.name: GoogleBackend,
+    WhisperBackend.name: WhisperBackend,
+    SphinxBackend.name: SphinxBackend,
+    FakeBackend.name: FakeBackend,
+}
+
+
+def installed_backends():
+    """Names of backends whose dependencies are present"""
+    return [name for name, cls in BACKENDS.items() if cls.is_installed()]
+
+
+def create_backend(name, voice_processor):
+    """Instantiate a backend by name, falling back to Google for unknown names"""
+    return BACKENDS.get(name, GoogleBackend)(voice_processor)
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level Levenshtein distance divided by the reference length"""
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            ))
+        previous = current
+    return previous[-1] / len(ref)
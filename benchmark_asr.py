@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+ASR backend comparison harness
+
+Runs every installed recognition backend over the same set of WAV files
+and reports real-time factor, peak memory and word error rate side by side.
+
+Usage:
+    python benchmark_asr.py path/to/wavs [--backends google,whisper]
+
+Each ``clip.wav`` needs a ``clip.txt`` next to it with the reference
+transcript. Every backend runs in its own process so model memory is
+measured in isolation.
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB (None if unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def load_corpus(wav_dir):
+    """Return a list of (wav_path, reference_text) pairs"""
+    corpus = []
+    for wav_path in sorted(glob.glob(os.path.join(wav_dir, '*.wav'))):
+        txt_path = os.path.splitext(wav_path)[0] + '.txt'
+        if os.path.exists(txt_path):
+            with open(txt_path, 'r', encoding='utf-8') as f:
+                corpus.append((wav_path, f.read().strip()))
+    return corpus
+
+
+def run_backend(name, wav_dir):
+    """Benchmark one backend in this process and return a result dict"""
+    import speech_recognition as sr
+    from voice_processor import VoiceProcessor
+    from asr_backends import create_backend, word_error_rate
+
+    vp = VoiceProcessor()
+    vp.transcript_cache = None  # measure the engine, not the cache
+    backend = create_backend(name, vp)
+
+    start = time.perf_counter()
+    if name == 'whisper':
+        vp.load_whisper_model()
+    load_time = time.perf_counter() - start
+
+    audio_seconds = 0.0
+    compute_seconds = 0.0
+    errors = 0.0
+    failures = 0
+    corpus = load_corpus(wav_dir)
+    for wav_path, reference in corpus:
+        with sr.AudioFile(wav_path) as source:
+            audio = vp.recognizer.record(source)
+        audio_seconds += len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+
+        start = time.perf_counter()
+        try:
+            hypothesis = backend.recognize(audio)
+        except Exception:
+            hypothesis = ''
+            failures += 1
+        compute_seconds += time.perf_counter() - start
+        errors += word_error_rate(reference, hypothesis)
+
+    return {
+        'backend': name,
+        'files': len(corpus),
+        'load_s': load_time,
+        'rtf': compute_seconds / audio_seconds if audio_seconds else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'wer': errors / len(corpus) if corpus else None,
+        'failures': failures,
+    }
+
+
+def format_row(values, widths):
+    return '  '.join(str(v).ljust(w) for v, w in zip(values, widths))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ASR backends on a WAV set")
+    parser.add_argument('wav_dir', help="Directory with clip.wav + clip.txt pairs")
+    parser.add_argument('--backends', help="Comma-separated backends (default: all installed)")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_backend(args.child, args.wav_dir)))
+        return 0
+
+    from asr_backends import installed_backends
+    if args.backends:
+        names = args.backends.split(',')
+    else:
+        names = [name for name in installed_backends() if name != 'fake']
+
+    if not load_corpus(args.wav_dir):
+        print(f"No .wav/.txt pairs found in {args.wav_dir}")
+        return 1
+
+    results = []
+    for name in names:
+        print(f"Running {name}...")
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), args.wav_dir, '--child', name],
+            capture_output=True, text=True,
+        )
+        lines = proc.stdout.strip().splitlines()
+        if proc.returncode != 0 or not lines:
+            print(f"✗ {name} failed:\n{proc.stderr}")
+            continue
+        results.append(json.loads(lines[-1]))
+
+    def fmt(value, pattern):
+        return pattern.format(value) if value is not None else 'n/a'
+
+    widths = [10, 6, 9, 8, 12, 8, 9]
+    print()
+    print(format_row(['backend', 'files', 'load (s)', 'RTF', 'peak RSS MB', 'WER', 'failures'], widths))
+    print('-' * (sum(widths) + 2 * len(widths)))
+    for r in results:
+        print(format_row([
+            r['backend'], r['files'], fmt(r['load_s'], '{:.2f}'), fmt(r['rtf'], '{:.3f}'),
+            fmt(r['peak_rss_mb'], '{:.0f}'), fmt(r['wer'], '{:.1%}'), r['failures'],
+        ], widths))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
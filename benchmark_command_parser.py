@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for command parsing
+
+Compares the compiled single-pass grammar with the previous substring
+splitting parser over the command corpus from test_command_grammar.py,
+and reports how many corpus commands each gets right.
+
+Usage:
+    python benchmark_command_parser.py [--rounds 2000]
+"""
+
+import argparse
+import time
+
+from test_command_grammar import CORPUS
+from translator import COMMAND_GRAMMAR
+
+# The name table the legacy parser used
+LANGUAGE_CODES = {
+    'english': 'en', 'spanish': 'es', 'french': 'fr', 'german': 'de',
+    'italian': 'it', 'portuguese': 'pt', 'russian': 'ru', 'chinese': 'zh-CN',
+    'japanese': 'ja', 'korean': 'ko', 'arabic': 'ar', 'hindi': 'hi',
+}
+
+
+def legacy_parse(command):
+    """The parser replaced by the grammar: split on 'from' and 'to' substrings"""
+    command_lower = command.lower()
+    if 'from' in command_lower and 'to' in command_lower:
+        parts = command_lower.split('from')
+        if len(parts) > 1:
+            from_to_parts = parts[1].split('to')
+            if len(from_to_parts) >= 2:
+                source_lang = from_to_parts[0].strip()
+                target_lang = from_to_parts[1].strip().split()[0]
+                return (LANGUAGE_CODES.get(source_lang, source_lang),
+                        LANGUAGE_CODES.get(target_lang, target_lang))
+    if 'to' in command_lower:
+        parts = command_lower.split('to')
+        if len(parts) > 1:
+            target_lang = parts[1].strip().split()[0]
+            return ('auto', LANGUAGE_CODES.get(target_lang, target_lang))
+    return ('auto', 'en')
+
+
+def grammar_parse(command):
+    intent = COMMAND_GRAMMAR.parse(command)
+    return (intent.source, intent.target)
+
+
+def bench(name, parse, rounds):
+    commands = [command for command, *_ in CORPUS]
+    correct = 0
+    for command, _, source, target in CORPUS:
+        try:
+            correct += parse(command) == (source, target)
+        except Exception:
+            pass
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for command in commands:
+            try:
+                parse(command)
+            except Exception:
+                pass
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / (rounds * len(commands)) * 1e6
+    print(f"{name:<10} {per_call:7.2f} µs/command   {correct}/{len(CORPUS)} corpus commands correct")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Command parser micro-benchmark")
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+
+    bench('legacy', legacy_parse, args.rounds)
+    bench('grammar', grammar_parse, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Accuracy and throughput benchmark for local language identification
+
+Runs the identifier over the held-out sentences from test_language_id.py
+and reports per-language accuracy, how often it abstains (leaving the
+source as 'auto'), how often out-of-set languages (Serbian, Galician,
+Danish, ...) are wrongly reported as a supported one, model build time
+and identifications per second.
+
+Usage:
+    python benchmark_language_id.py [--rounds 200] [--min-confidence 0.9]
+"""
+
+import argparse
+import time
+
+from language_id import LanguageIdentifier
+from test_language_id import HELD_OUT, OUT_OF_SET
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Language identification benchmark")
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--min-confidence', type=float, default=0.9)
+    parser.add_argument('--min-margin', type=float, default=0.05)
+    args = parser.parse_args()
+
+    identifier = LanguageIdentifier(min_confidence=args.min_confidence, min_margin=args.min_margin)
+    start = time.perf_counter()
+    identifier.load()
+    build = time.perf_counter() - start
+    print(f"Model: {len(identifier.supported)} languages (+{len(identifier.codes) - len(identifier.supported)} "
+          f"out-of-set), {len(identifier._vocab)} n-grams, "
+          f"built in {build * 1000:.1f} ms")
+
+    per_language = {}
+    for code, sentence in HELD_OUT:
+        stats = per_language.setdefault(code, {'total': 0, 'correct': 0, 'wrong': 0})
+        stats['total'] += 1
+        detected = identifier.detect(sentence)
+        if detected == code:
+            stats['correct'] += 1
+        elif detected is not None:
+            stats['wrong'] += 1
+            print(f"  wrong: {sentence!r} -> {detected} (expected {code})")
+
+    print(f"\n{'language':<10} {'correct':>8} {'wrong':>6} {'abstain':>8}")
+    for code, stats in per_language.items():
+        abstain = stats['total'] - stats['correct'] - stats['wrong']
+        print(f"{code:<10} {stats['correct']:>5}/{stats['total']:<2} {stats['wrong']:>6} {abstain:>8}")
+    total = len(HELD_OUT)
+    correct = sum(stats['correct'] for stats in per_language.values())
+    wrong = sum(stats['wrong'] for stats in per_language.values())
+    print(f"\nCorrect {correct}/{total} ({correct / total:.0%}), wrong {wrong}, "
+          f"abstained {total - correct - wrong} at min confidence {args.min_confidence}, "
+          f"min margin {args.min_margin}")
+
+    leaked = 0
+    for code, sentence in OUT_OF_SET:
+        detected = identifier.detect(sentence)
+        if detected is not None:
+            leaked += 1
+            print(f"  out-of-set: {sentence!r} ({code}) -> {detected}")
+    print(f"Out-of-set: {leaked}/{len(OUT_OF_SET)} wrongly reported, "
+          f"{len(OUT_OF_SET) - leaked} left to the provider")
+
+    sentences = [sentence for _, sentence in HELD_OUT + OUT_OF_SET]
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for sentence in sentences:
+            identifier.detect(sentence)
+    elapsed = time.perf_counter() - start
+    calls = args.rounds * len(sentences)
+    print(f"Throughput: {calls / elapsed:,.0f} sentences/s ({elapsed / calls * 1e6:.1f} µs each)")
+
+
+if __name__ == '__main__':
+    main()
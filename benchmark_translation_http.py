@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-call HTTP overhead of the translation clients
+
+Compares a fresh connection per call (what a new translator object per
+request does) with the pooled keep-alive session, against a local
+stand-in server so only connection handling is measured.
+
+Usage:
+    python benchmark_translation_http.py [--calls 200] [--threads 1]
+
+Against the real endpoint the difference is larger still, since every
+fresh connection also pays DNS and a TLS handshake.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from translation_clients import GoogleClient, create_session
+from translation_standin import StandInServer
+
+
+def time_calls(make_client, calls, threads):
+    """Return per-call latencies in milliseconds"""
+    def one(i):
+        client = make_client()
+        start = time.perf_counter()
+        client.translate(f"phrase number {i}")
+        return (time.perf_counter() - start) * 1000
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(one, range(calls)))
+
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{name:<22} mean {statistics.mean(latencies):7.3f} ms   "
+          f"p50 {statistics.median(latencies):7.3f} ms   p95 {p95:7.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translation HTTP overhead benchmark")
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=1)
+    args = parser.parse_args()
+
+    with StandInServer() as server:
+        url = server.url + '/translate_a/single'
+
+        def fresh_client():
+            # New session per call: new TCP connection every time
+            return GoogleClient('en', 'es', session=requests.Session(), base_url=url)
+
+        before = server.connections
+        fresh = time_calls(fresh_client, args.calls, args.threads)
+        fresh_connections = server.connections - before
+
+        session = create_session()
+        pooled_client = GoogleClient('en', 'es', session=session, base_url=url)
+        before = server.connections
+        pooled = time_calls(lambda: pooled_client, args.calls, args.threads)
+        pooled_connections = server.connections - before
+
+    print(f"{args.calls} calls, {args.threads} thread(s)")
+    report(f"fresh ({fresh_connections} conns)", fresh)
+    report(f"pooled ({pooled_connections} conns)", pooled)
+    saved = statistics.mean(fresh) - statistics.mean(pooled)
+    print(f"Per-call overhead saved by pooling: {saved:.3f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+Compiled grammar for voice and text commands
+
+Commands are tokenized into words and matched in a single left-to-right
+pass against a phrase trie holding command verbs, direction markers
+("from", "to", "into", "in") and language names. Matching whole tokens
+means words such as "tomorrow", "potato" or "Toronto" can no longer be
+mistaken for "to". The result is an Intent with a confidence score per
+slot, so callers can tell an explicit "from russian to english" apart
+from a guess or a default.
+"""
+
+import string
+
+# Punctuation becomes whitespace; apostrophes stay inside words ("tomorrow's")
+_PUNCTUATION = str.maketrans({char: ' ' for char in
+                              string.punctuation.replace("'", '') + '¿¡«»“”„…，。！？、'})
+
+# Token categories stored in the trie
+VERB = 'verb'
+FROM = 'from'
+TO = 'to'
+IN = 'in'  # "in french" only counts as a target when a language follows
+AND = 'and'  # joins further targets: "to spanish, french and german"
+LANGUAGE = 'language'
+
+VERB_PHRASES = {
+    'translate': 'translate',
+    'translates': 'translate',
+    'translated': 'translate',
+    'translating': 'translate',
+    'translation': 'translate',
+    'translator': 'translate',
+    'interpret': 'translate',
+    'how do you say': 'translate',
+    'how do i say': 'translate',
+}
+MARKER_PHRASES = {
+    'from': FROM,
+    'to': TO,
+    'into': TO,
+    'in': IN,
+    'and': AND,
+}
+
+# Slot confidences
+EXPLICIT = 1.0  # "from X", "to X", "X to Y"
+FUZZY = 0.8  # a misheard language name ("rushian")
+INFERRED = 0.7  # a lone language after the verb taken as the target
+DEFAULT_SOURCE = 0.6  # nothing said: auto-detect, usually right
+DEFAULT_TARGET = 0.3  # nothing said: the default target, a guess
+UNRECOGNIZED = 0.2  # "to <word>" where the word is no known language
+
+
+class Intent:
+    """Parsed command: action, source and target with per-slot confidence
+
+    ``targets`` lists every requested target language, ``target`` first
+    ("translate to spanish, french and german" -> ['es', 'fr', 'de']).
+    Further targets must be exact language names; misheard ones are not
+    guessed, since "and finish" or "and check it" would become targets.
+    ``target`` is None (and ``targets`` empty) when no target was named
+    and the default would just repeat the source; the caller should ask.
+    """
+
+    def __init__(self, action=None, source='auto', target='en', confidence=None,
+                 unknown=None, targets=None):
+        self.action = action
+        self.source = source
+        self.target = target
+        self.targets = targets or ([target] if target else [])
+        self.confidence = confidence or {'action': 0.0, 'source': DEFAULT_SOURCE,
+                                         'target': DEFAULT_TARGET}
+        # Words in a language slot that did not name a known language
+        self.unknown = unknown or []
+
+    @property
+    def score(self):
+        """Overall confidence: that of the weakest slot"""
+        return min(self.confidence.values())
+
+    def __repr__(self):
+        targets = self.target if len(self.targets) == 1 else self.targets
+        return (f"Intent(action={self.action!r}, source={self.source!r}, "
+                f"target={targets!r}, score={self.score:.2f})")
+
+
+def tokenize(text):
+    """Lower-cased word tokens (apostrophes kept inside words)"""
+    return text.lower().translate(_PUNCTUATION).split()
+
+
+class CommandGrammar:
+    """Single-pass command parser built from a language-name table
+
+    ``languages`` maps lower-case names (one or more words) to language
+    codes. The trie is built once; ``parse`` does one longest-match scan
+    over the tokens followed by a pass over the resulting symbols.
+
+    Words that are not known names are resolved with ``resolve(word)``
+    when they sit in a language slot ("to es", "from rushian") and with
+    ``fuzzy(word)`` when they directly follow the verb ("translate rushian
+    to english"); both return (code, distance) or None. Only ``resolve``
+    should accept codes, since words like "it" or "no" are also codes.
+    """
+
+    def __init__(self, languages, verbs=VERB_PHRASES, markers=MARKER_PHRASES,
+                 resolve=None, fuzzy=None):
+        self.resolve = resolve
+        self.fuzzy = fuzzy
+        self._trie = {}
+        self._depth = 1
+        for phrase, code in languages.items():
+            self._add(phrase, (LANGUAGE, code))
+        for phrase, action in verbs.items():
+            self._add(phrase, (VERB, action))
+        for phrase, marker in markers.items():
+            self._add(phrase, (marker, None))
+
+    def _add(self, phrase, value):
+        words = tokenize(phrase)
+        node = self._trie
+        for word in words:
+            node = node.setdefault(word, {})
+        node[None] = value
+        self._depth = max(self._depth, len(words))
+
+    def symbols(self, tokens):
+        """Longest-match tokens against the trie: (category, value, word)
+
+        Tokens not starting any phrase come out as (None, None, word).
+        """
+        i = 0
+        count = len(tokens)
+        trie = self._trie
+        depth = self._depth
+        while i < count:
+            node = trie.get(tokens[i])
+            if node is None:
+                yield None, None, tokens[i]
+                i += 1
+                continue
+            match = node.get(None)
+            end = i + 1
+            j = i + 1
+            while node and j < count and j - i < depth:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if None in node:
+                    match = node[None]
+                    end = j
+            if match is None:
+                yield None, None, tokens[i]
+                i += 1
+            else:
+                yield match[0], match[1], tokens[i] if end == i + 1 else ' '.join(tokens[i:end])
+                i = end
+
+    def parse(self, command, default_target='en', fallback_target=None):
+        """Parse a command into an Intent
+
+        ``default_target`` is used when no target is named. If it equals the
+        named source ("translate from english" with English as default),
+        ``fallback_target`` is used instead, or no target is set at all.
+        """
+        intent = Intent(target=default_target)
+        conf = intent.confidence
+        bare = None  # language named without a marker, e.g. "translate russian to english"
+        bare_conf = EXPLICIT
+        pending = None  # marker waiting for its language
+        candidate = None  # unknown word right after the verb
+        listing = False  # just named a target; more may follow ("french and german")
+        previous = None
+        for category, value, word in self.symbols(tokenize(command)):
+            if category is None and pending in (FROM, TO) and intent.action and self.resolve:
+                match = self.resolve(word)
+                if match:
+                    category, value = LANGUAGE, match[0]
+                    matched_conf = EXPLICIT if match[1] == 0 else FUZZY
+            elif category == LANGUAGE:
+                matched_conf = EXPLICIT
+            if category == TO and candidate and bare is None and self.fuzzy:
+                match = self.fuzzy(candidate)
+                if match:
+                    bare, bare_conf = match[0], FUZZY
+            candidate = word if category is None and previous == VERB else None
+            previous = category
+            if listing and category == LANGUAGE and pending is None:
+                if value not in intent.targets:
+                    intent.targets.append(value)
+                continue
+            listing = listing and category == AND
+            if category == AND:
+                continue
+
+            if category == VERB:
+                if intent.action is None:
+                    intent.action = value
+                    conf['action'] = EXPLICIT
+                pending = None
+            elif category in (FROM, TO, IN):
+                # "to to french" (a stutter) keeps the first marker
+                if pending is None or category != IN:
+                    pending = category
+            elif category == LANGUAGE:
+                if pending == FROM:
+                    intent.source = value
+                    conf['source'] = matched_conf
+                elif pending in (TO, IN):
+                    intent.target = value
+                    intent.targets = [value]
+                    conf['target'] = matched_conf
+                    listing = True
+                    if bare is not None and conf['source'] < EXPLICIT:
+                        intent.source = bare
+                        conf['source'] = bare_conf
+                    bare = None
+                else:
+                    bare, bare_conf = value, matched_conf
+                pending = None
+            else:
+                if pending in (FROM, TO) and intent.action:
+                    intent.unknown.append(word)
+                    if pending == TO and conf['target'] < INFERRED:
+                        # Passed through as a code ("to es"); a later
+                        # "into french" still overrides it
+                        intent.target = word
+                        intent.targets = [word]
+                        conf['target'] = UNRECOGNIZED
+                        if bare is not None:
+                            intent.source = bare
+                            conf['source'] = bare_conf
+                            bare = None
+                pending = None
+        if bare is not None and conf['target'] < INFERRED:
+            intent.target = bare
+            intent.targets = [bare]
+            conf['target'] = min(INFERRED, bare_conf)
+        if conf['target'] == DEFAULT_TARGET and intent.source == intent.target:
+            if fallback_target and fallback_target != intent.source:
+                intent.target = fallback_target
+                intent.targets = [fallback_target]
+            else:
+                intent.target = None
+                intent.targets = []
+                conf['target'] = 0.0
+        if intent.action is None:
+            conf['action'] = 0.0
+        return intent
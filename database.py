@@ -30,13 +30,101 @@ class Database:
             )
         ''')
         
+        # Table for recognised transcripts keyed by audio fingerprint
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS transcript_cache (
+                fingerprint TEXT NOT NULL,
+                model TEXT NOT NULL,
+                language TEXT NOT NULL,
+                transcript TEXT NOT NULL,
+                created TEXT,
+                PRIMARY KEY (fingerprint, model, language)
+            )
+        ''')
+        
+        # Table for translations, the persistent layer behind the in-memory cache
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS translation_cache (
+                text TEXT NOT NULL,
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                created REAL,
+                last_used REAL,
+                PRIMARY KEY (text, source, target, provider)
+            )
+        ''')
+        
+        # Translation memory: provider translations plus a trigram index over
+        # their source text for near-duplicate lookups
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS translation_memory (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text TEXT NOT NULL,
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                grams INTEGER NOT NULL,
+                created REAL,
+                UNIQUE (text, source, target)
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS translation_memory_grams (
+                gram TEXT NOT NULL,
+                entry_id INTEGER NOT NULL,
+                PRIMARY KEY (gram, entry_id)
+            ) WITHOUT ROWID
+        ''')
+        
+        # Translations that failed for network reasons, retried when back online
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS translation_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text TEXT NOT NULL,
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                attempts INTEGER DEFAULT 0,
+                last_error TEXT,
+                created REAL,
+                next_attempt REAL DEFAULT 0
+            )
+        ''')
+        
+        # Table for runtime counters (cache hits, misses, ...)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats (
+                key TEXT PRIMARY KEY,
+                value INTEGER DEFAULT 0
+            )
+        ''')
+        
         # Initialize default settings
         cursor.execute('''
             INSERT OR IGNORE INTO settings (key, value) VALUES
             ('trigger_phrase', 'hey assistant'),
             ('translation_api', 'google'),
+            ('deepl_api_key', ''),
+            ('translation_hedging', 'false'),
+            ('translation_memory', 'true'),
+            ('translation_memory_threshold', '0.7'),
+            ('local_language_id', 'true'),
+            ('speculative_translation', 'true'),
+            ('hedge_percentile', '95'),
+            ('rate_limit_google', '5'),
+            ('rate_burst_google', '10'),
+            ('rate_limit_deepl', '10'),
+            ('rate_burst_deepl', '20'),
             ('voice_answer', 'false'),
-            ('target_language', 'en')
+            ('speech_cache', 'true'),
+            ('target_language', 'en'),
+            ('secondary_target_language', ''),
+            ('transcript_cache', 'true'),
+            ('transcript_cache_persist', 'false'),
+            ('asr_trigger', 'google'),
+            ('asr_command', 'google'),
+            ('asr_dictation', 'google')
         ''')
         
         # Initialize available Whisper models
@@ -112,3 +200,215 @@ class Database:
         ''', (key, value))
         conn.commit()
         conn.close()
+    
+    def get_cached_transcript(self, fingerprint, model, language):
+        """Get a persisted transcript for an audio fingerprint"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT transcript FROM transcript_cache
+            WHERE fingerprint=? AND model=? AND language=?
+        ''', (fingerprint, model, language))
+        result = cursor.fetchone()
+        conn.close()
+        return result[0] if result else None
+    
+    def store_cached_transcript(self, fingerprint, model, language, transcript):
+        """Persist a transcript for an audio fingerprint"""
+        from datetime import datetime
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO transcript_cache
+            (fingerprint, model, language, transcript, created) VALUES (?, ?, ?, ?, ?)
+        ''', (fingerprint, model, language, transcript,
+              datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        conn.commit()
+        conn.close()
+    
+    def increment_stat(self, key, amount=1):
+        """Add to a runtime counter"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO stats (key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = value + excluded.value
+        ''', (key, amount))
+        conn.commit()
+        conn.close()
+    
+    def get_stat(self, key):
+        """Get a runtime counter value (0 if never incremented)"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT value FROM stats WHERE key=?', (key,))
+        result = cursor.fetchone()
+        conn.close()
+        return result[0] if result else 0
+    
+    def get_cached_translation(self, text, source, target, provider, min_created=0):
+        """Get a cached translation created after ``min_created`` (epoch seconds)"""
+        import time
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT translation FROM translation_cache
+            WHERE text=? AND source=? AND target=? AND provider=? AND created>=?
+        ''', (text, source, target, provider, min_created))
+        result = cursor.fetchone()
+        if result:
+            cursor.execute('''
+                UPDATE translation_cache SET last_used=?
+                WHERE text=? AND source=? AND target=? AND provider=?
+            ''', (time.time(), text, source, target, provider))
+            conn.commit()
+        conn.close()
+        return result[0] if result else None
+    
+    def store_cached_translation(self, text, source, target, provider, translation):
+        """Store a translation in the persistent cache"""
+        import time
+        now = time.time()
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO translation_cache
+            (text, source, target, provider, translation, created, last_used)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (text, source, target, provider, translation, now, now))
+        conn.commit()
+        conn.close()
+    
+    def prune_translation_cache(self, max_rows, min_created=0):
+        """Drop expired entries, then the least recently used beyond ``max_rows``"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM translation_cache WHERE created<?', (min_created,))
+        cursor.execute('''
+            DELETE FROM translation_cache WHERE rowid IN (
+                SELECT rowid FROM translation_cache
+                ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+        ''', (max_rows,))
+        conn.commit()
+        conn.close()
+    
+    def store_memory_entry(self, text, source, target, translation, grams):
+        """Store a translation memory entry and index its trigrams"""
+        import time
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO translation_memory (text, source, target, translation, grams, created)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(text, source, target) DO UPDATE SET
+                translation = excluded.translation, created = excluded.created
+        ''', (text, source, target, translation, len(grams), time.time()))
+        cursor.execute('''
+            SELECT id FROM translation_memory WHERE text=? AND source=? AND target=?
+        ''', (text, source, target))
+        entry_id = cursor.fetchone()[0]
+        cursor.executemany('''
+            INSERT OR IGNORE INTO translation_memory_grams (gram, entry_id) VALUES (?, ?)
+        ''', [(gram, entry_id) for gram in grams])
+        conn.commit()
+        conn.close()
+    
+    def find_memory_candidates(self, grams, source, target, min_grams=0, max_grams=None,
+                               limit=20):
+        """Memory entries sharing the most trigrams with ``grams``
+        
+        Returns (text, translation, gram count, shared gram count) rows for
+        the language pair, most shared first.
+        """
+        grams = list(grams)
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT m.text, m.translation, m.grams, COUNT(*) AS shared
+            FROM translation_memory_grams g
+            JOIN translation_memory m ON m.id = g.entry_id
+            WHERE g.gram IN ({', '.join('?' * len(grams))})
+              AND m.source=? AND m.target=?
+              AND m.grams BETWEEN ? AND ?
+            GROUP BY m.id ORDER BY shared DESC LIMIT ?
+        ''', grams + [source, target, min_grams,
+                      max_grams if max_grams is not None else 1 << 30, limit])
+        rows = cursor.fetchall()
+        conn.close()
+        return rows
+    
+    def prune_translation_memory(self, max_entries):
+        """Keep only the ``max_entries`` most recently stored memory entries"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            DELETE FROM translation_memory WHERE id IN (
+                SELECT id FROM translation_memory
+                ORDER BY created DESC LIMIT -1 OFFSET ?
+            )
+        ''', (max_entries,))
+        cursor.execute('''
+            DELETE FROM translation_memory_grams
+            WHERE entry_id NOT IN (SELECT id FROM translation_memory)
+        ''')
+        conn.commit()
+        conn.close()
+    
+    def add_outbox_entry(self, text, source, target, error=None):
+        """Queue a translation for retry; returns the entry id"""
+        import time
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO translation_outbox (text, source, target, last_error, created, next_attempt)
+            VALUES (?, ?, ?, ?, ?, 0)
+        ''', (text, source, target, error, time.time()))
+        entry_id = cursor.lastrowid
+        conn.commit()
+        conn.close()
+        return entry_id
+    
+    def get_outbox_entries(self):
+        """All queued translations, oldest first"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id, text, source, target, attempts, last_error, created
+            FROM translation_outbox ORDER BY id
+        ''')
+        rows = cursor.fetchall()
+        conn.close()
+        return rows
+    
+    def get_due_outbox_entries(self, now, limit=None):
+        """Queued translations whose next attempt is due, oldest first"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id, text, source, target, attempts, last_error, created
+            FROM translation_outbox WHERE next_attempt<=? ORDER BY id LIMIT ?
+        ''', (now, -1 if limit is None else limit))
+        rows = cursor.fetchall()
+        conn.close()
+        return rows
+    
+    def defer_outbox_entry(self, entry_id, next_attempt, error):
+        """Record a failed attempt and when to try again"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE translation_outbox
+            SET attempts = attempts + 1, last_error=?, next_attempt=?
+            WHERE id=?
+        ''', (error, next_attempt, entry_id))
+        conn.commit()
+        conn.close()
+    
+    def delete_outbox_entry(self, entry_id):
+        """Remove a delivered (or abandoned) outbox entry"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM translation_outbox WHERE id=?', (entry_id,))
+        conn.commit()
+        conn.close()
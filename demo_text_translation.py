@@ -32,7 +32,7 @@ def demo_command_parsing():
         print()
 
 def demo_translation():
-    """Demonstrate actual translation (requires deep-translator)"""
+    """Demonstrate actual translation (requires network access)"""
     print("\n2. Translation Examples:")
     print("-" * 60)
     
@@ -53,8 +53,7 @@ def demo_translation():
             print(f"Result: '{result}'")
             print()
     except Exception as e:
-        print(f"Translation requires 'deep-translator' package")
-        print(f"Install with: pip install deep-translator")
+        print(f"Translation requires network access to the provider")
         print(f"Error: {e}")
 
 def demo_usage():
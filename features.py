@@ -0,0 +1,194 @@
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+
+import threading
+
+# Whisper's front end: 25 ms Hann window, 10 ms hop at 16 kHz
+SAMPLE_RATE = 16000
+N_FFT = 400
+HOP_LENGTH = 160
+N_FRAMES = 3000  # frames in one 30-second Whisper window
+LOG_FLOOR = -10.0  # log10 of the 1e-10 power clamp
+
+
+def mel_filters(n_mels=80):
+    """Return the (n_mels, 201) Slaney mel filterbank Whisper was trained with
+
+    Uses the filterbank shipped with Whisper when it is installed; otherwise
+    builds the identical librosa-style filterbank in NumPy.
+    """
+    if WHISPER_AVAILABLE:
+        return whisper.audio.mel_filters('cpu', n_mels).numpy()
+
+    def hz_to_mel(f):
+        f = np.asarray(f, dtype=np.float64)
+        return np.where(f >= 1000.0, 15.0 + np.log(np.maximum(f, 1e-10) / 1000.0) / (np.log(6.4) / 27.0),
+                        3.0 * f / 200.0)
+
+    def mel_to_hz(m):
+        return np.where(m >= 15.0, 1000.0 * np.exp((np.log(6.4) / 27.0) * (m - 15.0)), 200.0 * m / 3.0)
+
+    fft_freqs = np.linspace(0, SAMPLE_RATE / 2, 1 + N_FFT // 2)
+    mel_f = mel_to_hz(np.linspace(hz_to_mel(0.0), hz_to_mel(SAMPLE_RATE / 2), n_mels + 2))
+    fdiff = np.diff(mel_f)
+    ramps = mel_f[:, None] - fft_freqs[None, :]
+    lower = -ramps[:-2] / fdiff[:-1, None]
+    upper = ramps[2:] / fdiff[1:, None]
+    weights = np.maximum(0, np.minimum(lower, upper))
+    weights *= (2.0 / (mel_f[2:n_mels + 2] - mel_f[:n_mels]))[:, None]
+    return weights.astype(np.float32)
+
+
+def normalize_for_whisper(log_mel):
+    """Pad/trim raw log10 mel frames to one window and apply Whisper's scaling"""
+    n_mels, n = log_mel.shape
+    window = np.full((n_mels, N_FRAMES), LOG_FLOOR, dtype=np.float32)
+    window[:, :min(n, N_FRAMES)] = log_mel[:, :N_FRAMES]
+    window = np.maximum(window, window.max() - 8.0)
+    return (window + 4.0) / 4.0
+
+
+class LogMelStream:
+    """Incremental log-mel front end shared by every consumer of captured audio
+
+    PCM is fed as it is captured; complete STFT frames are computed in one
+    vectorised pass per feed and kept, together with the PCM, in fixed-size
+    ring buffers. Frame ``t`` is centred on sample ``t * HOP_LENGTH`` of the
+    stream, exactly like Whisper's centred STFT, so wake-word detection, VAD,
+    fingerprinting and the Whisper encoder can all read the same frames
+    instead of recomputing spectra.
+
+    ``reset`` starts a new segment (one utterance) so its frames never
+    look back at the previous one; frame and sample numbering continues.
+    """
+
+    def __init__(self, n_mels=80, capacity_seconds=60):
+        self.n_mels = n_mels
+        self.capacity = capacity_seconds * SAMPLE_RATE // HOP_LENGTH
+        self.filters = mel_filters(n_mels)
+        self.window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(N_FFT) / N_FFT)).astype(np.float32)
+        self.frames_total = 0
+        self.samples_total = 0
+        self._mel = np.zeros((self.capacity, n_mels), dtype=np.float32)
+        self._pcm = np.zeros(self.capacity * HOP_LENGTH, dtype=np.float32)
+        self._head = np.zeros(0, dtype=np.float32)  # start of stream, before padding
+        self._buf = None  # samples not yet fully consumed by a frame
+        self._lock = threading.Lock()
+
+    def feed(self, pcm):
+        """Append float32 16 kHz PCM; returns the ``(start, end)`` frame range it covers
+
+        The last couple of frames of a chunk only become available once the
+        following chunk arrives, since each frame looks 200 samples ahead.
+        """
+        pcm = np.asarray(pcm, dtype=np.float32)
+        with self._lock:
+            first_frame = -(-self.samples_total // HOP_LENGTH)
+            self._store_pcm(pcm)
+
+            if self._buf is None:
+                # Reflect-pad the very start of the stream like a centred STFT
+                self._head = np.concatenate([self._head, pcm])
+                if len(self._head) <= N_FFT // 2:
+                    return first_frame, self.frames_total
+                self._buf = np.concatenate([self._head[1:N_FFT // 2 + 1][::-1], self._head])
+                self._head = None
+            else:
+                self._buf = np.concatenate([self._buf, pcm])
+
+            self._compute_frames()
+            return first_frame, self.frames_total
+
+    def reset(self):
+        """End the current segment; the next ``feed`` starts a fresh one
+
+        The segment's last frames are completed by reflect-padding its end,
+        as a centred STFT of the clip alone would. The new segment starts
+        on a frame boundary (the PCM ring is padded with silence) and is
+        reflect-padded at its start, so its frames match those of the clip
+        fed into a new stream. Earlier frame ranges stay valid.
+        """
+        with self._lock:
+            boundary = -(-self.samples_total // HOP_LENGTH)
+            if self._buf is not None:
+                self._buf = np.concatenate([self._buf, self._buf[-N_FFT // 2 - 1:-1][::-1]])
+                self._compute_frames(limit=boundary - self.frames_total)
+            if boundary > self.frames_total:
+                # Too short to frame (a few samples): leave silence
+                self._store_frames(np.full((boundary - self.frames_total, self.n_mels), -10.0,
+                                           dtype=np.float32))
+            self._store_pcm(np.zeros(boundary * HOP_LENGTH - self.samples_total, dtype=np.float32))
+            self._buf = None
+            self._head = np.zeros(0, dtype=np.float32)
+
+    def log_mel(self, start, end):
+        """Return raw log10 mel frames ``[start, end)`` as an (n_mels, n) array"""
+        with self._lock:
+            end = min(end, self.frames_total)
+            if start < self.frames_total - self.capacity:
+                raise ValueError("Requested frames have been evicted from the ring")
+            idx = np.arange(start, end) % self.capacity
+            return self._mel[idx].T.copy()
+
+    def latest(self, n):
+        """Return the most recent ``n`` log-mel frames"""
+        with self._lock:
+            total = self.frames_total
+        return self.log_mel(max(0, total - n), total)
+
+    def pcm(self, start, end):
+        """Return the PCM samples underlying frames ``[start, end)``"""
+        with self._lock:
+            lo, hi = start * HOP_LENGTH, min(end * HOP_LENGTH, self.samples_total)
+            if lo < self.samples_total - len(self._pcm):
+                raise ValueError("Requested samples have been evicted from the ring")
+            return self._pcm[np.arange(lo, hi) % len(self._pcm)].copy()
+
+    def whisper_mel(self, start, end):
+        """Return frames ``[start, end)`` as a normalised Whisper encoder input"""
+        return normalize_for_whisper(self.log_mel(start, end))
+
+    def _compute_frames(self, limit=None):
+        """Turn every complete window in the buffer into log-mel frames"""
+        if len(self._buf) < N_FFT:
+            return
+        n_new = 1 + (len(self._buf) - N_FFT) // HOP_LENGTH
+        if limit is not None:
+            n_new = min(n_new, limit)
+            if n_new <= 0:
+                return
+        idx = np.arange(N_FFT)[None, :] + HOP_LENGTH * np.arange(n_new)[:, None]
+        spectrum = np.fft.rfft(self._buf[idx] * self.window, axis=1)
+        power = spectrum.real ** 2 + spectrum.imag ** 2
+        log_mel = np.log10(np.maximum(power @ self.filters.T, 1e-10))
+        self._store_frames(log_mel.astype(np.float32))
+        self._buf = self._buf[n_new * HOP_LENGTH:]
+
+    def _store_pcm(self, pcm):
+        size = len(self._pcm)
+        end = self.samples_total + len(pcm)
+        kept = pcm[-size:]
+        self._pcm[np.arange(end - len(kept), end) % size] = kept
+        self.samples_total = end
+
+    def _store_frames(self, frames):
+        end = self.frames_total + len(frames)
+        kept = frames[-self.capacity:]
+        self._mel[np.arange(end - len(kept), end) % self.capacity] = kept
+        self.frames_total = end
+
+
+def log_mel_spectrogram(pcm, n_mels=80):
+    """One-shot raw log10 mel spectrogram of a clip, using the streaming front end"""
+    stream = LogMelStream(n_mels, capacity_seconds=len(pcm) // SAMPLE_RATE + 2)
+    start, end = stream.feed(pcm)
+    return stream.log_mel(start, end)
@@ -0,0 +1,98 @@
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError, wait
+
+
+class LatencyTracker:
+    """Rolling per-provider latency window with percentile lookups
+
+    Keeps the last ``window`` successful call durations per provider. Until
+    ``min_samples`` have been seen, ``default`` seconds is used instead.
+    """
+
+    def __init__(self, window=200, min_samples=20, default=1.0):
+        self.window = window
+        self.min_samples = min_samples
+        self.default = default
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider, seconds):
+        with self._lock:
+            samples = self._samples.get(provider)
+            if samples is None:
+                samples = self._samples[provider] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, provider, percentile):
+        """Latency (seconds) below which ``percentile`` % of calls finished"""
+        with self._lock:
+            samples = sorted(self._samples.get(provider, ()))
+        if len(samples) < self.min_samples:
+            return self.default
+        index = min(len(samples) - 1, int(len(samples) * percentile / 100.0))
+        return samples[index]
+
+
+class Hedger:
+    """Runs a call and, if it is slow, races a backup call against it
+
+    ``call(primary_fn, backup_fn, delay)`` starts ``primary_fn`` and waits
+    ``delay`` seconds. If it has not finished, ``backup_fn`` is started and
+    the first successful result wins; the loser is cancelled if it has not
+    started yet, otherwise its result is discarded. If both fail, the
+    primary's error is raised.
+
+    A primary that fails within ``delay`` starts the backup at once when
+    ``retryable(error)`` is true (the default for every error); other
+    errors are raised without a backup.
+
+    ``fired`` counts backups started and ``won`` counts backups that beat
+    the primary.
+    """
+
+    def __init__(self, max_workers=8, retryable=None):
+        self.retryable = retryable
+        self.fired = 0
+        self.won = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='hedge')
+        self._lock = threading.Lock()
+
+    def call(self, primary_fn, backup_fn, delay):
+        """Return (result, hedge_fired, backup_won)"""
+        primary = self._executor.submit(primary_fn)
+        try:
+            return primary.result(timeout=delay), False, False
+        except TimeoutError:
+            pass
+        except Exception as e:
+            if self.retryable is not None and not self.retryable(e):
+                raise
+
+        backup = self._executor.submit(backup_fn)
+        with self._lock:
+            self.fired += 1
+
+        pending = {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    won = future is backup
+                    if won:
+                        with self._lock:
+                            self.won += 1
+                    return future.result(), True, won
+        raise primary.exception()
+
+    def stats(self):
+        with self._lock:
+            fired, won = self.fired, self.won
+        return {'fired': fired, 'won': won,
+                'win_rate': won / fired if fired else 0.0}
+
+    def close(self):
+        self._executor.shutdown(wait=False)
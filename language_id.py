@@ -0,0 +1,151 @@
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+import threading
+
+# Punctuation, digits and symbols become word breaks
+_BREAKS = str.maketrans({char: ' ' for char in '0123456789!"#$%&()*+,./:;<=>?@[\\]^_`{|}~'
+                         '¿¡«»“”„…‘’，。！？、；：（）「」'})
+
+
+def char_ngrams(text, max_order=3):
+    """Character 1..max_order-grams of lower-cased, space-padded words"""
+    padded = f" {' '.join(text.lower().translate(_BREAKS).split())} "
+    grams = []
+    for order in range(1, max_order + 1):
+        for i in range(len(padded) - order + 1):
+            gram = padded[i:i + order]
+            if gram.strip():
+                grams.append(gram)
+    return grams
+
+
+class LanguageIdentifier:
+    """Naive Bayes language identifier over character n-grams
+
+    The model is a (vocabulary x languages) float32 matrix of smoothed log
+    probabilities, built on first use from ``samples`` (language code ->
+    sentences; language_samples.SAMPLES by default) and ``others``
+    (language_samples.OTHER_SAMPLES). The vocabulary keeps the ``top_k``
+    most frequent n-grams of each language. Scoring a text is one dict
+    lookup per n-gram and a single NumPy gather-and-sum.
+
+    ``detect`` returns a code only when the best language is one of
+    ``samples`` (not one of ``others``, which only exist to catch text in
+    closely related languages), leads the runner-up by ``min_margin`` in
+    average log probability per n-gram, has a posterior probability of at
+    least ``min_confidence``, and the text has at least ``min_letters``
+    letters. Anything else stays 'auto' for the provider to detect.
+    """
+
+    def __init__(self, samples=None, others=None, max_order=3, top_k=500, alpha=0.5,
+                 min_confidence=0.9, min_margin=0.05, min_letters=4):
+        self.samples = samples
+        self.others = others
+        self.max_order = max_order
+        self.top_k = top_k
+        self.alpha = alpha
+        self.min_confidence = min_confidence
+        self.min_margin = min_margin
+        self.min_letters = min_letters
+        self.codes = None
+        self.supported = None
+        self._vocab = None
+        self._weights = None
+        self._lock = threading.Lock()
+
+    @property
+    def available(self):
+        return NUMPY_AVAILABLE
+
+    def load(self):
+        """Build the model now instead of on the first ``detect``"""
+        if self._weights is None:
+            with self._lock:
+                if self._weights is None:
+                    self._build()
+        return self
+
+    def identify(self, text):
+        """(code, probability) of the most likely language, or None
+
+        The code may be one of the ``others`` languages.
+        """
+        result = self._score(text)
+        if result is None:
+            return None
+        code, probability, _ = result
+        return code, probability
+
+    def detect(self, text, min_confidence=None):
+        """Language code of ``text`` if confidently identified, else None"""
+        if sum(char.isalpha() for char in text) < self.min_letters:
+            return None
+        result = self._score(text)
+        if result is None:
+            return None
+        code, probability, margin = result
+        threshold = self.min_confidence if min_confidence is None else min_confidence
+        if code not in self.supported or margin < self.min_margin or probability < threshold:
+            return None
+        return code
+
+    def _score(self, text):
+        """(code, posterior probability, per-n-gram margin over the runner-up)"""
+        if not NUMPY_AVAILABLE:
+            return None
+        self.load()
+        vocab = self._vocab
+        grams = char_ngrams(text, self.max_order)
+        indices = [index for index in map(vocab.get, grams) if index is not None]
+        if not indices:
+            return None
+        scores = self._weights[indices].sum(axis=0)
+        scores -= scores.max()
+        best = int(scores.argmax())
+        runner_up = np.partition(scores, -2)[-2] if len(scores) > 1 else -np.inf
+        probabilities = np.exp(scores)
+        return (self.codes[best], float(probabilities[best] / probabilities.sum()),
+                float(-runner_up / len(grams)))
+
+    def _build(self):
+        samples, others = self.samples, self.others
+        if samples is None or others is None:
+            from language_samples import SAMPLES, OTHER_SAMPLES
+            samples = SAMPLES if samples is None else samples
+            others = OTHER_SAMPLES if others is None else others
+        training = dict(others)
+        training.update(samples)
+
+        codes = list(samples) + [code for code in others if code not in samples]
+        counts = []
+        vocab = {}
+        for code in codes:
+            language_counts = {}
+            for sentence in training[code]:
+                for gram in char_ngrams(sentence, self.max_order):
+                    language_counts[gram] = language_counts.get(gram, 0) + 1
+            counts.append(language_counts)
+            for gram in sorted(language_counts, key=language_counts.get, reverse=True)[:self.top_k]:
+                vocab.setdefault(gram, len(vocab))
+
+        matrix = np.zeros((len(vocab), len(codes)), dtype=np.float64)
+        for column, language_counts in enumerate(counts):
+            for gram, count in language_counts.items():
+                row = vocab.get(gram)
+                if row is not None:
+                    matrix[row, column] = count
+        matrix += self.alpha
+        matrix /= matrix.sum(axis=0, keepdims=True)
+
+        self.codes = codes
+        self.supported = set(samples)
+        self._vocab = vocab
+        self._weights = np.ascontiguousarray(np.log(matrix), dtype=np.float32)
+
+
+# Shared instance; the model is built on first use
+LANGUAGE_ID = LanguageIdentifier()
@@ -0,0 +1,292 @@
+"""
+Index of the languages the translation providers support
+
+Built once at import. Exact lookups by English name, native name, common
+alternative name or ASR misspelling, and ISO 639-1/639-2 code are single
+dict hits; anything else goes through a bigram index that narrows the
+names to a handful of candidates before computing edit distances, with a
+bound that grows with word length, so noise like "rushian" or
+"japaneese" still resolves while random words do not.
+
+Codes are the ones Google's endpoint expects ('zh-CN', 'iw', 'jw', ...).
+"""
+
+# (code, English name, native name, ISO 639-2 codes, comma-separated other names
+# and common misspellings)
+_LANGUAGES = [
+    ('af', 'afrikaans', 'afrikaans', 'afr', ''),
+    ('sq', 'albanian', 'shqip', 'sqi alb', ''),
+    ('am', 'amharic', 'አማርኛ', 'amh', ''),
+    ('ar', 'arabic', 'العربية', 'ara', 'arabian, arabik, arab'),
+    ('hy', 'armenian', 'հայերեն', 'hye arm', ''),
+    ('as', 'assamese', 'অসমীয়া', 'asm', ''),
+    ('ay', 'aymara', 'aymar aru', 'aym', ''),
+    ('az', 'azerbaijani', 'azərbaycan', 'aze', 'azeri'),
+    ('bm', 'bambara', 'bamanankan', 'bam', ''),
+    ('eu', 'basque', 'euskara', 'eus baq', ''),
+    ('be', 'belarusian', 'беларуская', 'bel', 'belorussian, byelorussian'),
+    ('bn', 'bengali', 'বাংলা', 'ben', 'bangla'),
+    ('bho', 'bhojpuri', 'भोजपुरी', 'bho', ''),
+    ('bs', 'bosnian', 'bosanski', 'bos', ''),
+    ('bg', 'bulgarian', 'български', 'bul', ''),
+    ('ca', 'catalan', 'català', 'cat', ''),
+    ('ceb', 'cebuano', 'cebuano', 'ceb', 'bisaya'),
+    ('ny', 'chichewa', 'chichewa', 'nya', 'nyanja, chewa'),
+    ('zh-CN', 'chinese', '中文', 'zho chi',
+     'mandarin, simplified chinese, chinese simplified, 简体中文, chineese, chinease'),
+    ('zh-TW', 'traditional chinese', '繁體中文', '', 'chinese traditional, taiwanese'),
+    ('co', 'corsican', 'corsu', 'cos', ''),
+    ('hr', 'croatian', 'hrvatski', 'hrv', ''),
+    ('cs', 'czech', 'čeština', 'ces cze', 'chech'),
+    ('da', 'danish', 'dansk', 'dan', ''),
+    ('dv', 'dhivehi', 'ދިވެހި', 'div', 'divehi, maldivian'),
+    ('doi', 'dogri', 'डोगरी', 'doi', ''),
+    ('nl', 'dutch', 'nederlands', 'nld dut', 'flemish'),
+    ('en', 'english', 'english', 'eng', 'inglish, englisch'),
+    ('eo', 'esperanto', 'esperanto', 'epo', ''),
+    ('et', 'estonian', 'eesti', 'est', ''),
+    ('ee', 'ewe', 'eʋegbe', 'ewe', ''),
+    ('tl', 'filipino', 'filipino', 'fil tgl', 'tagalog'),
+    ('fi', 'finnish', 'suomi', 'fin', ''),
+    ('fr', 'french', 'français', 'fra fre', 'francais'),
+    ('fy', 'frisian', 'frysk', 'fry', ''),
+    ('gl', 'galician', 'galego', 'glg', ''),
+    ('ka', 'georgian', 'ქართული', 'kat geo', ''),
+    ('de', 'german', 'deutsch', 'deu ger', 'germen'),
+    ('el', 'greek', 'ελληνικά', 'ell gre', ''),
+    ('gn', 'guarani', "avañe'ẽ", 'grn', ''),
+    ('gu', 'gujarati', 'ગુજરાતી', 'guj', ''),
+    ('ht', 'haitian creole', 'kreyòl ayisyen', 'hat', 'haitian, creole'),
+    ('ha', 'hausa', 'hausa', 'hau', ''),
+    ('haw', 'hawaiian', 'ʻōlelo hawaiʻi', 'haw', ''),
+    ('iw', 'hebrew', 'עברית', 'heb he', 'ivrit'),
+    ('hi', 'hindi', 'हिन्दी', 'hin', 'hindu'),
+    ('hmn', 'hmong', 'hmoob', 'hmn', ''),
+    ('hu', 'hungarian', 'magyar', 'hun', ''),
+    ('is', 'icelandic', 'íslenska', 'isl ice', ''),
+    ('ig', 'igbo', 'igbo', 'ibo', ''),
+    ('ilo', 'ilocano', 'ilokano', 'ilo', ''),
+    ('id', 'indonesian', 'bahasa indonesia', 'ind', ''),
+    ('ga', 'irish', 'gaeilge', 'gle', 'irish gaelic'),
+    ('it', 'italian', 'italiano', 'ita', 'italien'),
+    ('ja', 'japanese', '日本語', 'jpn', 'japaneese, japanise, nihongo'),
+    ('jw', 'javanese', 'basa jawa', 'jav jv', ''),
+    ('kn', 'kannada', 'ಕನ್ನಡ', 'kan', ''),
+    ('kk', 'kazakh', 'қазақ', 'kaz', ''),
+    ('km', 'khmer', 'ខ្មែរ', 'khm', 'cambodian'),
+    ('rw', 'kinyarwanda', 'ikinyarwanda', 'kin', ''),
+    ('gom', 'konkani', 'कोंकणी', 'gom kok', ''),
+    ('ko', 'korean', '한국어', 'kor', 'korian'),
+    ('kri', 'krio', 'krio', 'kri', ''),
+    ('ku', 'kurdish', 'kurdî', 'kur kmr', 'kurmanji'),
+    ('ckb', 'sorani', 'کوردی', 'ckb', 'central kurdish'),
+    ('ky', 'kyrgyz', 'кыргызча', 'kir', 'kirghiz'),
+    ('lo', 'lao', 'ລາວ', 'lao', 'laotian'),
+    ('la', 'latin', 'latina', 'lat', ''),
+    ('lv', 'latvian', 'latviešu', 'lav', ''),
+    ('ln', 'lingala', 'lingála', 'lin', ''),
+    ('lt', 'lithuanian', 'lietuvių', 'lit', ''),
+    ('lg', 'luganda', 'luganda', 'lug', 'ganda'),
+    ('lb', 'luxembourgish', 'lëtzebuergesch', 'ltz', ''),
+    ('mk', 'macedonian', 'македонски', 'mkd mac', ''),
+    ('mai', 'maithili', 'मैथिली', 'mai', ''),
+    ('mg', 'malagasy', 'malagasy', 'mlg', ''),
+    ('ms', 'malay', 'bahasa melayu', 'msa may', ''),
+    ('ml', 'malayalam', 'മലയാളം', 'mal', ''),
+    ('mt', 'maltese', 'malti', 'mlt', ''),
+    ('mi', 'maori', 'māori', 'mri mao', ''),
+    ('mr', 'marathi', 'मराठी', 'mar', ''),
+    ('mni-Mtei', 'meiteilon', 'ꯃꯤꯇꯩꯂꯣꯟ', 'mni', 'manipuri'),
+    ('lus', 'mizo', 'mizo ṭawng', 'lus', ''),
+    ('mn', 'mongolian', 'монгол', 'mon', ''),
+    ('my', 'burmese', 'မြန်မာ', 'mya bur', 'myanmar'),
+    ('ne', 'nepali', 'नेपाली', 'nep', ''),
+    ('no', 'norwegian', 'norsk', 'nor nob nb', 'bokmal'),
+    ('or', 'odia', 'ଓଡ଼ିଆ', 'ori', 'oriya'),
+    ('om', 'oromo', 'afaan oromoo', 'orm', ''),
+    ('ps', 'pashto', 'پښتو', 'pus', 'pushto'),
+    ('fa', 'persian', 'فارسی', 'fas per', 'farsi'),
+    ('pl', 'polish', 'polski', 'pol', ''),
+    ('pt', 'portuguese', 'português', 'por', 'portugese, portugeese, brazilian portuguese'),
+    ('pa', 'punjabi', 'ਪੰਜਾਬੀ', 'pan', 'panjabi'),
+    ('qu', 'quechua', 'runasimi', 'que', ''),
+    ('ro', 'romanian', 'română', 'ron rum', 'moldovan'),
+    ('ru', 'russian', 'русский', 'rus', 'rushian, russion, ruski'),
+    ('sm', 'samoan', 'gagana samoa', 'smo', ''),
+    ('sa', 'sanskrit', 'संस्कृतम्', 'san', ''),
+    ('gd', 'scots gaelic', 'gàidhlig', 'gla', 'scottish gaelic, gaelic'),
+    ('nso', 'sepedi', 'sesotho sa leboa', 'nso', 'northern sotho'),
+    ('sr', 'serbian', 'српски', 'srp', ''),
+    ('st', 'sesotho', 'sesotho', 'sot', 'sotho'),
+    ('sn', 'shona', 'chishona', 'sna', ''),
+    ('sd', 'sindhi', 'سنڌي', 'snd', ''),
+    ('si', 'sinhala', 'සිංහල', 'sin', 'sinhalese'),
+    ('sk', 'slovak', 'slovenčina', 'slk slo', ''),
+    ('sl', 'slovenian', 'slovenščina', 'slv', 'slovene'),
+    ('so', 'somali', 'soomaali', 'som', ''),
+    ('es', 'spanish', 'español', 'spa', 'castilian, espanol, spannish, spanich'),
+    ('su', 'sundanese', 'basa sunda', 'sun', ''),
+    ('sw', 'swahili', 'kiswahili', 'swa', ''),
+    ('sv', 'swedish', 'svenska', 'swe', ''),
+    ('tg', 'tajik', 'тоҷикӣ', 'tgk', ''),
+    ('ta', 'tamil', 'தமிழ்', 'tam', ''),
+    ('tt', 'tatar', 'татар', 'tat', ''),
+    ('te', 'telugu', 'తెలుగు', 'tel', ''),
+    ('th', 'thai', 'ไทย', 'tha', ''),
+    ('ti', 'tigrinya', 'ትግርኛ', 'tir', ''),
+    ('ts', 'tsonga', 'xitsonga', 'tso', ''),
+    ('tr', 'turkish', 'türkçe', 'tur', ''),
+    ('tk', 'turkmen', 'türkmen', 'tuk', ''),
+    ('ak', 'twi', 'twi', 'twi aka', 'akan'),
+    ('uk', 'ukrainian', 'українська', 'ukr', ''),
+    ('ur', 'urdu', 'اردو', 'urd', ''),
+    ('ug', 'uyghur', 'ئۇيغۇرچە', 'uig', 'uighur'),
+    ('uz', 'uzbek', 'oʻzbek', 'uzb', ''),
+    ('vi', 'vietnamese', 'tiếng việt', 'vie', ''),
+    ('cy', 'welsh', 'cymraeg', 'cym wel', ''),
+    ('xh', 'xhosa', 'isixhosa', 'xho', ''),
+    ('yi', 'yiddish', 'ייִדיש', 'yid', ''),
+    ('yo', 'yoruba', 'yorùbá', 'yor', ''),
+    ('zu', 'zulu', 'isizulu', 'zul', ''),
+]
+
+
+def edit_distance(a, b, limit=None):
+    """Levenshtein distance; stops early (returning limit + 1) past ``limit``"""
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def bigrams(word):
+    """Padded character bigrams of a word, with counts"""
+    padded = f'^{word}$'
+    grams = {}
+    for i in range(len(padded) - 1):
+        gram = padded[i:i + 2]
+        grams[gram] = grams.get(gram, 0) + 1
+    return grams
+
+
+class NgramIndex:
+    """Bigram inverted index for bounded edit-distance search
+
+    One edit changes at most two padded bigrams, so a name within distance
+    k of the query shares at least max(len) + 1 - 2k bigrams with it. Only
+    names passing that count filter get a full edit-distance check.
+    """
+
+    def __init__(self, words=()):
+        self._words = []
+        self._postings = {}  # bigram -> [(word index, count)]
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        index = len(self._words)
+        self._words.append(word)
+        for gram, count in bigrams(word).items():
+            self._postings.setdefault(gram, []).append((index, count))
+
+    def search(self, word, max_distance):
+        """All (distance, word) within ``max_distance``, closest first"""
+        shared = {}
+        for gram, count in bigrams(word).items():
+            for index, other in self._postings.get(gram, ()):
+                shared[index] = shared.get(index, 0) + min(count, other)
+        found = []
+        for index, common in shared.items():
+            candidate = self._words[index]
+            if abs(len(candidate) - len(word)) > max_distance:
+                continue
+            if common < max(len(candidate), len(word)) + 1 - 2 * max_distance:
+                continue
+            distance = edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                found.append((distance, candidate))
+        return sorted(found)
+
+
+def max_typos(word):
+    """Edit distance tolerated for a word of this length"""
+    if len(word) <= 4:
+        return 0
+    if len(word) <= 7:
+        return 1
+    return 2
+
+
+class LanguageIndex:
+    """Language name/code lookups for command parsing and validation"""
+
+    def __init__(self, languages=_LANGUAGES):
+        self.codes = {}  # canonical code -> English name
+        self._exact = {}  # any lower-case name or code -> canonical code
+        self._phrases = {}  # names (never codes) that may appear in free text
+        for code, english, native, iso, aliases in languages:
+            self.codes[code] = english
+            names = [english, native] + [alias.strip() for alias in aliases.split(',') if alias.strip()]
+            for name in names:
+                self._phrases.setdefault(name.lower(), code)
+            for key in [code.lower()] + iso.split() + names:
+                self._exact.setdefault(key.lower(), code)
+        # Regional and legacy forms providers also accept
+        for alias, code in (('zh', 'zh-CN'), ('zh-hans', 'zh-CN'), ('zh-hant', 'zh-TW'),
+                            ('pt-br', 'pt'), ('pt-pt', 'pt'), ('en-us', 'en'), ('en-gb', 'en')):
+            self._exact.setdefault(alias, code)
+        self._index = NgramIndex(name for name in self._phrases if name.isascii() and ' ' not in name)
+
+    def code(self, name):
+        """Canonical code for an exact name or code, else None (O(1))"""
+        return self._exact.get(name.strip().lower())
+
+    def fuzzy(self, word, max_distance=None):
+        """(code, distance) of the closest name within the typo bound, else None"""
+        word = word.strip().lower()
+        if max_distance is None:
+            max_distance = max_typos(word)
+        if max_distance == 0:
+            return None
+        matches = self._index.search(word, max_distance)
+        if not matches:
+            return None
+        distance, name = matches[0]
+        return self._phrases[name], distance
+
+    def lookup(self, word):
+        """(code, distance): exact hit with distance 0, else fuzzy, else None"""
+        code = self.code(word)
+        if code is not None:
+            return code, 0
+        return self.fuzzy(word)
+
+    def phrase_names(self):
+        """Names (not codes) that may be matched inside free text"""
+        return dict(self._phrases)
+
+    def validate(self, code, allow_auto=False):
+        """Canonical code for ``code`` (or a name), or ValueError if unknown"""
+        if allow_auto and code == 'auto':
+            return code
+        resolved = self.code(code) if code else None
+        if resolved is None:
+            raise ValueError(f"Unknown language '{code}'")
+        return resolved
+
+    def name(self, code):
+        """English name for a canonical code"""
+        return self.codes.get(code, code)
+
+
+LANGUAGES = LanguageIndex()
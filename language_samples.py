@@ -0,0 +1,640 @@
+"""
+Training sentences for the local language identifier (language_id.py)
+
+Everyday and travel phrases of the kind the app translates, a couple of
+dozen per language. Codes match the language index ('zh-CN', ...).
+Held-out sentences for measuring accuracy live in test_language_id.py.
+
+OTHER_SAMPLES covers languages the identifier does not report but that
+are easily mistaken for one it does (Serbian for Russian, Galician for
+Spanish, ...). They are trained as extra classes so such text is
+recognised as "something else" and left to the provider.
+"""
+
+SAMPLES = {
+    'en': [
+        "Where is the nearest train station?",
+        "The train to Berlin is delayed by twenty minutes.",
+        "Could you please help me with my luggage?",
+        "I would like to book a table for two people tonight.",
+        "How much does this cost?",
+        "Thank you very much for your help.",
+        "The weather is beautiful today, let's go for a walk.",
+        "Please call a doctor, my friend is sick.",
+        "What time does the museum open tomorrow morning?",
+        "I don't understand what you are saying.",
+        "We are looking for a cheap hotel near the city centre.",
+        "Can I pay with a credit card?",
+        "The meeting has been moved to Thursday afternoon.",
+        "My phone battery is almost empty.",
+        "Excuse me, is this seat taken?",
+        "They have been waiting at the airport since early this morning.",
+        "Turn left at the next traffic light and then go straight ahead.",
+        "Good morning, how are you doing?",
+        "This is the best coffee I have ever had.",
+        "Would you like something to drink while you wait?",
+        "The children are playing in the garden with their dog.",
+        "I need to buy a ticket for the bus.",
+    ],
+    'es': [
+        "¿Dónde está la estación de tren más cercana?",
+        "El tren a Madrid tiene un retraso de veinte minutos.",
+        "¿Podría ayudarme con mi equipaje, por favor?",
+        "Me gustaría reservar una mesa para dos personas esta noche.",
+        "¿Cuánto cuesta esto?",
+        "Muchas gracias por su ayuda.",
+        "Hoy hace muy buen tiempo, vamos a dar un paseo.",
+        "Por favor, llame a un médico, mi amigo está enfermo.",
+        "¿A qué hora abre el museo mañana por la mañana?",
+        "No entiendo lo que usted dice.",
+        "Estamos buscando un hotel barato cerca del centro de la ciudad.",
+        "¿Puedo pagar con tarjeta de crédito?",
+        "La reunión se ha cambiado al jueves por la tarde.",
+        "La batería de mi teléfono está casi vacía.",
+        "Disculpe, ¿está ocupado este asiento?",
+        "Llevan esperando en el aeropuerto desde muy temprano.",
+        "Gire a la izquierda en el próximo semáforo y siga todo recto.",
+        "Buenos días, ¿cómo estás?",
+        "Este es el mejor café que he tomado nunca.",
+        "¿Quiere algo de beber mientras espera?",
+        "Los niños están jugando en el jardín con su perro.",
+        "Necesito comprar un billete para el autobús.",
+    ],
+    'fr': [
+        "Où se trouve la gare la plus proche ?",
+        "Le train pour Paris a vingt minutes de retard.",
+        "Pourriez-vous m'aider avec mes bagages, s'il vous plaît ?",
+        "Je voudrais réserver une table pour deux personnes ce soir.",
+        "Combien ça coûte ?",
+        "Merci beaucoup pour votre aide.",
+        "Il fait très beau aujourd'hui, allons nous promener.",
+        "Appelez un médecin, s'il vous plaît, mon ami est malade.",
+        "À quelle heure le musée ouvre-t-il demain matin ?",
+        "Je ne comprends pas ce que vous dites.",
+        "Nous cherchons un hôtel bon marché près du centre-ville.",
+        "Est-ce que je peux payer par carte bancaire ?",
+        "La réunion a été déplacée à jeudi après-midi.",
+        "La batterie de mon téléphone est presque vide.",
+        "Excusez-moi, cette place est-elle libre ?",
+        "Ils attendent à l'aéroport depuis tôt ce matin.",
+        "Tournez à gauche au prochain feu puis continuez tout droit.",
+        "Bonjour, comment allez-vous ?",
+        "C'est le meilleur café que j'aie jamais bu.",
+        "Voulez-vous quelque chose à boire en attendant ?",
+        "Les enfants jouent dans le jardin avec leur chien.",
+        "J'ai besoin d'acheter un billet de bus.",
+    ],
+    'de': [
+        "Wo ist der nächste Bahnhof?",
+        "Der Zug nach Berlin hat zwanzig Minuten Verspätung.",
+        "Könnten Sie mir bitte mit meinem Gepäck helfen?",
+        "Ich möchte heute Abend einen Tisch für zwei Personen reservieren.",
+        "Wie viel kostet das?",
+        "Vielen Dank für Ihre Hilfe.",
+        "Das Wetter ist heute schön, lass uns spazieren gehen.",
+        "Bitte rufen Sie einen Arzt, mein Freund ist krank.",
+        "Wann öffnet das Museum morgen früh?",
+        "Ich verstehe nicht, was Sie sagen.",
+        "Wir suchen ein günstiges Hotel in der Nähe der Innenstadt.",
+        "Kann ich mit Kreditkarte bezahlen?",
+        "Die Besprechung wurde auf Donnerstagnachmittag verschoben.",
+        "Der Akku meines Handys ist fast leer.",
+        "Entschuldigung, ist dieser Platz noch frei?",
+        "Sie warten schon seit dem frühen Morgen am Flughafen.",
+        "Biegen Sie an der nächsten Ampel links ab und gehen Sie dann geradeaus.",
+        "Guten Morgen, wie geht es dir?",
+        "Das ist der beste Kaffee, den ich je getrunken habe.",
+        "Möchten Sie etwas trinken, während Sie warten?",
+        "Die Kinder spielen mit ihrem Hund im Garten.",
+        "Ich muss eine Fahrkarte für den Bus kaufen.",
+    ],
+    'it': [
+        "Dov'è la stazione ferroviaria più vicina?",
+        "Il treno per Roma ha venti minuti di ritardo.",
+        "Potrebbe aiutarmi con i miei bagagli, per favore?",
+        "Vorrei prenotare un tavolo per due persone stasera.",
+        "Quanto costa questo?",
+        "Grazie mille per il suo aiuto.",
+        "Oggi il tempo è bellissimo, andiamo a fare una passeggiata.",
+        "Per favore, chiami un medico, il mio amico sta male.",
+        "A che ora apre il museo domani mattina?",
+        "Non capisco quello che sta dicendo.",
+        "Stiamo cercando un albergo economico vicino al centro della città.",
+        "Posso pagare con la carta di credito?",
+        "La riunione è stata spostata a giovedì pomeriggio.",
+        "La batteria del mio telefono è quasi scarica.",
+        "Mi scusi, questo posto è occupato?",
+        "Aspettano all'aeroporto da stamattina presto.",
+        "Giri a sinistra al prossimo semaforo e poi vada sempre dritto.",
+        "Buongiorno, come stai?",
+        "Questo è il caffè più buono che abbia mai bevuto.",
+        "Vuole qualcosa da bere mentre aspetta?",
+        "I bambini giocano in giardino con il loro cane.",
+        "Devo comprare un biglietto per l'autobus.",
+    ],
+    'pt': [
+        "Onde fica a estação de comboio mais próxima?",
+        "O trem para São Paulo está atrasado vinte minutos.",
+        "Você poderia me ajudar com a minha bagagem, por favor?",
+        "Eu gostaria de reservar uma mesa para duas pessoas hoje à noite.",
+        "Quanto custa isto?",
+        "Muito obrigado pela sua ajuda.",
+        "O tempo está lindo hoje, vamos dar um passeio.",
+        "Por favor, chame um médico, o meu amigo está doente.",
+        "A que horas abre o museu amanhã de manhã?",
+        "Não entendo o que você está dizendo.",
+        "Estamos procurando um hotel barato perto do centro da cidade.",
+        "Posso pagar com cartão de crédito?",
+        "A reunião foi transferida para quinta-feira à tarde.",
+        "A bateria do meu telemóvel está quase sem carga.",
+        "Com licença, este lugar está ocupado?",
+        "Eles estão esperando no aeroporto desde cedo.",
+        "Vire à esquerda no próximo semáforo e depois siga em frente.",
+        "Bom dia, como você está?",
+        "Este é o melhor café que já tomei.",
+        "Quer alguma coisa para beber enquanto espera?",
+        "As crianças estão brincando no jardim com o cachorro.",
+        "Preciso comprar uma passagem de ônibus.",
+    ],
+    'nl': [
+        "Waar is het dichtstbijzijnde treinstation?",
+        "De trein naar Amsterdam heeft twintig minuten vertraging.",
+        "Kunt u mij alstublieft helpen met mijn bagage?",
+        "Ik wil graag vanavond een tafel voor twee personen reserveren.",
+        "Hoeveel kost dit?",
+        "Heel erg bedankt voor uw hulp.",
+        "Het is vandaag prachtig weer, laten we gaan wandelen.",
+        "Bel alstublieft een dokter, mijn vriend is ziek.",
+        "Hoe laat gaat het museum morgenochtend open?",
+        "Ik begrijp niet wat u zegt.",
+        "We zoeken een goedkoop hotel in de buurt van het centrum.",
+        "Kan ik met een creditcard betalen?",
+        "De vergadering is verplaatst naar donderdagmiddag.",
+        "De batterij van mijn telefoon is bijna leeg.",
+        "Pardon, is deze plaats bezet?",
+        "Ze wachten al sinds vanochtend vroeg op het vliegveld.",
+        "Sla bij het volgende stoplicht linksaf en ga dan rechtdoor.",
+        "Goedemorgen, hoe gaat het met je?",
+        "Dit is de lekkerste koffie die ik ooit heb gedronken.",
+        "Wilt u iets drinken terwijl u wacht?",
+        "De kinderen spelen met hun hond in de tuin.",
+        "Ik moet een kaartje voor de bus kopen.",
+    ],
+    'pl': [
+        "Gdzie jest najbliższa stacja kolejowa?",
+        "Pociąg do Warszawy ma dwadzieścia minut opóźnienia.",
+        "Czy mógłby pan pomóc mi z bagażem?",
+        "Chciałbym zarezerwować stolik dla dwóch osób na dzisiaj wieczorem.",
+        "Ile to kosztuje?",
+        "Bardzo dziękuję za pomoc.",
+        "Dzisiaj jest piękna pogoda, chodźmy na spacer.",
+        "Proszę wezwać lekarza, mój przyjaciel jest chory.",
+        "O której godzinie jutro rano otwierają muzeum?",
+        "Nie rozumiem, co pan mówi.",
+        "Szukamy taniego hotelu blisko centrum miasta.",
+        "Czy mogę zapłacić kartą kredytową?",
+        "Spotkanie zostało przeniesione na czwartek po południu.",
+        "Bateria w moim telefonie jest prawie pusta.",
+        "Przepraszam, czy to miejsce jest wolne?",
+        "Czekają na lotnisku od wczesnego rana.",
+        "Na następnych światłach proszę skręcić w lewo i jechać prosto.",
+        "Dzień dobry, jak się masz?",
+        "To najlepsza kawa, jaką kiedykolwiek piłem.",
+        "Czy chce pan coś do picia, zanim pan poczeka?",
+        "Dzieci bawią się w ogrodzie ze swoim psem.",
+        "Muszę kupić bilet na autobus.",
+    ],
+    'tr': [
+        "En yakın tren istasyonu nerede?",
+        "Ankara treni yirmi dakika gecikmeli.",
+        "Bavulumla bana yardım edebilir misiniz lütfen?",
+        "Bu akşam iki kişilik bir masa ayırtmak istiyorum.",
+        "Bu ne kadar?",
+        "Yardımınız için çok teşekkür ederim.",
+        "Bugün hava çok güzel, hadi yürüyüşe çıkalım.",
+        "Lütfen bir doktor çağırın, arkadaşım hasta.",
+        "Müze yarın sabah saat kaçta açılıyor?",
+        "Ne dediğinizi anlamıyorum.",
+        "Şehir merkezine yakın ucuz bir otel arıyoruz.",
+        "Kredi kartıyla ödeyebilir miyim?",
+        "Toplantı perşembe öğleden sonraya ertelendi.",
+        "Telefonumun şarjı neredeyse bitti.",
+        "Affedersiniz, bu koltuk boş mu?",
+        "Sabahın erken saatlerinden beri havalimanında bekliyorlar.",
+        "Bir sonraki trafik ışığından sola dönün ve sonra düz gidin.",
+        "Günaydın, nasılsın?",
+        "Bu şimdiye kadar içtiğim en iyi kahve.",
+        "Beklerken bir şey içmek ister misiniz?",
+        "Çocuklar köpekleriyle bahçede oynuyorlar.",
+        "Otobüs için bir bilet almam gerekiyor.",
+    ],
+    'ru': [
+        "Где находится ближайший вокзал?",
+        "Поезд в Москву опаздывает на двадцать минут.",
+        "Не могли бы вы помочь мне с багажом?",
+        "Я хотел бы заказать столик на двоих сегодня вечером.",
+        "Сколько это стоит?",
+        "Большое спасибо за вашу помощь.",
+        "Сегодня прекрасная погода, давайте пойдём погуляем.",
+        "Пожалуйста, вызовите врача, мой друг заболел.",
+        "Во сколько завтра утром открывается музей?",
+        "Я не понимаю, что вы говорите.",
+        "Мы ищем недорогую гостиницу рядом с центром города.",
+        "Можно ли расплатиться кредитной картой?",
+        "Совещание перенесли на четверг после обеда.",
+        "У моего телефона почти села батарея.",
+        "Извините, это место свободно?",
+        "Они ждут в аэропорту с раннего утра.",
+        "На следующем светофоре поверните налево, а потом идите прямо.",
+        "Доброе утро, как дела?",
+        "Это самый вкусный кофе, который я когда-либо пил.",
+        "Хотите что-нибудь выпить, пока ждёте?",
+        "Дети играют в саду со своей собакой.",
+        "Мне нужно купить билет на автобус.",
+    ],
+    'uk': [
+        "Де знаходиться найближчий вокзал?",
+        "Потяг до Києва запізнюється на двадцять хвилин.",
+        "Чи не могли б ви допомогти мені з багажем?",
+        "Я хотів би замовити столик на двох сьогодні ввечері.",
+        "Скільки це коштує?",
+        "Щиро дякую за вашу допомогу.",
+        "Сьогодні чудова погода, ходімо погуляємо.",
+        "Будь ласка, викличте лікаря, мій друг захворів.",
+        "О котрій завтра зранку відкривається музей?",
+        "Я не розумію, що ви кажете.",
+        "Ми шукаємо недорогий готель біля центру міста.",
+        "Чи можна розрахуватися кредитною карткою?",
+        "Нараду перенесли на четвер після обіду.",
+        "У мого телефону майже розрядилася батарея.",
+        "Вибачте, це місце вільне?",
+        "Вони чекають в аеропорту з самого ранку.",
+        "На наступному світлофорі поверніть ліворуч, а потім ідіть прямо.",
+        "Доброго ранку, як справи?",
+        "Це найсмачніша кава, яку я коли-небудь пив.",
+        "Хочете щось випити, поки чекаєте?",
+        "Діти граються в саду зі своїм собакою.",
+        "Мені потрібно купити квиток на автобус.",
+    ],
+    'ar': [
+        "أين تقع أقرب محطة قطار؟",
+        "القطار المتجه إلى القاهرة متأخر عشرين دقيقة.",
+        "هل يمكنك مساعدتي في حمل أمتعتي من فضلك؟",
+        "أود حجز طاولة لشخصين هذا المساء.",
+        "كم سعر هذا؟",
+        "شكرا جزيلا على مساعدتك.",
+        "الطقس جميل اليوم، لنذهب في نزهة.",
+        "من فضلك اتصل بطبيب، صديقي مريض.",
+        "متى يفتح المتحف صباح الغد؟",
+        "لا أفهم ما تقوله.",
+        "نبحث عن فندق رخيص بالقرب من وسط المدينة.",
+        "هل يمكنني الدفع ببطاقة الائتمان؟",
+    ],
+    'hi': [
+        "सबसे नज़दीकी रेलवे स्टेशन कहाँ है?",
+        "दिल्ली जाने वाली ट्रेन बीस मिनट देर से चल रही है।",
+        "क्या आप मेरा सामान उठाने में मदद कर सकते हैं?",
+        "मैं आज रात दो लोगों के लिए एक मेज़ बुक करना चाहता हूँ।",
+        "इसकी कीमत कितनी है?",
+        "आपकी मदद के लिए बहुत धन्यवाद।",
+        "आज मौसम बहुत अच्छा है, चलो टहलने चलते हैं।",
+        "कृपया डॉक्टर को बुलाइए, मेरा दोस्त बीमार है।",
+        "कल सुबह संग्रहालय कितने बजे खुलता है?",
+        "मुझे समझ नहीं आ रहा कि आप क्या कह रहे हैं।",
+        "हम शहर के बीच में एक सस्ता होटल ढूँढ रहे हैं।",
+        "क्या मैं क्रेडिट कार्ड से भुगतान कर सकता हूँ?",
+    ],
+    'ja': [
+        "一番近い駅はどこですか？",
+        "東京行きの電車は二十分遅れています。",
+        "荷物を運ぶのを手伝っていただけますか？",
+        "今夜二人で予約をお願いしたいのですが。",
+        "これはいくらですか？",
+        "手伝ってくれて本当にありがとうございます。",
+        "今日はいい天気なので、散歩に行きましょう。",
+        "医者を呼んでください、友達が病気です。",
+        "博物館は明日の朝何時に開きますか？",
+        "おっしゃっていることがわかりません。",
+        "町の中心の近くで安いホテルを探しています。",
+        "クレジットカードで払えますか？",
+    ],
+    'ko': [
+        "가장 가까운 기차역이 어디에 있어요?",
+        "서울행 기차가 이십 분 늦어지고 있습니다.",
+        "짐 드는 것 좀 도와주실 수 있나요?",
+        "오늘 저녁에 두 명 자리를 예약하고 싶어요.",
+        "이거 얼마예요?",
+        "도와주셔서 정말 감사합니다.",
+        "오늘 날씨가 정말 좋네요, 산책하러 가요.",
+        "의사를 불러 주세요, 제 친구가 아파요.",
+        "박물관은 내일 아침 몇 시에 열어요?",
+        "무슨 말씀인지 잘 모르겠어요.",
+        "시내 중심 근처에 싼 호텔을 찾고 있어요.",
+        "신용카드로 계산해도 되나요?",
+    ],
+    'zh-CN': [
+        "最近的火车站在哪里？",
+        "开往北京的火车晚点二十分钟。",
+        "你能帮我拿一下行李吗？",
+        "我想预订今晚两个人的桌子。",
+        "这个多少钱？",
+        "非常感谢你的帮助。",
+        "今天天气很好，我们去散步吧。",
+        "请叫医生，我的朋友生病了。",
+        "博物馆明天早上几点开门？",
+        "我听不懂你在说什么。",
+        "我们在找市中心附近便宜的酒店。",
+        "我可以用信用卡付款吗？",
+    ],
+}
+
+OTHER_SAMPLES = {
+    'sr': [
+        "Где је најближа железничка станица?",
+        "Воз за Београд касни двадесет минута.",
+        "Можете ли ми помоћи са пртљагом?",
+        "Желео бих да резервишем сто за двоје вечерас.",
+        "Колико ово кошта?",
+        "Хвала вам пуно на помоћи.",
+        "Време је данас лепо, хајде да прошетамо.",
+        "Молим вас, позовите лекара, мој пријатељ је болестан.",
+        "У колико сати се музеј отвара сутра ујутру?",
+        "Не разумем шта говорите.",
+        "Тражимо јефтин хотел близу центра града.",
+        "Могу ли да платим кредитном картицом?",
+        "Састанак је померен за четвртак поподне.",
+        "Батерија мог телефона је скоро празна.",
+        "Извините, да ли је ово место заузето?",
+        "Они чекају на аеродрому од раног јутра.",
+        "Скрените лево на следећем семафору и онда идите право.",
+        "Добро јутро, како сте?",
+        "Ово је најбоља кафа коју сам икада пио.",
+        "Да ли бисте желели нешто да попијете док чекате?",
+        "Деца се играју у башти са својим псом.",
+        "Морам да купим карту за аутобус.",
+    ],
+    'bg': [
+        "Къде е най-близката жп гара?",
+        "Влакът за София закъснява с двадесет минути.",
+        "Бихте ли ми помогнали с багажа?",
+        "Бих искал да резервирам маса за двама тази вечер.",
+        "Колко струва това?",
+        "Благодаря ви много за помощта.",
+        "Времето днес е чудесно, хайде да се разходим.",
+        "Моля, извикайте лекар, приятелят ми е болен.",
+        "В колко часа отваря музеят утре сутрин?",
+        "Не разбирам какво казвате.",
+        "Търсим евтин хотел близо до центъра на града.",
+        "Мога ли да платя с кредитна карта?",
+        "Срещата беше преместена за четвъртък следобед.",
+        "Батерията на телефона ми е почти изтощена.",
+        "Извинете, това място заето ли е?",
+        "Те чакат на летището от рано сутринта.",
+        "Завийте наляво на следващия светофар и после продължете направо.",
+        "Добро утро, как сте?",
+        "Това е най-хубавото кафе, което някога съм пил.",
+        "Искате ли нещо за пиене, докато чакате?",
+        "Децата играят в градината с кучето си.",
+        "Трябва да си купя билет за автобуса.",
+    ],
+    'be': [
+        "Дзе знаходзіцца бліжэйшая чыгуначная станцыя?",
+        "Цягнік да Мінска спазняецца на дваццаць хвілін.",
+        "Ці не маглі б вы дапамагчы мне з багажом?",
+        "Я хацеў бы забраніраваць столік на дваіх на сёння вечарам.",
+        "Колькі гэта каштуе?",
+        "Вялікі дзякуй за вашу дапамогу.",
+        "Сёння выдатнае надвор'е, хадзем пагуляем.",
+        "Калі ласка, выклічце лекара, мой сябар захварэў.",
+        "А якой гадзіне заўтра раніцай адкрываецца музей?",
+        "Я не разумею, што вы кажаце.",
+        "Мы шукаем танную гасцініцу каля цэнтра горада.",
+        "Ці магу я заплаціць крэдытнай картай?",
+        "Сустрэчу перанеслі на чацвер пасля абеду.",
+        "Батарэя майго тэлефона амаль разраджаная.",
+        "Прабачце, гэтае месца занятае?",
+        "Яны чакаюць у аэрапорце з самай раніцы.",
+        "На наступным святлафоры павярніце налева, а потым ідзіце прама.",
+        "Добрай раніцы, як справы?",
+        "Гэта найлепшая кава, якую я калі-небудзь піў.",
+        "Ці не хочаце чаго-небудзь выпіць, пакуль чакаеце?",
+        "Дзеці гуляюць у садзе са сваім сабакам.",
+        "Мне трэба купіць квіток на аўтобус.",
+    ],
+    'gl': [
+        "Onde está a estación de tren máis próxima?",
+        "O tren a Santiago ten un atraso de vinte minutos.",
+        "Podería axudarme coa equipaxe, por favor?",
+        "Gustaríame reservar unha mesa para dúas persoas esta noite.",
+        "Canto custa isto?",
+        "Moitas grazas pola súa axuda.",
+        "Hoxe fai moi bo tempo, imos dar un paseo.",
+        "Por favor, chame a un médico, o meu amigo está enfermo.",
+        "A que hora abre o museo mañá pola mañá?",
+        "Non entendo o que di.",
+        "Estamos a buscar un hotel barato preto do centro da cidade.",
+        "Podo pagar con tarxeta de crédito?",
+        "A reunión cambiouse para o xoves pola tarde.",
+        "A batería do meu teléfono está case baleira.",
+        "Desculpe, este asento está ocupado?",
+        "Levan esperando no aeroporto desde primeira hora da mañá.",
+        "Xire á esquerda no seguinte semáforo e despois siga recto.",
+        "Bos días, que tal está?",
+        "Este é o mellor café que tomei nunca.",
+        "Quere algo de beber mentres agarda?",
+        "Os nenos están a xogar no xardín co seu can.",
+        "Teño que mercar un billete para o autobús.",
+    ],
+    'ca': [
+        "On és l'estació de tren més propera?",
+        "El tren a Barcelona porta vint minuts de retard.",
+        "Em podria ajudar amb l'equipatge, si us plau?",
+        "M'agradaria reservar una taula per a dues persones aquesta nit.",
+        "Quant costa això?",
+        "Moltes gràcies per la seva ajuda.",
+        "Avui fa molt bon temps, anem a fer una passejada.",
+        "Si us plau, truqui un metge, el meu amic està malalt.",
+        "A quina hora obre el museu demà al matí?",
+        "No entenc el que diu.",
+        "Busquem un hotel barat a prop del centre de la ciutat.",
+        "Puc pagar amb targeta de crèdit?",
+        "La reunió s'ha canviat a dijous a la tarda.",
+        "La bateria del meu telèfon està gairebé buida.",
+        "Perdoni, aquest seient està ocupat?",
+        "Fa des de primera hora del matí que esperen a l'aeroport.",
+        "Giri a l'esquerra al proper semàfor i després continuï recte.",
+        "Bon dia, com està?",
+        "Aquest és el millor cafè que he pres mai.",
+        "Vol alguna cosa per beure mentre espera?",
+        "Els nens juguen al jardí amb el seu gos.",
+        "Necessito comprar un bitllet per a l'autobús.",
+    ],
+    'da': [
+        "Hvor er den nærmeste togstation?",
+        "Toget til København er tyve minutter forsinket.",
+        "Kan du hjælpe mig med min bagage?",
+        "Jeg vil gerne bestille et bord til to personer i aften.",
+        "Hvad koster det her?",
+        "Mange tak for din hjælp.",
+        "Vejret er dejligt i dag, lad os gå en tur.",
+        "Ring venligst efter en læge, min ven er syg.",
+        "Hvornår åbner museet i morgen tidlig?",
+        "Jeg forstår ikke, hvad du siger.",
+        "Vi leder efter et billigt hotel tæt på centrum.",
+        "Kan jeg betale med kreditkort?",
+        "Mødet er blevet flyttet til torsdag eftermiddag.",
+        "Batteriet på min telefon er næsten fladt.",
+        "Undskyld, er denne plads optaget?",
+        "De har ventet i lufthavnen siden tidligt i morges.",
+        "Drej til venstre ved næste lyskryds og gå så ligeud.",
+        "Godmorgen, hvordan har du det?",
+        "Det er den bedste kaffe, jeg nogensinde har fået.",
+        "Vil du have noget at drikke, mens du venter?",
+        "Børnene leger i haven med deres hund.",
+        "Jeg skal købe en billet til bussen.",
+    ],
+    'sv': [
+        "Var ligger närmaste tågstation?",
+        "Tåget till Stockholm är försenat med tjugo minuter.",
+        "Kan du hjälpa mig med mitt bagage?",
+        "Jag skulle vilja boka ett bord för två personer i kväll.",
+        "Hur mycket kostar det här?",
+        "Tack så mycket för din hjälp.",
+        "Vädret är underbart i dag, vi går en promenad.",
+        "Ring efter en läkare, min vän är sjuk.",
+        "När öppnar museet i morgon bitti?",
+        "Jag förstår inte vad du säger.",
+        "Vi letar efter ett billigt hotell nära centrum.",
+        "Kan jag betala med kreditkort?",
+        "Mötet har flyttats till torsdag eftermiddag.",
+        "Batteriet i min telefon är nästan slut.",
+        "Ursäkta, är den här platsen upptagen?",
+        "De har väntat på flygplatsen sedan tidigt i morse.",
+        "Sväng vänster vid nästa trafikljus och gå sedan rakt fram.",
+        "God morgon, hur mår du?",
+        "Det här är det godaste kaffe jag någonsin har druckit.",
+        "Vill du ha något att dricka medan du väntar?",
+        "Barnen leker i trädgården med sin hund.",
+        "Jag behöver köpa en biljett till bussen.",
+    ],
+    'no': [
+        "Hvor er nærmeste togstasjon?",
+        "Toget til Oslo er tjue minutter forsinket.",
+        "Kan du hjelpe meg med bagasjen?",
+        "Jeg vil gjerne bestille et bord til to personer i kveld.",
+        "Hva koster dette?",
+        "Tusen takk for hjelpen.",
+        "Været er nydelig i dag, la oss gå en tur.",
+        "Vær så snill å ringe en lege, vennen min er syk.",
+        "Når åpner museet i morgen tidlig?",
+        "Jeg forstår ikke hva du sier.",
+        "Vi ser etter et billig hotell i nærheten av sentrum.",
+        "Kan jeg betale med kredittkort?",
+        "Møtet er flyttet til torsdag ettermiddag.",
+        "Batteriet på telefonen min er nesten tomt.",
+        "Unnskyld, er dette setet opptatt?",
+        "De har ventet på flyplassen siden tidlig i morges.",
+        "Ta til venstre ved neste lyskryss og gå så rett frem.",
+        "God morgen, hvordan har du det?",
+        "Dette er den beste kaffen jeg noen gang har smakt.",
+        "Vil du ha noe å drikke mens du venter?",
+        "Barna leker i hagen med hunden sin.",
+        "Jeg må kjøpe en billett til bussen.",
+    ],
+    'af': [
+        "Waar is die naaste treinstasie?",
+        "Die trein na Kaapstad is twintig minute laat.",
+        "Kan jy my asseblief met my bagasie help?",
+        "Ek wil graag 'n tafel vir twee mense vanaand bespreek.",
+        "Hoeveel kos dit?",
+        "Baie dankie vir jou hulp.",
+        "Die weer is pragtig vandag, kom ons gaan stap.",
+        "Bel asseblief 'n dokter, my vriend is siek.",
+        "Hoe laat gaan die museum môreoggend oop?",
+        "Ek verstaan nie wat jy sê nie.",
+        "Ons soek 'n goedkoop hotel naby die middestad.",
+        "Kan ek met 'n kredietkaart betaal?",
+        "Die vergadering is na Donderdagmiddag geskuif.",
+        "My foon se battery is amper pap.",
+        "Verskoon my, is hierdie sitplek beset?",
+        "Hulle wag al sedert vanoggend vroeg by die lughawe.",
+        "Draai links by die volgende verkeerslig en gaan dan reguit aan.",
+        "Goeiemôre, hoe gaan dit met jou?",
+        "Dit is die beste koffie wat ek nog ooit gedrink het.",
+        "Wil jy iets drink terwyl jy wag?",
+        "Die kinders speel saam met hulle hond in die tuin.",
+        "Ek moet 'n kaartjie vir die bus koop.",
+    ],
+    'ro': [
+        "Unde este cea mai apropiată gară?",
+        "Trenul spre București are o întârziere de douăzeci de minute.",
+        "Mă puteți ajuta cu bagajele, vă rog?",
+        "Aș dori să rezerv o masă pentru două persoane în seara asta.",
+        "Cât costă asta?",
+        "Vă mulțumesc foarte mult pentru ajutor.",
+        "Vremea este frumoasă astăzi, hai să facem o plimbare.",
+        "Vă rog să chemați un medic, prietenul meu este bolnav.",
+        "La ce oră se deschide muzeul mâine dimineață?",
+        "Nu înțeleg ce spuneți.",
+        "Căutăm un hotel ieftin aproape de centrul orașului.",
+        "Pot să plătesc cu cardul de credit?",
+        "Ședința a fost mutată joi după-amiază.",
+        "Bateria telefonului meu este aproape descărcată.",
+        "Scuzați-mă, este ocupat acest loc?",
+        "Ei așteaptă la aeroport de dimineață devreme.",
+        "Virați la stânga la următorul semafor și apoi mergeți drept înainte.",
+        "Bună dimineața, ce mai faceți?",
+        "Aceasta este cea mai bună cafea pe care am băut-o vreodată.",
+        "Doriți ceva de băut cât așteptați?",
+        "Copiii se joacă în grădină cu câinele lor.",
+        "Trebuie să cumpăr un bilet de autobuz.",
+    ],
+    'id': [
+        "Di mana stasiun kereta terdekat?",
+        "Kereta ke Jakarta terlambat dua puluh menit.",
+        "Bisakah Anda membantu saya dengan barang bawaan saya?",
+        "Saya ingin memesan meja untuk dua orang malam ini.",
+        "Berapa harganya ini?",
+        "Terima kasih banyak atas bantuan Anda.",
+        "Cuacanya indah hari ini, ayo kita jalan-jalan.",
+        "Tolong panggilkan dokter, teman saya sakit.",
+        "Jam berapa museum buka besok pagi?",
+        "Saya tidak mengerti apa yang Anda katakan.",
+        "Kami sedang mencari hotel murah di dekat pusat kota.",
+        "Bisakah saya membayar dengan kartu kredit?",
+        "Rapatnya dipindahkan ke hari Kamis sore.",
+        "Baterai ponsel saya hampir habis.",
+        "Permisi, apakah kursi ini sudah ada yang menempati?",
+        "Mereka sudah menunggu di bandara sejak pagi tadi.",
+        "Belok kiri di lampu lalu lintas berikutnya lalu jalan lurus.",
+        "Selamat pagi, apa kabar?",
+        "Ini kopi terenak yang pernah saya minum.",
+        "Apakah Anda mau minum sesuatu sambil menunggu?",
+        "Anak-anak sedang bermain di kebun dengan anjing mereka.",
+        "Saya perlu membeli tiket bus.",
+    ],
+    'ms': [
+        "Di manakah stesen kereta api yang terdekat?",
+        "Kereta api ke Kuala Lumpur lewat dua puluh minit.",
+        "Bolehkah anda tolong saya dengan bagasi saya?",
+        "Saya ingin menempah meja untuk dua orang malam ini.",
+        "Berapakah harga ini?",
+        "Terima kasih banyak atas bantuan anda.",
+        "Cuaca sangat baik hari ini, mari kita bersiar-siar.",
+        "Tolong panggil doktor, kawan saya sakit.",
+        "Pukul berapa muzium dibuka esok pagi?",
+        "Saya tidak faham apa yang anda katakan.",
+        "Kami sedang mencari hotel murah berhampiran pusat bandar.",
+        "Bolehkah saya membayar dengan kad kredit?",
+        "Mesyuarat telah dipindahkan ke petang hari Khamis.",
+        "Bateri telefon saya hampir habis.",
+        "Maafkan saya, adakah tempat duduk ini sudah berpenghuni?",
+        "Mereka telah menunggu di lapangan terbang sejak awal pagi tadi.",
+        "Belok kiri di lampu isyarat seterusnya dan kemudian jalan terus.",
+        "Selamat pagi, apa khabar?",
+        "Ini kopi paling sedap yang pernah saya minum.",
+        "Adakah anda mahu minum sesuatu sementara menunggu?",
+        "Kanak-kanak sedang bermain di taman dengan anjing mereka.",
+        "Saya perlu membeli tiket bas.",
+    ],
+}
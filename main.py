@@ -41,6 +41,14 @@ try:
     from database import Database
     from voice_processor import VoiceProcessor
     from translator import TranslationService
+    from translation_engine import AsyncTranslationEngine
+    from translation_outbox import should_queue
+    from speculative_translation import SpeculativeTranslation
+    from text_segmenter import segment_text, join_segments
+    from language_index import LANGUAGES
+    from asr_backends import STAGES
+    from speech_worker import SpeechWorker, SpeechPipeline, TTS_AVAILABLE
+    from speech_cache import SpeechCache, WavePlayer, output_available
 except ImportError as e:
     print_error_message(
         "Failed to import application modules",
@@ -50,12 +58,6 @@ except ImportError as e:
     )
     sys.exit(1)
 
-try:
-    import pyttsx3
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
-
 class MainScreen(Screen):
     # Predefined command list for the dropdown
     PREDEFINED_COMMANDS = [
@@ -89,6 +91,30 @@ class MainScreen(Screen):
         """Update status display"""
         active_model = self.app.db.get_active_model()
         self.ids.active_model_label.text = f'Active Model: {active_model if active_model else "None"}'
+        self.update_routing()
+        self.update_outbox()
+    
+    def update_routing(self, dt=None):
+        """Show each translation provider's latency, error rate and circuit state
+        
+        Called when the router reports a change; while a circuit is open
+        the retry countdown is refreshed once a second.
+        """
+        routing = self.app.translator.router.describe()
+        self.ids.routing_label.text = f'Routing: {routing}' if routing else 'Routing: no requests yet'
+        Clock.unschedule(self.update_routing)
+        if ' open (' in routing:
+            Clock.schedule_once(self.update_routing, 1)
+    
+    def update_outbox(self, dt=None):
+        """Show translations queued while offline"""
+        pending = self.app.translator.outbox.pending()
+        if not pending:
+            self.ids.outbox_label.text = 'Outbox: nothing pending'
+            return
+        preview = ', '.join(f'"{entry.text[:30]}"' for entry in pending[:3])
+        more = f' and {len(pending) - 3} more' if len(pending) > 3 else ''
+        self.ids.outbox_label.text = f'Outbox: {len(pending)} pending ({preview}{more}) - retrying when online'
     
     def on_command_selected(self, command_text):
         """Handle command selection from spinner"""
@@ -147,17 +173,18 @@ class MainScreen(Screen):
         # Keep command in field for reference, but user can clear it manually if needed
         
         # Process the command
-        command_lower = command.lower()
-        
-        if 'translate' in command_lower:
+        if self.app.translator.parse_command(command).action == 'translate':
             self.handle_text_translate_command(command)
         else:
             self.add_log('Unknown command. Try: "translate from russian to english"')
     
     def handle_text_translate_command(self, command):
         """Handle text-based translation command"""
-        source_lang, target_lang = self.app.translator.parse_translate_command(command)
-        self.add_log(f'Translation from {source_lang} to {target_lang} requested')
+        source_lang, target_langs = self.app.translator.parse_translate_command(command, all_targets=True)
+        if not target_langs:
+            self.add_log(f'Translate {source_lang} into which language? Try: "translate from {source_lang} to german"')
+            return
+        self.add_log(f'Translation from {source_lang} to {", ".join(target_langs)} requested')
         
         # Get the text to translate from the text input field
         text_to_translate = self.ids.text_input_field.text.strip()
@@ -167,7 +194,10 @@ class MainScreen(Screen):
             return
         
         self.ids.text_input_field.text = ''  # Clear input
-        self.app.do_translate(text_to_translate, target_lang, source_lang)
+        if len(target_langs) > 1:
+            self.app.do_translate_targets(text_to_translate, target_langs, source_lang)
+        else:
+            self.app.do_translate_long(text_to_translate, target_langs[0], source_lang)
     
     def add_log(self, message):
         """Add message to log"""
@@ -333,14 +363,36 @@ class SettingsScreen(Screen):
         """Load settings from database"""
         self.ids.trigger_phrase.text = self.app.db.get_setting('trigger_phrase')
         self.ids.translation_api.text = self.app.db.get_setting('translation_api')
+        self.ids.deepl_api_key.text = self.app.db.get_setting('deepl_api_key') or ''
+        self.ids.secondary_target_language.text = self.app.db.get_setting('secondary_target_language') or ''
         voice_answer = self.app.db.get_setting('voice_answer')
         self.ids.voice_answer.active = voice_answer == 'true'
+        self.ids.translation_hedging.active = self.app.db.get_setting('translation_hedging') == 'true'
+        fired = self.app.db.get_stat('hedge_fired')
+        if fired:
+            won = self.app.db.get_stat('hedge_won')
+            self.ids.hedge_label.text = f'⚡ Hedge Slow Translations ({fired} fired, {won} won)'
+        for stage in STAGES:
+            self.ids[f'asr_{stage}'].text = self.app.db.get_setting(f'asr_{stage}') or 'google'
     
     def save_settings(self):
         """Save settings to database"""
+        secondary = self.ids.secondary_target_language.text.strip()
+        if secondary:
+            try:
+                secondary = LANGUAGES.validate(secondary)
+            except ValueError as e:
+                self.show_popup('Error', str(e))
+                return
         self.app.db.set_setting('trigger_phrase', self.ids.trigger_phrase.text)
         self.app.db.set_setting('translation_api', self.ids.translation_api.text)
+        self.app.db.set_setting('deepl_api_key', self.ids.deepl_api_key.text.strip())
+        self.app.db.set_setting('secondary_target_language', secondary)
         self.app.db.set_setting('voice_answer', 'true' if self.ids.voice_answer.active else 'false')
+        self.app.db.set_setting('translation_hedging',
+                                'true' if self.ids.translation_hedging.active else 'false')
+        for stage in STAGES:
+            self.app.db.set_setting(f'asr_{stage}', self.ids[f'asr_{stage}'].text)
         
         self.show_popup('Success', 'Settings saved successfully!')
     
@@ -365,6 +417,13 @@ class VoiceHelperApp(App):
         self.db = Database()
         self.voice_processor = VoiceProcessor()
         self.translator = TranslationService()
+        self.translation_engine = AsyncTranslationEngine(self.translator)
+        cache = player = None
+        if self.db.get_setting('speech_cache') == 'true' and output_available():
+            cache, player = SpeechCache(), WavePlayer()
+        self.speech = SpeechWorker(on_start=self.on_speech_start, on_end=self.on_speech_end,
+                                   cache=cache, player=player)
+        self.speech_pipeline = None
         
         # Set up voice callbacks
         self.voice_processor.on_trigger_detected = self.on_trigger_detected
@@ -386,10 +445,62 @@ class VoiceHelperApp(App):
         self.settings_screen.app = self
         sm.add_widget(self.settings_screen)
         
+        # Background events update the screens, so only start them now
+        self.translator.outbox.on_result = self.on_outbox_result
+        self.translator.router.on_change = self.on_routing_change
+        self.translator.outbox.start()
+        
         return sm
     
+    def on_stop(self):
+        """Persist runtime statistics when the app closes"""
+        self.translator.cache.flush_stats()
+        self.translation_engine.close()
+        self.translator.hedger.close()
+        self.translator.outbox.close()
+        self.speech.close()
+    
+    def on_outbox_result(self, entry, translation, error):
+        """Log a queued translation once it has been delivered (worker thread)"""
+        if error is None:
+            message = f'Queued translation delivered: "{entry.text}" -> "{translation}"'
+        else:
+            message = f'Queued translation abandoned: "{entry.text}" ({error})'
+        
+        def log(dt):
+            self.main_screen.add_log(message)
+            self.main_screen.update_outbox()
+        Clock.schedule_once(log, 0)
+    
+    def on_routing_change(self):
+        """Refresh the routing line when provider health changes (any thread)"""
+        Clock.schedule_once(self.main_screen.update_routing, 0)
+    
+    def on_speech_start(self, job):
+        """Log the utterance the speech worker started (worker thread)"""
+        message = f'🔊 Speaking{" (cached audio)" if job.cached else ""}: "{job.text}"'
+        
+        def log(dt):
+            self.main_screen.add_log(message)
+            pipeline = self.speech_pipeline
+            if pipeline is not None and pipeline.jobs and pipeline.jobs[0] is job:
+                self.main_screen.add_log(f'⏱ First audio {pipeline.time_to_first_audio:.2f} s after translation started')
+        Clock.schedule_once(log, 0)
+    
+    def on_speech_end(self, job):
+        """Log how an utterance ended (worker thread)"""
+        if job.state == 'done':
+            message = f'🔊 Finished speaking ({job.finished - job.started:.1f} s)'
+        elif job.cancelled:
+            message = '🔇 Speech interrupted'
+        else:
+            message = f'TTS error: {job.error}'
+        Clock.schedule_once(lambda dt: self.main_screen.add_log(message), 0)
+    
     def on_trigger_detected(self):
         """Handle trigger phrase detection"""
+        # Barge-in: stop talking as soon as the user starts a new command
+        self.speech.interrupt()
         Clock.schedule_once(lambda dt: self.main_screen.add_log('🎤 Trigger detected! Listening for command...'), 0)
     
     def on_command_received(self, command):
@@ -397,46 +508,231 @@ class VoiceHelperApp(App):
         Clock.schedule_once(lambda dt: self.main_screen.add_log(f'Command received: {command}'), 0)
         
         # Process command
-        command_lower = command.lower()
-        
-        if 'translate' in command_lower:
+        if self.translator.parse_command(command).action == 'translate':
             Clock.schedule_once(lambda dt: self.handle_translate_command(command), 0)
         else:
             Clock.schedule_once(lambda dt: self.main_screen.add_log('Unknown command'), 0)
     
     def handle_translate_command(self, command):
         """Handle translation command"""
-        source_lang, target_lang = self.translator.parse_translate_command(command)
-        self.main_screen.add_log(f'Translation from {source_lang} to {target_lang} requested')
+        source_lang, target_langs = self.translator.parse_translate_command(command, all_targets=True)
+        if not target_langs:
+            self.main_screen.add_log(f'Translate {source_lang} into which language? '
+                                     f'Say "translate from {source_lang} to" and a language')
+            return
+        self.main_screen.add_log(f'Translation from {source_lang} to {", ".join(target_langs)} requested')
         self.main_screen.add_log('Please speak the text to translate...')
         
+        if len(target_langs) == 1 and self.db.get_setting('speculative_translation') == 'true':
+            threading.Thread(target=self.listen_and_translate_speculatively,
+                             args=(target_langs[0], source_lang), daemon=True).start()
+            return
+        
         def listen_and_translate():
             text = self.voice_processor.listen_once()
-            if text:
-                Clock.schedule_once(lambda dt: self.do_translate(text, target_lang, source_lang), 0)
+            if text and len(target_langs) > 1:
+                Clock.schedule_once(lambda dt: self.do_translate_targets(text, target_langs, source_lang), 0)
+            elif text:
+                Clock.schedule_once(lambda dt: self.do_translate_long(text, target_langs[0], source_lang), 0)
             else:
                 Clock.schedule_once(lambda dt: self.main_screen.add_log('Failed to capture text'), 0)
         
         threading.Thread(target=listen_and_translate, daemon=True).start()
     
+    def listen_and_translate_speculatively(self, target_lang, source_lang='auto'):
+        """Dictate and translate, starting on stable parts of the partial transcript
+        
+        Runs on a worker thread. Sentences already translated while the
+        user was speaking are reused; the log reports the time saved. With voice
+        answers on, each sentence is queued for speech as soon as it is ready.
+        """
+        speculation = SpeculativeTranslation(self.translation_engine, target_lang, source_lang)
+        pipeline = None
+        
+        def on_partial(partial):
+            speculation.feed(partial)
+            Clock.schedule_once(lambda dt: self.main_screen.add_log(f'... {partial}'), 0)
+        
+        text = self.voice_processor.listen_once(on_partial=on_partial)
+        if not text:
+            Clock.schedule_once(lambda dt: self.main_screen.add_log('Failed to capture text'), 0)
+            return
+        
+        Clock.schedule_once(lambda dt: self.main_screen.add_log(f'Translating: "{text}"'), 0)
+        if self.db.get_setting('voice_answer') == 'true' and TTS_AVAILABLE:
+            pipeline = self.speech_pipeline = SpeechPipeline(self.speech, target_lang)
+        try:
+            translation, report = speculation.finish(text, timeout=self.translation_engine.timeout * 2,
+                                                     on_part=pipeline.add if pipeline else None)
+            saved_ms = int(report['saved'] * 1000)
+            self.db.increment_stat('speculation_saved_ms', saved_ms)
+            message = (f"Speculation reused {report['reused']}/{report['chunks']} parts, "
+                       f"cancelled {report['cancelled']}, saved {saved_ms} ms")
+            Clock.schedule_once(lambda dt: self.main_screen.add_log(message), 0)
+        except Exception as e:
+            translation = f"Translation error: {e}"
+            if self.queue_for_retry(text, target_lang, source_lang, e):
+                translation += ' (queued, will retry when online)'
+        if pipeline is not None:
+            pipeline.flush()
+        spoken = pipeline is not None and bool(pipeline.jobs)
+        Clock.schedule_once(lambda dt: self.show_translation_result(
+            text, translation, target_lang, speak=not spoken), 0)
+    
     def do_translate(self, text, target_lang, source_lang='auto'):
-        """Perform translation"""
+        """Perform translation
+        
+        A near-duplicate from the translation memory is shown as soon as
+        the lookup (on a worker thread) finds it, marked as fuzzy, and
+        replaced when the fresh translation arrives; a match found after
+        the fresh translation is ignored.
+        """
         self.main_screen.add_log(f'Translating: "{text}"')
         
-        def translate_thread():
-            result = self.translator.translate(text, target_lang, source_lang)
-            Clock.schedule_once(lambda dt: self.show_translation_result(text, result, target_lang), 0)
+        # Only touched on the main thread: the fuzzy label and the final result
+        state = {'shown': None, 'result': None}
+        
+        def show_match(match):
+            if state['result'] is not None:
+                return
+            self.main_screen.add_log(f'Fuzzy match ({match.similarity:.0%}) for "{match.text}"')
+            state['shown'] = self.show_translation_result(text, match.translation, target_lang, fuzzy=match)
         
-        threading.Thread(target=translate_thread, daemon=True).start()
+        def show_result(result):
+            state['result'] = result
+            if state['shown'] is None:
+                self.show_translation_result(text, result, target_lang)
+            else:
+                self.update_translation_result(state['shown'], result, target_lang)
+        
+        def lookup():
+            match = self.translator.memory_match(text, target_lang, source_lang)
+            if match is not None:
+                Clock.schedule_once(lambda dt: show_match(match), 0)
+        
+        def on_done(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = f"Translation error: {e}"
+                if self.queue_for_retry(text, target_lang, source_lang, e):
+                    result += ' (queued, will retry when online)'
+            Clock.schedule_once(lambda dt: show_result(result), 0)
+        
+        # Bounded, deadline-limited engine instead of a raw thread per request
+        self.translation_engine.submit(text, target_lang, source_lang, callback=on_done)
+        threading.Thread(target=lookup, daemon=True).start()
     
-    def show_translation_result(self, original, translation, lang):
-        """Show translation result in popup"""
-        self.main_screen.add_log(f'Translation: "{translation}"')
+    def queue_for_retry(self, text, target_lang, source_lang, error):
+        """Keep a request that failed because the network is down in the
+        outbox to translate later (any thread); returns True if queued"""
+        if not should_queue(error):
+            return False
+        self.translator.outbox.enqueue(text, target_lang, source_lang, error)
+        Clock.schedule_once(lambda dt: self.main_screen.update_outbox(), 0)
+        return True
+    
+    def do_translate_long(self, text, target_lang, source_lang='auto'):
+        """Translate multi-sentence text sentence by sentence, in parallel
+        
+        Sentences are logged in order as they become available and, with
+        voice answers on, queued for speech straight away so the first one
+        plays while the rest are translated; the reassembled translation is
+        shown when all are done. Sentences that failed because the network
+        is down are queued in the outbox.
+        """
+        segments = segment_text(text)
+        if len(segments) < 2:
+            self.do_translate(text, target_lang, source_lang)
+            return
+        
+        sentences = [sentence for sentence, _ in segments]
+        separators = [separator for _, separator in segments]
+        self.main_screen.add_log(f'Translating {len(sentences)} sentences...')
+        
+        pipeline = None
+        if self.db.get_setting('voice_answer') == 'true' and TTS_AVAILABLE:
+            pipeline = self.speech_pipeline = SpeechPipeline(self.speech, target_lang)
+        
+        def on_segment(index, result):
+            line = result['translation'] if result['error'] is None else f"Translation error: {result['error']}"
+            message = f'[{index + 1}/{len(sentences)}] {line}'
+            Clock.schedule_once(lambda dt: self.main_screen.add_log(message), 0)
+            if pipeline is not None and result['error'] is None:
+                pipeline.add(result['translation'])
+        
+        def on_done(future):
+            if pipeline is not None:
+                pipeline.flush()
+            try:
+                results = future.result()
+                translation = join_segments(
+                    [r['translation'] if r['error'] is None else r['text'] for r in results],
+                    separators)
+                queued = [r for r in results if r['error'] is not None
+                          and self.queue_for_retry(r['text'], target_lang, source_lang, r['exception'])]
+                if queued:
+                    translation += f' ({len(queued)} sentences queued, will retry when online)'
+            except Exception as e:
+                translation = f"Translation error: {e}"
+            Clock.schedule_once(lambda dt: self.show_translation_result(
+                text, translation, target_lang, speak=pipeline is None), 0)
+        
+        self.translation_engine.submit_segments(sentences, target_lang, source_lang,
+                                                on_segment=on_segment, callback=on_done)
+    
+    def do_translate_targets(self, text, target_langs, source_lang='auto'):
+        """Translate into several languages at once
+        
+        Each translation is logged as soon as it arrives; all of them are
+        shown together when the slowest is done. Targets that failed
+        because the network is down are queued in the outbox.
+        """
+        self.main_screen.add_log(f'Translating into {len(target_langs)} languages: "{text}"')
+        
+        def on_target(result):
+            line = result['translation'] if result['error'] is None else f"Translation error: {result['error']}"
+            message = f'[{result["target"]}] {line}'
+            Clock.schedule_once(lambda dt: self.main_screen.add_log(message), 0)
+        
+        def summary(result):
+            if result['error'] is None:
+                return f"{result['target']}: {result['translation']}"
+            if self.queue_for_retry(text, result['target'], source_lang, result['exception']):
+                return f"{result['target']}: error: {result['error']} (queued, will retry when online)"
+            return f"{result['target']}: error: {result['error']}"
+        
+        def on_done(future):
+            try:
+                translation = '\n'.join(summary(result) for result in future.result())
+            except Exception as e:
+                translation = f"Translation error: {e}"
+            Clock.schedule_once(
+                lambda dt: self.show_translation_result(text, translation, ', '.join(target_langs)), 0)
+        
+        self.translation_engine.submit_targets(text, target_langs, source_lang,
+                                               on_target=on_target, callback=on_done)
+    
+    def show_translation_result(self, original, translation, lang, fuzzy=None, speak=True):
+        """Show translation result in popup
+        
+        ``fuzzy`` is the MemoryMatch a provisional result came from; its
+        label is returned so update_translation_result can replace it.
+        ``speak`` is False when the sentences were already spoken as they
+        arrived.
+        """
+        if fuzzy is None:
+            self.main_screen.add_log(f'Translation: "{translation}"')
+            label_text = f'Translation ({lang}): {translation}'
+        else:
+            self.main_screen.add_log(f'Fuzzy translation: "{translation}"')
+            label_text = f'≈ Translation ({lang}, {fuzzy.similarity:.0%} match): {translation}'
         
         # Create popup content
         content = BoxLayout(orientation='vertical', padding=10, spacing=10)
         content.add_widget(Label(text=f'Original: {original}'))
-        content.add_widget(Label(text=f'Translation ({lang}): {translation}'))
+        result_label = Label(text=label_text)
+        content.add_widget(result_label)
         
         close_btn = Button(text='Close', size_hint_y=0.2)
         content.add_widget(close_btn)
@@ -449,15 +745,23 @@ class VoiceHelperApp(App):
         close_btn.bind(on_press=popup.dismiss)
         popup.open()
         
-        # Voice answer if enabled
+        if fuzzy is not None:
+            return result_label
+        
+        if speak:
+            self.speak_translation(translation, lang)
+    
+    def update_translation_result(self, label, translation, lang):
+        """Replace a fuzzy result shown earlier with the fresh translation"""
+        self.main_screen.add_log(f'Translation: "{translation}"')
+        label.text = f'Translation ({lang}): {translation}'
+        self.speak_translation(translation, lang)
+    
+    def speak_translation(self, translation, lang=None):
+        """Voice answer if enabled; a new answer cuts off the previous one"""
         voice_answer = self.db.get_setting('voice_answer')
         if voice_answer == 'true' and TTS_AVAILABLE:
-            try:
-                engine = pyttsx3.init()
-                engine.say(translation)
-                engine.runAndWait()
-            except Exception as e:
-                print(f"TTS error: {e}")
+            self.speech.say(translation, language=lang, interrupt=True)
 
 
 if __name__ == '__main__':
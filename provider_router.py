@@ -0,0 +1,166 @@
+import threading
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitOpenError(Exception):
+    """No translation provider is currently accepting requests"""
+    pass
+
+
+class ProviderHealth:
+    """Smoothed latency and error rate of one provider, plus its breaker state"""
+
+    def __init__(self, name):
+        self.name = name
+        self.latency = None  # EWMA of successful call durations (seconds)
+        self.error_rate = 0.0  # EWMA of failures (1) vs successes (0)
+        self.calls = 0
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probe_started = None
+
+
+class ProviderRouter:
+    """Routes translations to the healthiest provider
+
+    Each provider keeps an exponentially weighted moving average of its
+    latency and error rate. A provider whose error rate passes
+    ``error_threshold`` (after ``min_calls`` calls) or which fails
+    ``max_consecutive_failures`` times in a row has its circuit opened:
+    it gets no traffic for ``cooldown`` seconds, then a single half-open
+    probe request decides whether it closes again or stays open.
+
+    ``route`` returns providers in the order they should be tried; the
+    user's preferred provider wins unless its score (latency inflated by
+    its error rate) is more than ``preference`` times the best one.
+
+    ``on_change()`` is called, from the calling thread, whenever a
+    provider's health or circuit state changes, so a display can refresh
+    without polling.
+    """
+
+    def __init__(self, alpha=0.2, error_threshold=0.5, min_calls=5,
+                 max_consecutive_failures=3, cooldown=30.0, preference=2.0, on_change=None):
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.min_calls = min_calls
+        self.max_consecutive_failures = max_consecutive_failures
+        self.cooldown = cooldown
+        self.preference = preference
+        self.on_change = on_change
+        self._health = {}
+        self._lock = threading.Lock()
+
+    def _get(self, provider):
+        health = self._health.get(provider)
+        if health is None:
+            health = self._health[provider] = ProviderHealth(provider)
+        return health
+
+    def _score(self, health):
+        if health.latency is None:
+            return float('inf')  # unmeasured providers only get traffic as fallback or preference
+        return health.latency * (1.0 + 4.0 * health.error_rate)
+
+    def route(self, preferred, providers):
+        """Order ``providers`` for one request; raises CircuitOpenError if
+        every circuit is open"""
+        now = time.monotonic()
+        probe = None
+        closed = []
+        with self._lock:
+            for provider in providers:
+                health = self._get(provider)
+                if health.state == CLOSED:
+                    closed.append(health)
+                elif now - health.opened_at >= self.cooldown and (
+                        health.probe_started is None or now - health.probe_started >= self.cooldown):
+                    # Let one request through to test the provider (again, if
+                    # an earlier probe never reported back)
+                    health.state = HALF_OPEN
+                    health.probe_started = now
+                    probe = probe or health
+            closed.sort(key=self._score)
+            if closed:
+                best = self._score(closed[0])
+                for health in closed:
+                    if health.name == preferred and (health.latency is None
+                                                     or self._score(health) <= best * self.preference):
+                        closed.remove(health)
+                        closed.insert(0, health)
+                        break
+        if probe:
+            self._changed()
+        order = ([probe.name] if probe else []) + [health.name for health in closed]
+        if not order:
+            raise CircuitOpenError("All translation providers are failing; try again shortly")
+        return order
+
+    def record_success(self, provider, seconds):
+        with self._lock:
+            health = self._get(provider)
+            health.calls += 1
+            health.consecutive_failures = 0
+            health.error_rate *= 1.0 - self.alpha
+            if health.latency is None:
+                health.latency = seconds
+            else:
+                health.latency += self.alpha * (seconds - health.latency)
+            if health.state != CLOSED:
+                health.state = CLOSED
+                health.probe_started = None
+                health.error_rate = 0.0
+        self._changed()
+
+    def record_failure(self, provider):
+        with self._lock:
+            health = self._get(provider)
+            health.calls += 1
+            health.consecutive_failures += 1
+            health.error_rate += self.alpha * (1.0 - health.error_rate)
+            tripped = (health.consecutive_failures >= self.max_consecutive_failures
+                       or (health.calls >= self.min_calls
+                           and health.error_rate >= self.error_threshold))
+            if health.state == HALF_OPEN or (health.state == CLOSED and tripped):
+                health.state = OPEN
+                health.opened_at = time.monotonic()
+                health.probe_started = None
+        self._changed()
+
+    def _changed(self):
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception as e:
+                print(f"Routing callback error: {e}")
+
+    def snapshot(self):
+        """Current routing state per provider (for display)"""
+        now = time.monotonic()
+        with self._lock:
+            return {name: {
+                'state': health.state,
+                'latency_ms': round(health.latency * 1000) if health.latency is not None else None,
+                'error_rate': round(health.error_rate, 3),
+                'retry_in': (max(0.0, round(self.cooldown - (now - health.opened_at), 1))
+                             if health.state == OPEN else None),
+            } for name, health in self._health.items()}
+
+    def describe(self):
+        """One-line summary such as 'google 180 ms 2% err | deepl open (retry 12s)'"""
+        parts = []
+        for name, info in sorted(self.snapshot().items()):
+            if info['state'] == OPEN:
+                parts.append(f"{name} open (retry {info['retry_in']:.0f}s)")
+            elif info['state'] == HALF_OPEN:
+                parts.append(f"{name} probing")
+            elif info['latency_ms'] is None:
+                parts.append(f"{name} no data")
+            else:
+                parts.append(f"{name} {info['latency_ms']} ms {info['error_rate']:.0%} err")
+        return ' | '.join(parts)
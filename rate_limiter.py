@@ -0,0 +1,132 @@
+import heapq
+import itertools
+import threading
+import time
+
+# Request priorities: lower goes first
+INTERACTIVE = 0
+BATCH = 1
+
+
+class LoadShedError(Exception):
+    """A request was refused because the provider's queue is too long"""
+
+    def __init__(self, provider, message):
+        super().__init__(f"{provider}: {message}")
+        self.provider = provider
+
+
+class RateLimiter:
+    """Token bucket for one provider with a priority wait queue
+
+    Tokens refill at ``rate`` per second up to ``burst``; each request takes
+    one. Requests that find no token wait in a queue ordered by priority
+    (interactive before batch), first come first served within a priority.
+    A request is shed with LoadShedError when ``max_queue`` requests are
+    already waiting, or when it has waited ``max_wait`` seconds or reached
+    its caller's deadline, whichever comes first.
+    """
+
+    def __init__(self, provider, rate=5.0, burst=10, max_queue=32, max_wait=10.0):
+        self.provider = provider
+        self.rate = rate
+        self.burst = burst
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.granted = 0
+        self.queued = 0
+        self.shed = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def configure(self, rate, burst):
+        with self._condition:
+            self._refill(time.monotonic())
+            self.rate = rate
+            self.burst = burst
+            self._tokens = min(self._tokens, float(burst))
+            self._condition.notify_all()
+
+    def _refill(self, now):
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, priority=INTERACTIVE, deadline=None):
+        """Take a token, waiting in line if necessary; returns seconds waited
+
+        ``deadline`` is the ``time.monotonic()`` time by which the caller
+        gives up anyway; the request is shed then instead of holding its
+        thread for the rest of ``max_wait``.
+        """
+        start = time.monotonic()
+        with self._condition:
+            self._refill(start)
+            if not self._waiting and self._tokens >= 1:
+                self._tokens -= 1
+                self.granted += 1
+                return 0.0
+            if len(self._waiting) >= self.max_queue:
+                self.shed += 1
+                raise LoadShedError(self.provider, f"too busy ({len(self._waiting)} requests queued), "
+                                                   "try again shortly")
+
+            entry = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, entry)
+            self.queued += 1
+            limit = start + self.max_wait
+            if deadline is not None and deadline < limit:
+                limit, reason = deadline, "rate limited past the request deadline"
+            else:
+                reason = f"rate limited for {self.max_wait:.0f}s"
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._waiting[0] == entry and self._tokens >= 1:
+                        self._tokens -= 1
+                        self.granted += 1
+                        return now - start
+                    if now >= limit:
+                        self.shed += 1
+                        raise LoadShedError(self.provider, f"{reason}, try again shortly")
+                    next_token = max(0.0, (1 - self._tokens) / self.rate) if self.rate > 0 else limit - now
+                    self._condition.wait(min(next_token, limit - now))
+            finally:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+
+    def stats(self):
+        with self._condition:
+            return {'granted': self.granted, 'queued': self.queued, 'shed': self.shed,
+                    'waiting': len(self._waiting)}
+
+
+class RateLimiterPool:
+    """One RateLimiter per provider, created on first use"""
+
+    def __init__(self, max_queue=32, max_wait=10.0):
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider, rate, burst):
+        """Limiter for ``provider``, updated to the given rate and burst"""
+        with self._lock:
+            limiter = self._limiters.get(provider)
+            if limiter is None:
+                limiter = self._limiters[provider] = RateLimiter(
+                    provider, rate, burst, self.max_queue, self.max_wait)
+                return limiter
+        if (limiter.rate, limiter.burst) != (rate, burst):
+            limiter.configure(rate, burst)
+        return limiter
+
+    def stats(self):
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {provider: limiter.stats() for provider, limiter in limiters.items()}
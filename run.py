@@ -30,7 +30,6 @@ def main():
     ]
     
     optional = [
-        ('deep_translator', 'deep-translator'),
         ('pyttsx3', 'pyttsx3'),
     ]
     
@@ -0,0 +1,50 @@
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key onto one execution
+
+    The first caller for a key (the leader) runs the function; callers
+    arriving with the same key while it runs wait for, and share, its
+    result or exception. Once the call finishes the key is forgotten, so
+    later callers start a fresh call (caching is someone else's job).
+    """
+
+    def __init__(self):
+        self.leaders = 0
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """Run ``fn()`` once per in-flight key; returns (result, shared)"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self):
+        with self._lock:
+            leaders, coalesced = self.leaders, self.coalesced
+        total = leaders + coalesced
+        return {'calls': leaders, 'coalesced': coalesced,
+                'coalesced_rate': coalesced / total if total else 0.0}
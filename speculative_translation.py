@@ -0,0 +1,170 @@
+"""
+Speculative translation of partial transcripts
+
+While the user is still speaking, partial transcripts arrive every second
+or so. The words two consecutive partials agree on are taken as stable.
+Each stable sentence is sent to the translation engine once, at batch
+priority, as soon as its closing punctuation is stable; nothing is
+resubmitted while the transcript merely grows. Only whole sentences are
+speculated on, because translating fragments separately breaks word
+order; an unpunctuated transcript is translated in one piece when it is
+final. When the final transcript arrives, the sentences it still starts
+with reuse those requests and only the remaining suffix is translated.
+Sentences the recogniser revised are cancelled. The report says how much
+waiting this saved.
+"""
+
+import threading
+import time
+
+from rate_limiter import BATCH
+
+# A word ending in one of these closes a sentence
+SENTENCE_ENDS = '.!?…。！？'
+
+# Full-width punctuation that needs no space before the next sentence
+_NO_SPACE_AFTER = '。！？'
+
+
+def _join(translations):
+    """Join sentence translations, without spaces after CJK full stops"""
+    text = ''
+    for translation in translations:
+        if text and not text.endswith(tuple(_NO_SPACE_AFTER)):
+            text += ' '
+        text += translation
+    return text
+
+
+class _Unit:
+    """One speculative or final translation request"""
+
+    def __init__(self, words, future):
+        self.words = words
+        self.future = future
+        self.started = time.monotonic()
+        self.finished = None
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        self.finished = time.monotonic()
+
+
+class SpeculativeTranslation:
+    """Speculates on one dictation turn; call ``feed`` then ``finish``
+
+    ``engine`` is the AsyncTranslationEngine. ``feed(partial)`` is safe to
+    call from any thread; calls after ``finish`` are ignored.
+    """
+
+    def __init__(self, engine, target_lang, source_lang='auto'):
+        self.engine = engine
+        self.target_lang = target_lang
+        self.source_lang = source_lang
+        self.speculated = 0
+        self.cancelled = 0
+        self._chunks = []  # _Units (one per sentence) covering the start of the transcript
+        self._previous = []
+        self._finished = False
+        self._lock = threading.Lock()
+
+    def feed(self, partial):
+        """Take a partial transcript; speculate on new complete sentences"""
+        words = partial.split()
+        with self._lock:
+            if self._finished:
+                return
+            stable = []
+            for word, previous in zip(words, self._previous):
+                if word != previous:
+                    break
+                stable.append(word)
+            self._previous = words
+
+            # Drop sentences the recogniser has since revised
+            position = 0
+            for index, unit in enumerate(self._chunks):
+                end = position + len(unit.words)
+                if words[position:end] != unit.words[:len(words[position:end])]:
+                    self._cancel_from(index)
+                    break
+                position = end
+
+            covered = sum(len(unit.words) for unit in self._chunks)
+            while True:
+                size = self._sentence_size(stable[covered:])
+                if size is None:
+                    break
+                chunk = stable[covered:covered + size]
+                self._chunks.append(self._submit(chunk, priority=BATCH))
+                self.speculated += 1
+                covered += size
+
+    def finish(self, final_text, timeout=None, on_part=None):
+        """Translate the final transcript, reusing speculated sentences
+
+        Blocks until done (call from a worker thread). ``on_part(text)`` is
+        called with each request's translation in order as soon as it and
+        the ones before it are done, e.g. to start speaking the answer;
+        every part but possibly the last is one whole sentence.
+        Returns (translation, report); report has 'chunks' (requests the result is
+        made of), 'reused', 'patched' (1 if a suffix had to be translated
+        now), 'speculated', 'cancelled', 'latency' (seconds from
+        finalisation to result) and 'saved' (seconds saved against
+        translating only now).
+        """
+        finalised = time.monotonic()
+        words = final_text.split()
+        with self._lock:
+            self._finished = True
+            units = []
+            position = 0
+            for index, unit in enumerate(self._chunks):
+                end = position + len(unit.words)
+                failed = unit.future.done() and (unit.future.cancelled() or unit.future.exception())
+                if failed or words[position:end] != unit.words:
+                    self._cancel_from(index)
+                    break
+                units.append(unit)
+                position = end
+            reused = len(units)
+            if position < len(words):
+                units.append(self._submit(words[position:]))
+
+        translations = []
+        for unit in units:
+            translations.append(unit.future.result(timeout))
+            if on_part is not None and translations[-1]:
+                on_part(translations[-1])
+        done = time.monotonic()
+        latency = done - finalised
+        # Without speculation every request would have started now, in parallel
+        baseline = max(((unit.finished or done) - unit.started) for unit in units) if units else 0.0
+        report = {
+            'chunks': len(units),
+            'reused': reused,
+            'patched': len(units) - reused,
+            'speculated': self.speculated,
+            'cancelled': self.cancelled,
+            'latency': latency,
+            'saved': max(0.0, baseline - latency),
+        }
+        return _join(translation for translation in translations if translation), report
+
+    def _sentence_size(self, words):
+        """Words in the first complete sentence of ``words``, or None"""
+        for index, word in enumerate(words):
+            if word.endswith(tuple(SENTENCE_ENDS)):
+                return index + 1
+        return None
+
+    def _submit(self, words, **options):
+        future = self.engine.submit(' '.join(words), self.target_lang, self.source_lang, **options)
+        return _Unit(words, future)
+
+    def _cancel_from(self, index):
+        for unit in self._chunks[index:]:
+            if not unit.future.done():
+                unit.future.cancel()
+                self.cancelled += 1
+        del self._chunks[index:]
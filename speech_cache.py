@@ -0,0 +1,216 @@
+"""
+On-disk cache of synthesized speech
+
+The same answers ("Translation error", greetings, common phrases) are
+spoken over and over. The SpeechWorker speaks a phrase live the first
+time and, while it is idle, renders it to a WAV file with the engine's
+``save_to_file``; the file is kept in a SpeechCache keyed by text, voice,
+rate and language, and repeats are played from it with WavePlayer. Only
+files that open as WAV audio are kept (some drivers write other formats).
+The cache is capped at ``max_bytes`` and evicts the least recently played
+files; file modification times carry the LRU order across restarts.
+"""
+
+try:
+    import pyaudio
+    PYAUDIO_AVAILABLE = True
+except ImportError:
+    PYAUDIO_AVAILABLE = False
+
+import hashlib
+import os
+import tempfile
+import threading
+import wave
+from collections import OrderedDict
+
+from voice_processor import AbortException, catch_abort_signal, suppress_alsa_errors
+
+
+class SpeechCache:
+    """Size-capped LRU directory of rendered utterances"""
+
+    def __init__(self, directory='speech_cache', max_bytes=50 * 1024 * 1024, extension='.wav'):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.extension = extension
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # file name -> size, least recently used first
+        self._size = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @staticmethod
+    def key(text, voice=None, rate=None, language=None):
+        """Cache key for an utterance; whitespace differences don't matter"""
+        raw = '\0'.join([' '.join(text.split()), str(voice), str(rate), str(language)])
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    @property
+    def size(self):
+        """Total bytes on disk"""
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key + self.extension in self._entries
+
+    def get(self, key):
+        """Path of the cached audio for ``key``, or None on a miss"""
+        name = key + self.extension
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            if name in self._entries and not os.path.exists(path):
+                self._size -= self._entries.pop(name)
+            if name not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(name)
+            self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def reserve(self, key):
+        """Temporary path in the cache directory to render ``key`` into"""
+        fd, path = tempfile.mkstemp(prefix=key + '.', suffix='.tmp', dir=self.directory)
+        os.close(fd)
+        return path
+
+    def put(self, key, temp_path):
+        """Move a rendered file into the cache; returns its path
+
+        Returns None (and deletes the file) if nothing playable was
+        rendered, i.e. the file is empty or not WAV audio.
+        """
+        size = os.path.getsize(temp_path) if os.path.exists(temp_path) else 0
+        if size == 0 or not self._playable(temp_path):
+            self.discard(temp_path)
+            return None
+        name = key + self.extension
+        path = os.path.join(self.directory, name)
+        os.replace(temp_path, path)
+        with self._lock:
+            self._size += size - self._entries.pop(name, 0)
+            self._entries[name] = size
+            self._evict()
+        return path
+
+    def remove(self, key):
+        """Drop the entry for ``key``, e.g. after it failed to play"""
+        name = key + self.extension
+        with self._lock:
+            self._size -= self._entries.pop(name, 0)
+        self.discard(os.path.join(self.directory, name))
+
+    def discard(self, temp_path):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _playable(path):
+        try:
+            with wave.open(path, 'rb') as wav:
+                return wav.getnframes() > 0
+        except (wave.Error, EOFError, OSError):
+            return False
+
+    def _load(self):
+        files = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith('.tmp'):
+                self.discard(path)  # left over from an interrupted render
+            elif name.endswith(self.extension):
+                stat = os.stat(path)
+                files.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._size += size
+        self._evict()
+
+    def _evict(self):
+        # The most recent entry always stays, even if it alone is over the cap
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._size -= size
+            self.discard(os.path.join(self.directory, name))
+
+
+def output_available():
+    """Check if an audio output device is available
+
+    Probed the way VoiceProcessor checks for input devices: with ALSA/JACK
+    messages suppressed and PortAudio assertion failures caught.
+    """
+    if not PYAUDIO_AVAILABLE:
+        return False
+    with suppress_alsa_errors():
+        with catch_abort_signal():
+            try:
+                p = pyaudio.PyAudio()
+                try:
+                    for i in range(p.get_device_count()):
+                        try:
+                            if p.get_device_info_by_index(i).get('maxOutputChannels', 0) > 0:
+                                return True
+                        except Exception:
+                            continue
+                    print("Warning: No audio output devices found")
+                    return False
+                finally:
+                    p.terminate()
+            except AbortException:
+                print("Warning: Audio hardware initialization failed (assertion caught)")
+                return False
+            except Exception as e:
+                print(f"Warning: Audio output not available: {e}")
+                return False
+
+
+class WavePlayer:
+    """Plays WAV files through PyAudio in chunks so playback can stop early
+
+    Create one only when ``output_available()``; PyAudio is opened with
+    ALSA/JACK messages suppressed.
+    """
+
+    def __init__(self, chunk_frames=1024):
+        self.chunk_frames = chunk_frames
+        self._audio = None
+
+    def play(self, path, should_stop=None):
+        """Play ``path``; returns False if ``should_stop()`` cut it short"""
+        with wave.open(path, 'rb') as wav:
+            with suppress_alsa_errors():
+                if self._audio is None:
+                    self._audio = pyaudio.PyAudio()
+                stream = self._audio.open(format=self._audio.get_format_from_width(wav.getsampwidth()),
+                                          channels=wav.getnchannels(),
+                                          rate=wav.getframerate(),
+                                          output=True)
+            try:
+                data = wav.readframes(self.chunk_frames)
+                while data:
+                    if should_stop is not None and should_stop():
+                        return False
+                    stream.write(data)
+                    data = wav.readframes(self.chunk_frames)
+            finally:
+                stream.stop_stream()
+                stream.close()
+        return True
+
+    def close(self):
+        if self._audio is not None:
+            self._audio.terminate()
+            self._audio = None
@@ -0,0 +1,347 @@
+"""
+Text-to-speech on a background thread
+
+Creating a pyttsx3 engine is slow and ``runAndWait`` blocks for the whole
+utterance, so speaking from the Kivy main thread froze the UI. The
+SpeechWorker owns one long-lived engine, created on its own thread, and
+speaks queued SpeechJobs in order. A job can be cancelled while queued or
+mid-utterance, and ``interrupt`` (barge-in) drops everything queued and
+stops what is being said. ``on_start(job)`` and ``on_end(job)`` are called
+from the worker thread so the UI can show what is being spoken. With a
+SpeechCache and a player, phrases are spoken live the first time, rendered
+to audio files while the worker is idle, and replayed from the cache
+afterwards (see speech_cache.py). A SpeechPipeline
+queues the sentences of one answer as their translations arrive, so the
+first sentence is heard while the rest are still being translated; text
+is only handed to the worker in whole sentences.
+"""
+
+try:
+    import pyttsx3
+    TTS_AVAILABLE = True
+except ImportError:
+    TTS_AVAILABLE = False
+
+import itertools
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+
+from text_segmenter import segment_text
+
+# Text ending like this is a complete sentence
+_SENTENCE_END = re.compile(r'[.!?…。！？][\'"”’»)\]」』]*$')
+
+
+class SpeechJob:
+    """One utterance; ``state`` is queued, speaking, done, cancelled or failed"""
+
+    def __init__(self, id, text, language=None):
+        self.id = id
+        self.text = text
+        self.language = language
+        self.state = 'queued'
+        self.cached = False
+        self.error = None
+        self.started = None
+        self.finished = None
+        self._done = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self.state == 'cancelled'
+
+    def wait(self, timeout=None):
+        """Block until the job was spoken, cancelled or failed"""
+        return self._done.wait(timeout)
+
+    def __repr__(self):
+        return f"SpeechJob({self.id}, {self.text[:30]!r}, {self.state})"
+
+
+class SpeechWorker:
+    """Speaks queued text on a dedicated thread with a single engine
+
+    ``engine_factory`` returns an object with pyttsx3's ``say``,
+    ``runAndWait`` and ``stop``; it defaults to ``pyttsx3.init`` and is
+    called on the worker thread, again only if the engine fails. The
+    thread starts with the first ``say``. ``on_end`` is called for every
+    job that started, whether it finished, was interrupted or failed.
+
+    ``cache`` (a SpeechCache) and ``player`` (a WavePlayer) are optional;
+    with both, cached jobs are played from rendered files and
+    ``job.cached`` says whether synthesis was skipped. A cache miss is
+    spoken live, so rendering never delays speech; phrases of at most
+    ``render_chars`` characters, and longer ones heard before, are then
+    rendered while the queue is empty. A new job stops such a render.
+    """
+
+    def __init__(self, engine_factory=None, on_start=None, on_end=None, cache=None, player=None,
+                 render_chars=120):
+        self.engine_factory = engine_factory
+        self.on_start = on_start
+        self.on_end = on_end
+        self.cache = cache
+        self.player = player
+        self.render_chars = render_chars
+        self.engines_created = 0
+        self._queue = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._current = None
+        self._engine = None
+        self._thread = None
+        self._renders = deque()  # (key, text) to render when idle
+        self._heard = OrderedDict()  # keys of long phrases spoken live, oldest first
+        self._rendering = False
+        self._render_stopped = False
+
+    @property
+    def available(self):
+        return self.engine_factory is not None or TTS_AVAILABLE
+
+    def say(self, text, language=None, interrupt=False):
+        """Queue ``text`` and return its SpeechJob without waiting
+
+        ``language`` is part of the cache key. With ``interrupt`` the new
+        job barges in: everything queued or being spoken is cancelled first.
+        """
+        if interrupt:
+            self.interrupt()
+        job = SpeechJob(next(self._ids), text, language)
+        self.start()
+        self._queue.put(job)
+        self._stop_render()
+        return job
+
+    def cancel(self, job):
+        """Drop a queued job or stop it mid-utterance; False if already over"""
+        with self._lock:
+            if job.state == 'queued':
+                job.state = 'cancelled'
+                job._done.set()
+                return True
+            if job.state != 'speaking':
+                return False
+            job.state = 'cancelled'
+            engine = self._engine
+        if engine is not None:
+            try:
+                engine.stop()
+            except Exception as e:
+                print(f"TTS stop error: {e}")
+        return True
+
+    def interrupt(self):
+        """Barge-in: cancel every queued job and stop the current one"""
+        closing = False
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                closing = True
+            else:
+                self.cancel(job)
+        if closing:
+            self._queue.put(None)
+        current = self._current
+        if current is not None:
+            self.cancel(current)
+
+    @property
+    def speaking(self):
+        """The job being spoken, or None"""
+        return self._current
+
+    def start(self):
+        """Start the worker thread (idempotent)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='speech-worker', daemon=True)
+                self._thread.start()
+
+    def close(self):
+        self.interrupt()
+        self._renders.clear()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._stop_render()
+            self._thread.join(timeout=2)
+        if self.player is not None:
+            self.player.close()
+
+    def _run(self):
+        while True:
+            if self._renders and self._queue.empty():
+                self._render_idle(*self._renders.popleft())
+                continue
+            job = self._queue.get()
+            if job is None:
+                break
+            with self._lock:
+                if job.state != 'queued':
+                    continue
+                job.state = 'speaking'
+                self._current = job
+            job.started = time.monotonic()
+            self._notify(self.on_start, job)
+            try:
+                self._speak(job)
+            except Exception as e:
+                print(f"TTS error: {e}")
+                job.error = str(e)
+                self._engine = None
+            with self._lock:
+                self._current = None
+                if job.state == 'speaking':
+                    job.state = 'done' if job.error is None else 'failed'
+            job.finished = time.monotonic()
+            self._notify(self.on_end, job)
+            job._done.set()
+
+    def _speak(self, job):
+        if self._engine is None:
+            factory = self.engine_factory or pyttsx3.init
+            self._engine = factory()
+            self.engines_created += 1
+        engine = self._engine
+        if self.cache is None or self.player is None:
+            self._say(engine, job)
+            return
+        key = self.cache.key(job.text, engine.getProperty('voice'), engine.getProperty('rate'),
+                             job.language)
+        path = self.cache.get(key)
+        job.cached = path is not None
+        if path is not None:
+            try:
+                self.player.play(path, lambda: job.state != 'speaking')
+                return
+            except Exception as e:
+                print(f"Cached speech unplayable, speaking live: {e}")
+                self.cache.remove(key)
+                job.cached = False
+        self._say(engine, job)
+        if job.state == 'speaking' and self._worth_rendering(job.text, key):
+            self._renders.append((key, job.text))
+
+    def _say(self, engine, job):
+        with self._lock:
+            # Checked under the lock so a cancel either lands before say or stops it
+            if job.state != 'speaking':
+                return
+            engine.say(job.text)
+        engine.runAndWait()
+
+    def _worth_rendering(self, text, key):
+        """Short phrases are rendered at once, longer ones once they repeat"""
+        if len(text) <= self.render_chars or key in self._heard:
+            self._heard.pop(key, None)
+            return True
+        self._heard[key] = True
+        if len(self._heard) > 256:
+            self._heard.popitem(last=False)
+        return False
+
+    def _render_idle(self, key, text):
+        """Render a phrase into the cache unless a job arrives meanwhile"""
+        engine = self._engine
+        if engine is None or key in self.cache:
+            return
+        temp = self.cache.reserve(key)
+        with self._lock:
+            # Checked under the lock so a new job either lands first or stops the render
+            if not self._queue.empty():
+                self.cache.discard(temp)
+                self._renders.appendleft((key, text))
+                return
+            self._rendering = True
+            self._render_stopped = False
+            engine.save_to_file(text, temp)
+        failed = False
+        try:
+            engine.runAndWait()
+        except Exception as e:
+            print(f"TTS render error: {e}")
+            self._engine = None
+            failed = True
+        finally:
+            with self._lock:
+                stopped = self._render_stopped
+                self._rendering = False
+        if failed or stopped:
+            self.cache.discard(temp)
+            if stopped and not failed:
+                self._renders.appendleft((key, text))  # try again at the next pause
+        else:
+            self.cache.put(key, temp)
+
+    def _stop_render(self):
+        with self._lock:
+            if not self._rendering or self._render_stopped:
+                return
+            self._render_stopped = True
+            engine = self._engine
+        try:
+            engine.stop()
+        except Exception as e:
+            print(f"TTS stop error: {e}")
+
+    def _notify(self, callback, job):
+        if callback:
+            try:
+                callback(job)
+            except Exception as e:
+                print(f"Speech callback error: {e}")
+
+
+class SpeechPipeline:
+    """Speaks one answer sentence by sentence as the translations arrive
+
+    ``add`` takes translated text in order and queues each complete
+    sentence on the worker; an unfinished sentence waits for the rest of
+    it, or for ``flush`` once the answer is complete. The first sentence
+    barges in over earlier speech, the rest queue behind it.
+    ``time_to_first_audio`` is measured from creating the pipeline, i.e.
+    from when translation started.
+    """
+
+    def __init__(self, worker, language=None):
+        self.worker = worker
+        self.language = language
+        self.created = time.monotonic()
+        self.jobs = []
+        self._pending = ''
+        self._lock = threading.Lock()
+
+    def add(self, text):
+        """Take the next piece of the answer; returns the SpeechJobs queued"""
+        with self._lock:
+            self._pending = f'{self._pending} {text}'.strip()
+            sentences = [sentence for sentence, _ in segment_text(self._pending)]
+            if sentences and not _SENTENCE_END.search(sentences[-1]):
+                self._pending = sentences.pop()
+            else:
+                self._pending = ''
+            return [self._say(sentence) for sentence in sentences]
+
+    def flush(self):
+        """Speak whatever is left once the answer is complete"""
+        with self._lock:
+            text, self._pending = self._pending, ''
+            return [self._say(text)] if text else []
+
+    def _say(self, text):
+        job = self.worker.say(text, language=self.language, interrupt=not self.jobs)
+        self.jobs.append(job)
+        return job
+
+    @property
+    def time_to_first_audio(self):
+        """Seconds until the first sentence started, or None if it hasn't"""
+        if not self.jobs or self.jobs[0].started is None:
+            return None
+        return self.jobs[0].started - self.created
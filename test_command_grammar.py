@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Test script for the compiled command grammar
+Runs a corpus of tricky real-world commands through parse_translate_command
+"""
+
+import sys
+
+# (command, action, source, target)
+CORPUS = [
+    ("translate to spanish", 'translate', 'auto', 'es'),
+    ("translate from russian to english", 'translate', 'ru', 'en'),
+    ("translate russian to english", 'translate', 'ru', 'en'),
+    ("translate english to russian", 'translate', 'en', 'ru'),
+    ("hey assistant translate to italian", 'translate', 'auto', 'it'),
+    ("Translate, from English, to Japanese please", 'translate', 'en', 'ja'),
+    ("translate into German", 'translate', 'auto', 'de'),
+    ("translate tomorrow's schedule to french", 'translate', 'auto', 'fr'),
+    ("translate potato salad into german", 'translate', 'auto', 'de'),
+    ("translate the weather in toronto to spanish", 'translate', 'auto', 'es'),
+    ("translate a quote from shakespeare to french", 'translate', 'auto', 'fr'),
+    ("translate to to french", 'translate', 'auto', 'fr'),
+    ("translate stop at tomorrow to korean", 'translate', 'auto', 'ko'),
+    ("translation from spanish", 'translate', 'es', 'en'),
+    ("translate chinese", 'translate', 'auto', 'zh-CN'),
+    ("how do you say good morning in korean", 'translate', 'auto', 'ko'),
+    ("translate to es", 'translate', 'auto', 'es'),
+    ("translate russian to es", 'translate', 'ru', 'es'),
+    ("TRANSLATE FROM ARABIC TO HINDI", 'translate', 'ar', 'hi'),
+    ("translated to portuguese", 'translate', 'auto', 'pt'),
+    ("translate to rushian", 'translate', 'auto', 'ru'),
+    ("translate from deutsch to español", 'translate', 'de', 'es'),
+    ("translate rushian to english", 'translate', 'ru', 'en'),
+    ("translate it to german", 'translate', 'auto', 'de'),
+    ("translate no to mandarin", 'translate', 'auto', 'zh-CN'),
+    ("what time is it", None, 'auto', 'en'),
+    ("go to toronto", None, 'auto', 'en'),
+]
+
+
+def test_corpus():
+    """Test that every corpus command parses to the expected intent"""
+    print("\n=== Testing Command Corpus ===")
+    try:
+        from translator import TranslationService
+
+        ts = TranslationService()
+        failures = []
+        for command, action, source, target in CORPUS:
+            intent = ts.parse_command(command)
+            got = (intent.action, intent.source, intent.target)
+            if got != (action, source, target):
+                failures.append(f"{command!r}: expected {(action, source, target)}, got {got}")
+            if ts.parse_translate_command(command) != (intent.source, intent.target):
+                failures.append(f"{command!r}: tuple API disagrees with intent")
+        for failure in failures:
+            print(f"✗ {failure}")
+        assert not failures
+        print(f"✓ {len(CORPUS)} corpus commands parsed correctly")
+
+        return True
+    except Exception as e:
+        print(f"✗ Corpus test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_confidence():
+    """Test slot confidences for explicit, inferred and default values"""
+    print("\n=== Testing Confidence Scores ===")
+    try:
+        from translator import TranslationService
+
+        ts = TranslationService()
+        explicit = ts.parse_command("translate from french to german")
+        assert explicit.score == 1.0
+        inferred = ts.parse_command("translate japanese")
+        assert inferred.confidence['target'] < 1.0 and inferred.confidence['action'] == 1.0
+        defaulted = ts.parse_command("translate from spanish")
+        assert defaulted.confidence['target'] < inferred.confidence['target']
+        unknown = ts.parse_command("translate to klingon")
+        assert unknown.unknown == ['klingon'] and unknown.score < defaulted.score
+        assert ts.parse_command("what time is it").score == 0.0
+        print(f"✓ Explicit {explicit.score:.1f} > inferred {inferred.score:.1f} "
+              f"> defaulted {defaulted.score:.1f} > unknown {unknown.score:.1f}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Confidence test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_source_is_default_target():
+    """Test commands whose source is the default target language"""
+    print("\n=== Testing Source Equal To Default Target ===")
+    try:
+        import os
+        import tempfile
+        from database import Database
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            assert ts.parse_translate_command("translate from english") == ('en', None)
+            assert ts.parse_translate_command("translate from english", all_targets=True) == ('en', [])
+            assert ts.parse_command("translate from english").score == 0.0
+            assert ts.parse_translate_command("translate from spanish") == ('es', 'en')
+            assert ts.parse_translate_command("translate from english to english") == ('en', 'en')
+            print("✓ No secondary target: the target is left open so the user is asked")
+
+            ts.db.set_setting('secondary_target_language', 'ru')
+            ts.db.set_setting('target_language', 'de')
+            ts._settings.clear()
+            assert ts.parse_translate_command("translate from english") == ('en', 'de')
+            assert ts.parse_translate_command("translate from german") == ('de', 'ru')
+            assert ts.parse_translate_command("translate to french") == ('auto', 'fr')
+            print("✓ Default target from settings, secondary target when the source matches it")
+
+        return True
+    except Exception as e:
+        print(f"✗ Default target test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_multiple_targets():
+    """Test commands naming several target languages"""
+    print("\n=== Testing Multiple Targets ===")
+    try:
+        from translator import TranslationService
+
+        ts = TranslationService()
+        cases = {
+            "translate to spanish, french and german": ('auto', ['es', 'fr', 'de']),
+            "translate from english to spanish and french": ('en', ['es', 'fr']),
+            "how do you say thank you in korean and japanese": ('auto', ['ko', 'ja']),
+            "translate russian to english and german": ('ru', ['en', 'de']),
+            "translate to spanish, spanish and italian": ('auto', ['es', 'it']),
+            "translate to spanish and tell me": ('auto', ['es']),
+            "translate to english and finish": ('auto', ['en']),
+            "translate to spanish and check it": ('auto', ['es']),
+            "translate to german and vanish": ('auto', ['de']),
+            "translate to french": ('auto', ['fr']),
+        }
+        for command, expected in cases.items():
+            got = ts.parse_translate_command(command, all_targets=True)
+            assert got == expected, f"{command!r}: expected {expected}, got {got}"
+        assert ts.parse_translate_command("translate to spanish, french and german") == ('auto', 'es')
+        print(f"✓ {len(cases)} single and multi-target commands parsed")
+
+        return True
+    except Exception as e:
+        print(f"✗ Multiple targets test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Command Grammar Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Command Corpus", test_corpus()))
+    results.append(("Confidence Scores", test_confidence()))
+    results.append(("Source Equal To Default Target", test_source_is_default_target()))
+    results.append(("Multiple Targets", test_multiple_targets()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -97,7 +97,6 @@ def test_imports():
         'kivy': 'Kivy UI Framework',
         'whisper': 'OpenAI Whisper',
         'speech_recognition': 'Speech Recognition',
-        'deep_translator': 'Deep Translator',
         'pyttsx3': 'Text-to-Speech',
     }
     
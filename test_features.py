@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared streaming log-mel front end
+Compares incremental features with a one-shot centred STFT
+"""
+
+import sys
+
+
+def reference_log_mel(pcm):
+    """Whisper-style centred STFT computed in one pass"""
+    import numpy as np
+    from features import mel_filters, N_FFT, HOP_LENGTH
+
+    padded = np.pad(pcm, N_FFT // 2, mode='reflect')
+    n_frames = 1 + (len(padded) - N_FFT) // HOP_LENGTH
+    idx = np.arange(N_FFT)[None, :] + HOP_LENGTH * np.arange(n_frames)[:, None]
+    window = 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(N_FFT) / N_FFT)
+    power = np.abs(np.fft.rfft(padded[idx] * window, axis=1)) ** 2
+    return np.log10(np.maximum(power @ mel_filters().T, 1e-10)).T
+
+
+def test_streaming_matches_one_shot():
+    """Test that chunked feeding yields the same frames as a single STFT"""
+    print("\n=== Testing Incremental Features ===")
+    try:
+        import numpy as np
+        from features import LogMelStream
+
+        rng = np.random.default_rng(0)
+        pcm = (0.1 * rng.standard_normal(16000 * 2)).astype(np.float32)
+
+        stream = LogMelStream()
+        pos = 0
+        for size in [100, 60, 3000, 777, 16000, len(pcm)]:
+            stream.feed(pcm[pos:pos + size])
+            pos += size
+
+        expected = reference_log_mel(pcm)
+        got = stream.log_mel(0, stream.frames_total)
+        assert got.shape[0] == 80 and got.shape[1] >= expected.shape[1] - 2, got.shape
+        assert np.allclose(got, expected[:, :got.shape[1]], atol=1e-4), "Streaming frames differ"
+        print(f"✓ {got.shape[1]} streamed frames match the one-shot STFT")
+
+        assert np.array_equal(stream.pcm(0, 100), pcm[:16000]), "PCM ring out of sync with frames"
+        print("✓ PCM kept alongside the frames")
+
+        return True
+    except ImportError:
+        print("ℹ NumPy not available, skipping feature test")
+        return True
+    except Exception as e:
+        print(f"✗ Incremental feature test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_ring_and_whisper_window():
+    """Test ring eviction and the normalised Whisper encoder input"""
+    print("\n=== Testing Feature Ring ===")
+    try:
+        import numpy as np
+        from features import LogMelStream, N_FRAMES
+
+        stream = LogMelStream(capacity_seconds=1)
+        for _ in range(3):
+            stream.feed(np.full(16000, 0.05, dtype=np.float32))
+
+        assert stream.latest(50).shape == (80, 50)
+        print("✓ Latest frames readable from the ring")
+
+        try:
+            stream.log_mel(0, 10)
+            print("✗ Expected evicted frames to be rejected")
+            return False
+        except ValueError:
+            print("✓ Evicted frames rejected")
+
+        start = stream.frames_total - 80
+        window = stream.whisper_mel(start, stream.frames_total)
+        assert window.shape == (80, N_FRAMES), window.shape
+        assert abs(window.max() - (window[:, :80].max())) < 1e-6
+        assert window.min() >= window.max() - 2.0 - 1e-6, "Dynamic range should be clamped to 8 (log10)"
+        print("✓ Whisper window padded to 30 s and normalised")
+
+        return True
+    except ImportError:
+        print("ℹ NumPy not available, skipping ring test")
+        return True
+    except Exception as e:
+        print(f"✗ Feature ring test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_segment_reset():
+    """Test that a reset keeps one utterance's frames independent of the last"""
+    print("\n=== Testing Segment Reset ===")
+    try:
+        import numpy as np
+        from features import LogMelStream, HOP_LENGTH
+
+        rng = np.random.default_rng(1)
+        first = (0.3 * rng.standard_normal(20850)).astype(np.float32)
+        second = (0.1 * rng.standard_normal(11200)).astype(np.float32)
+        expected = reference_log_mel(second)
+
+        carried = LogMelStream()
+        carried.feed(first)
+        start, end = carried.feed(second)
+        assert not np.allclose(carried.log_mel(start, end), expected[:, :end - start], atol=1e-4)
+
+        stream = LogMelStream()
+        first_range = stream.feed(first)
+        before = stream.log_mel(*first_range)
+        stream.reset()
+        start, end = stream.feed(second)
+        assert start * HOP_LENGTH == stream.samples_total - len(second)
+        assert np.allclose(stream.log_mel(start, end), expected[:, :end - start], atol=1e-4)
+        print(f"✓ Frames {start}-{end} after a reset match the utterance on its own")
+
+        stream.reset()
+        n = len(second) // HOP_LENGTH
+        assert stream.frames_total == start + n
+        assert np.allclose(stream.log_mel(start, start + n), expected[:, :n], atol=1e-4)
+        assert np.array_equal(stream.log_mel(*first_range), before)
+        assert np.array_equal(stream.pcm(start, start + n), second)
+        print("✓ Reset completes the tail frames; earlier ranges and PCM stay valid")
+
+        return True
+    except ImportError:
+        print("ℹ NumPy not available, skipping reset test")
+        return True
+    except Exception as e:
+        print(f"✗ Segment reset test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Shared Feature Extraction Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Incremental Features", test_streaming_matches_one_shot()))
+    results.append(("Feature Ring", test_ring_and_whisper_window()))
+    results.append(("Segment Reset", test_segment_reset()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test script for hedged translation requests
+Runs against local stand-in servers, no network required
+"""
+
+import sys
+import time
+
+
+def test_latency_percentiles():
+    """Test the rolling latency percentile used as the hedge delay"""
+    print("\n=== Testing Latency Percentiles ===")
+    try:
+        from hedging import LatencyTracker
+
+        tracker = LatencyTracker(window=100, min_samples=10, default=0.7)
+        assert tracker.percentile('google', 95) == 0.7
+        print("✓ Default delay used until enough samples are seen")
+
+        for i in range(1, 101):
+            tracker.record('google', i / 1000.0)
+        assert abs(tracker.percentile('google', 95) - 0.096) < 1e-9
+        assert abs(tracker.percentile('google', 50) - 0.051) < 1e-9
+        for _ in range(100):
+            tracker.record('google', 0.5)
+        assert tracker.percentile('google', 50) == 0.5
+        print("✓ Percentiles follow the most recent window")
+
+        return True
+    except Exception as e:
+        print(f"✗ Latency percentile test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_hedger_race():
+    """Test that the faster call wins and failures fall back"""
+    print("\n=== Testing Hedger ===")
+    try:
+        from hedging import Hedger
+
+        hedger = Hedger()
+
+        def slow():
+            time.sleep(0.3)
+            return 'primary'
+
+        def fast():
+            return 'backup'
+
+        def broken():
+            raise ConnectionError("backup down")
+
+        assert hedger.call(fast, slow, 0.2) == ('backup', False, False)
+        print("✓ Fast primary answers without hedging")
+
+        start = time.monotonic()
+        assert hedger.call(slow, fast, 0.05) == ('backup', True, True)
+        assert time.monotonic() - start < 0.2
+        print("✓ Slow primary hedged, backup result returned early")
+
+        assert hedger.call(slow, broken, 0.05) == ('primary', True, False)
+        print("✓ Failing backup falls back to the primary")
+
+        def failing():
+            raise ConnectionError("primary down")
+
+        start = time.monotonic()
+        assert hedger.call(failing, fast, 1.0) == ('backup', True, True)
+        assert time.monotonic() - start < 0.1
+        print("✓ Primary failing at once starts the backup without waiting")
+
+        picky = Hedger(retryable=lambda error: isinstance(error, ConnectionError))
+        try:
+            picky.call(lambda: int('x'), fast, 1.0)
+            print("✗ Expected the primary's ValueError")
+            return False
+        except ValueError:
+            pass
+        assert picky.stats()['fired'] == 0
+        picky.close()
+        print("✓ Non-retryable primary error raised without a backup")
+
+        assert hedger.stats() == {'fired': 3, 'won': 2, 'win_rate': 2 / 3}
+        hedger.close()
+        print("✓ Hedge statistics counted")
+
+        return True
+    except Exception as e:
+        print(f"✗ Hedger test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_hedged_translation():
+    """Test hedging from a slow Google endpoint to DeepL"""
+    print("\n=== Testing Hedged Translation ===")
+    try:
+        import os
+        import tempfile
+        from database import Database
+        from hedging import LatencyTracker
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, create_session
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                StandInServer(delay=0.5) as slow, StandInServer() as fast:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.latency = LatencyTracker(default=0.05)
+            ts.clients = ClientPool(session=create_session(), provider_options={
+                'google': {'base_url': slow.url + '/translate_a/single'},
+                'deepl': {'base_url': fast.url + '/v2/translate'},
+            })
+            ts.db.set_setting('deepl_api_key', 'test-key')
+            ts.db.set_setting('translation_hedging', 'true')
+
+            start = time.monotonic()
+            result = ts.translate_or_raise('where is the station', 'de', 'en')
+            elapsed = time.monotonic() - start
+            assert result == '[DE] WHERE IS THE STATION', result
+            assert elapsed < 0.4, f"Hedge did not cut latency ({elapsed:.2f}s)"
+            assert ts.hedge_stats()['won'] == 1
+            assert ts.db.get_stat('hedge_fired') == 1 and ts.db.get_stat('hedge_won') == 1
+            print(f"✓ Slow Google call hedged to DeepL, answered in {elapsed * 1000:.0f} ms")
+
+            ts.db.set_setting('translation_hedging', 'false')
+            ts._settings.clear()
+            result = ts.translate_or_raise('good night', 'de', 'en')
+            assert result == '[de] GOOD NIGHT'
+            assert ts.hedge_stats()['fired'] == 1
+            print("✓ Hedging is off unless enabled in settings")
+
+        return True
+    except Exception as e:
+        print(f"✗ Hedged translation test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Hedged Translation Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Latency Percentiles", test_latency_percentiles()))
+    results.append(("Hedger", test_hedger_race()))
+    results.append(("Hedged Translation", test_hedged_translation()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Test script for local language identification
+"""
+
+import sys
+
+# Held-out sentences (not in language_samples.py): (code, sentence)
+HELD_OUT = [
+    ('en', "Is there a pharmacy open on Sunday?"),
+    ('en', "My flight was cancelled because of the storm."),
+    ('en', "Can you recommend a good restaurant around here?"),
+    ('en', "I lost my wallet somewhere on the way to the office."),
+    ('en', "Please speak more slowly."),
+    ('es', "¿Hay alguna farmacia abierta el domingo?"),
+    ('es', "Mi vuelo fue cancelado por culpa de la tormenta."),
+    ('es', "¿Puede recomendarme un buen restaurante por aquí?"),
+    ('es', "Perdí mi cartera en algún lugar camino a la oficina."),
+    ('es', "Hable más despacio, por favor."),
+    ('fr', "Y a-t-il une pharmacie ouverte le dimanche ?"),
+    ('fr', "Mon vol a été annulé à cause de la tempête."),
+    ('fr', "Pouvez-vous me recommander un bon restaurant dans le coin ?"),
+    ('fr', "J'ai perdu mon portefeuille sur le chemin du bureau."),
+    ('fr', "Parlez plus lentement, s'il vous plaît."),
+    ('de', "Gibt es eine Apotheke, die am Sonntag geöffnet hat?"),
+    ('de', "Mein Flug wurde wegen des Sturms gestrichen."),
+    ('de', "Können Sie mir ein gutes Restaurant hier in der Nähe empfehlen?"),
+    ('de', "Ich habe meine Geldbörse auf dem Weg ins Büro verloren."),
+    ('de', "Bitte sprechen Sie etwas langsamer."),
+    ('it', "C'è una farmacia aperta la domenica?"),
+    ('it', "Il mio volo è stato cancellato a causa della tempesta."),
+    ('it', "Mi può consigliare un buon ristorante qui vicino?"),
+    ('it', "Ho perso il portafoglio mentre andavo in ufficio."),
+    ('it', "Parli più lentamente, per favore."),
+    ('pt', "Há alguma farmácia aberta no domingo?"),
+    ('pt', "O meu voo foi cancelado por causa da tempestade."),
+    ('pt', "Você pode me recomendar um bom restaurante aqui perto?"),
+    ('pt', "Perdi a minha carteira no caminho para o escritório."),
+    ('pt', "Fale mais devagar, por favor."),
+    ('nl', "Is er op zondag een apotheek open?"),
+    ('nl', "Mijn vlucht is geannuleerd vanwege de storm."),
+    ('nl', "Kunt u een goed restaurant hier in de buurt aanraden?"),
+    ('nl', "Ik ben mijn portemonnee kwijtgeraakt op weg naar kantoor."),
+    ('nl', "Wilt u alstublieft wat langzamer praten?"),
+    ('pl', "Czy jest jakaś apteka otwarta w niedzielę?"),
+    ('pl', "Mój lot został odwołany z powodu burzy."),
+    ('pl', "Czy może pan polecić dobrą restaurację w okolicy?"),
+    ('pl', "Zgubiłem portfel gdzieś w drodze do biura."),
+    ('pl', "Proszę mówić wolniej."),
+    ('tr', "Pazar günü açık bir eczane var mı?"),
+    ('tr', "Uçuşum fırtına yüzünden iptal edildi."),
+    ('tr', "Buralarda iyi bir restoran önerebilir misiniz?"),
+    ('tr', "Ofise giderken cüzdanımı bir yerde kaybettim."),
+    ('tr', "Lütfen daha yavaş konuşun."),
+    ('ru', "Есть ли аптека, которая работает в воскресенье?"),
+    ('ru', "Мой рейс отменили из-за шторма."),
+    ('ru', "Не могли бы вы посоветовать хороший ресторан поблизости?"),
+    ('ru', "Я потерял кошелёк где-то по дороге в офис."),
+    ('ru', "Говорите, пожалуйста, помедленнее."),
+    ('uk', "Чи є аптека, яка працює в неділю?"),
+    ('uk', "Мій рейс скасували через шторм."),
+    ('uk', "Чи не могли б ви порадити гарний ресторан поблизу?"),
+    ('uk', "Я загубив гаманець десь по дорозі до офісу."),
+    ('uk', "Говоріть, будь ласка, повільніше."),
+    ('ar', "هل توجد صيدلية مفتوحة يوم الأحد؟"),
+    ('ar', "تم إلغاء رحلتي بسبب العاصفة."),
+    ('ar', "تكلم ببطء من فضلك."),
+    ('hi', "क्या रविवार को कोई दवा की दुकान खुली है?"),
+    ('hi', "तूफ़ान की वजह से मेरी उड़ान रद्द हो गई।"),
+    ('hi', "कृपया धीरे बोलिए।"),
+    ('ja', "日曜日に開いている薬局はありますか？"),
+    ('ja', "嵐のせいで飛行機が欠航になりました。"),
+    ('ja', "もう少しゆっくり話してください。"),
+    ('ko', "일요일에 문 여는 약국이 있나요?"),
+    ('ko', "폭풍 때문에 비행기가 취소됐어요."),
+    ('ko', "좀 더 천천히 말해 주세요."),
+    ('zh-CN', "星期天有开门的药店吗？"),
+    ('zh-CN', "因为暴风雨，我的航班被取消了。"),
+    ('zh-CN', "请说慢一点。"),
+]
+
+# Languages the identifier must not report, mostly close relatives of
+# supported ones (not in language_samples.py): (code, sentence)
+OUT_OF_SET = [
+    ('sr', "Да ли постоји апотека која ради у недељу?"),
+    ('sr', "Мој лет је отказан због олује."),
+    ('sr', "Можете ли ми препоручити добар ресторан у близини?"),
+    ('sr', "Изгубио сам новчаник негде на путу до канцеларије."),
+    ('bg', "Има ли аптека, която работи в неделя?"),
+    ('bg', "Полетът ми беше отменен заради бурята."),
+    ('bg', "Можете ли да ми препоръчате добър ресторант наблизо?"),
+    ('bg', "Загубих портфейла си някъде по пътя към офиса."),
+    ('be', "Ці ёсць аптэка, якая працуе ў нядзелю?"),
+    ('be', "Мой рэйс адмянілі з-за шторму."),
+    ('be', "Ці не маглі б вы параіць добры рэстаран побач?"),
+    ('gl', "Hai algunha farmacia aberta o domingo?"),
+    ('gl', "O meu voo foi cancelado por mor da tormenta."),
+    ('gl', "Podes recomendarme un bo restaurante por aquí preto?"),
+    ('ca', "Hi ha alguna farmàcia oberta diumenge?"),
+    ('ca', "El meu vol ha estat cancel·lat a causa de la tempesta."),
+    ('ca', "Em pot recomanar un bon restaurant per aquí a prop?"),
+    ('ca', "He perdut la cartera en algun lloc de camí a l'oficina."),
+    ('da', "Er der et apotek, der har åbent om søndagen?"),
+    ('da', "Mit fly blev aflyst på grund af stormen."),
+    ('da', "Kan du anbefale en god restaurant i nærheden?"),
+    ('sv', "Finns det något apotek som har öppet på söndag?"),
+    ('sv', "Mitt flyg blev inställt på grund av stormen."),
+    ('sv', "Kan du rekommendera en bra restaurang i närheten?"),
+    ('af', "Is daar 'n apteek wat op Sondag oop is?"),
+    ('af', "My vlug is gekanselleer weens die storm."),
+    ('af', "Kan jy 'n goeie restaurant hier naby aanbeveel?"),
+    ('ro', "Există o farmacie deschisă duminica?"),
+    ('ro', "Zborul meu a fost anulat din cauza furtunii."),
+    ('ro', "Îmi puteți recomanda un restaurant bun prin apropiere?"),
+    ('id', "Apakah ada apotek yang buka pada hari Minggu?"),
+    ('id', "Penerbangan saya dibatalkan karena badai."),
+    ('id', "Bisakah Anda merekomendasikan restoran yang bagus di dekat sini?"),
+    ('ms', "Adakah farmasi yang dibuka pada hari Ahad?"),
+    ('ms', "Penerbangan saya dibatalkan kerana ribut."),
+    ('ms', "Bolehkah anda mencadangkan restoran yang baik berhampiran?"),
+]
+
+
+def test_accuracy():
+    """Test identification accuracy on held-out sentences"""
+    print("\n=== Testing Accuracy ===")
+    try:
+        from language_id import LanguageIdentifier
+
+        identifier = LanguageIdentifier()
+        misses = []
+        for code, sentence in HELD_OUT:
+            got = identifier.identify(sentence)[0]
+            if got != code:
+                misses.append(f"{sentence!r}: expected {code}, got {got}")
+        for miss in misses:
+            print(f"  miss: {miss}")
+        accuracy = 1 - len(misses) / len(HELD_OUT)
+        assert accuracy >= 0.9, f"accuracy {accuracy:.0%}"
+        print(f"✓ {accuracy:.0%} of {len(HELD_OUT)} held-out sentences identified")
+
+        assert identifier.detect('ok') is None
+        assert identifier.detect('12:30 ???') is None
+        assert identifier.detect('Where is the nearest pharmacy, please?') == 'en'
+        print("✓ Too-short input is left to the provider")
+
+        return True
+    except Exception as e:
+        print(f"✗ Accuracy test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_out_of_set():
+    """Test that related languages the model does not report are left 'auto'"""
+    print("\n=== Testing Out-of-Set Rejection ===")
+    try:
+        from language_id import LanguageIdentifier
+
+        identifier = LanguageIdentifier()
+        leaked = [(code, sentence, identifier.detect(sentence)) for code, sentence in OUT_OF_SET
+                  if identifier.detect(sentence) is not None]
+        for code, sentence, detected in leaked:
+            print(f"  leaked: {sentence!r} ({code}) -> {detected}")
+        assert len(leaked) <= len(OUT_OF_SET) // 10, f"{len(leaked)} leaked"
+        print(f"✓ {len(OUT_OF_SET) - len(leaked)} of {len(OUT_OF_SET)} out-of-set sentences left to the provider")
+
+        wrong = [sentence for code, sentence in HELD_OUT
+                 if identifier.detect(sentence) not in (None, code)]
+        assert not wrong, wrong
+        print("✓ No held-out sentence detected as the wrong language")
+
+        return True
+    except Exception as e:
+        print(f"✗ Out-of-set test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_service_detection():
+    """Test explicit sources, cache buckets and the source == target shortcut"""
+    print("\n=== Testing Service Detection ===")
+    try:
+        import os
+        import tempfile
+        from database import Database
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, create_session
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer() as server:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.clients = ClientPool(session=create_session(),
+                                    base_url=server.url + '/translate_a/single')
+
+            text = 'Wo ist der nächste Bahnhof, bitte?'
+            assert ts.translate_or_raise(text, 'de', 'de') == text
+            assert server.requests == [] and ts.db.get_stat('translation_short_circuit') == 1
+            print("✓ Explicit German to German returned without a provider call")
+
+            ts.translate_or_raise(text, 'en')
+            assert len(server.requests) == 1 and server.requests[0][1]['sl'] == ['auto']
+            assert ts.cache.get(text, 'de', 'en', 'google') is not None
+            print("✓ Provider detects the source; the local guess only files the cache entry")
+
+            assert ts.translate_or_raise(text, 'en', 'de') is not None
+            assert len(server.requests) == 1
+            print("✓ An explicit German request reuses that cache entry")
+
+            ts.translate_or_raise(text, 'de')
+            assert len(server.requests) == 2 and server.requests[1][1]['sl'] == ['auto']
+            assert ts.db.get_stat('translation_short_circuit') == 1
+            serbian = 'Изгубио сам новчаник негде на путу до канцеларије.'
+            ts.translate_or_raise(serbian, 'ru')
+            assert server.requests[2][1]['sl'] == ['auto']
+            print("✓ A detected source is never trusted to skip translation")
+
+            ts.db.set_setting('local_language_id', 'false')
+            ts._settings.clear()
+            ts.translate_or_raise('Wo ist das Museum, bitte?', 'en')
+            assert server.requests[3][1]['sl'] == ['auto']
+            print("✓ Disabled by the local_language_id setting")
+
+        return True
+    except Exception as e:
+        print(f"✗ Service detection test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Language Identification Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Accuracy", test_accuracy()))
+    results.append(("Out-of-Set Rejection", test_out_of_set()))
+    results.append(("Service Detection", test_service_detection()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
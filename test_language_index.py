@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test script for the language index and fuzzy language lookup
+"""
+
+import sys
+import time
+
+
+def test_exact_lookup():
+    """Test English names, native names, misspellings and ISO codes"""
+    print("\n=== Testing Exact Lookup ===")
+    try:
+        from language_index import LANGUAGES
+
+        cases = {
+            'german': 'de', 'Deutsch': 'de', 'español': 'es', '日本語': 'ja',
+            'rushian': 'ru', 'mandarin': 'zh-CN', 'zh': 'zh-CN', 'deu': 'de',
+            'he': 'iw', 'hebrew': 'iw', 'fr': 'fr', 'en-gb': 'en',
+        }
+        for name, code in cases.items():
+            assert LANGUAGES.code(name) == code, f"{name}: {LANGUAGES.code(name)}"
+            assert LANGUAGES.lookup(name) == (code, 0)
+        print(f"✓ {len(cases)} names, native names, misspellings and codes resolved exactly")
+
+        assert LANGUAGES.validate('auto', allow_auto=True) == 'auto'
+        assert LANGUAGES.validate('he') == 'iw'
+        try:
+            LANGUAGES.validate('klingon')
+            print("✗ Expected ValueError for an unknown language")
+            return False
+        except ValueError as e:
+            print(f"✓ Unknown language rejected: {e}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Exact lookup test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_fuzzy_lookup():
+    """Test bounded fuzzy matching against a brute-force scan"""
+    print("\n=== Testing Fuzzy Lookup ===")
+    try:
+        from language_index import LANGUAGES, NgramIndex, edit_distance, max_typos
+
+        assert LANGUAGES.fuzzy('germn') == ('de', 1)
+        assert LANGUAGES.fuzzy('portugueze') == ('pt', 1)
+        assert LANGUAGES.fuzzy('klingon') is None
+        assert LANGUAGES.fuzzy('shakespeare') is None
+        assert LANGUAGES.fuzzy('it') is None, "short words must match exactly"
+        print("✓ Misheard names resolve; unrelated and short words do not")
+
+        names = [name for name in LANGUAGES.phrase_names() if name.isascii() and ' ' not in name]
+        index = NgramIndex(names)
+        queries = ['germn', 'rusian', 'frensh', 'italien', 'japanse', 'swahilli',
+                   'klingon', 'toronto', 'tomorrow', 'potato', 'schedule', 'koreen']
+        for query in queries:
+            bound = max(max_typos(query), 1)
+            expected = sorted((edit_distance(query, name), name) for name in names
+                              if edit_distance(query, name) <= bound)
+            assert index.search(query, bound) == expected, query
+        print(f"✓ Index search matches a brute-force scan for {len(queries)} queries")
+
+        rounds = 2000
+        start = time.perf_counter()
+        for _ in range(rounds):
+            LANGUAGES.code('german')
+        exact = (time.perf_counter() - start) / rounds * 1e6
+        start = time.perf_counter()
+        for _ in range(rounds // 10):
+            LANGUAGES.fuzzy('shakespeare')
+        fuzzy = (time.perf_counter() - start) / (rounds // 10) * 1e6
+        print(f"✓ Exact lookup {exact:.2f} µs, fuzzy miss {fuzzy:.1f} µs")
+
+        return True
+    except Exception as e:
+        print(f"✗ Fuzzy lookup test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_service_validation():
+    """Test that unknown languages fail before any provider request"""
+    print("\n=== Testing Service Validation ===")
+    try:
+        import os
+        import tempfile
+        from database import Database
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, create_session
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer() as server:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.clients = ClientPool(session=create_session(),
+                                    base_url=server.url + '/translate_a/single')
+
+            source, target = ts.parse_translate_command("translate to klingon")
+            try:
+                ts.translate_or_raise('hello', target, source)
+                print("✗ Expected ValueError for target 'klingon'")
+                return False
+            except ValueError:
+                pass
+            result = ts.translate('hello', 'xx')
+            assert result.startswith('Translation error') and 'xx' in result
+            assert server.requests == [], server.requests
+            print("✓ Unknown targets rejected without a network call")
+
+            assert ts.translate_or_raise('hello', 'german', 'english') == '[de] HELLO'
+            assert ts._language_to_code('rushian') == 'ru'
+            print("✓ Names and misspellings are normalised to provider codes")
+
+        return True
+    except Exception as e:
+        print(f"✗ Service validation test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Language Index Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Exact Lookup", test_exact_lookup()))
+    results.append(("Fuzzy Lookup", test_fuzzy_lookup()))
+    results.append(("Service Validation", test_service_validation()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
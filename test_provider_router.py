@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Test script for latency-aware provider routing and circuit breaking
+Runs against local stand-in servers, no network required
+"""
+
+import sys
+import time
+
+
+def test_routing_order():
+    """Test that the healthiest provider is preferred"""
+    print("\n=== Testing Routing Order ===")
+    try:
+        from provider_router import ProviderRouter
+
+        router = ProviderRouter(preference=2.0)
+        assert router.route('deepl', ['google', 'deepl']) == ['deepl', 'google']
+        print("✓ Preferred provider first before any measurements")
+
+        for _ in range(5):
+            router.record_success('google', 0.1)
+            router.record_success('deepl', 0.15)
+        assert router.route('deepl', ['google', 'deepl']) == ['deepl', 'google']
+        for _ in range(20):
+            router.record_success('deepl', 1.0)
+        assert router.route('deepl', ['google', 'deepl']) == ['google', 'deepl']
+        print("✓ Preference kept while close, overridden when much slower")
+
+        assert 'google 100 ms 0% err' in router.describe()
+        print(f"✓ Routing state: {router.describe()}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Routing order test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_circuit_breaker():
+    """Test opening, half-open probing and closing of a circuit"""
+    print("\n=== Testing Circuit Breaker ===")
+    try:
+        from provider_router import ProviderRouter, CircuitOpenError
+
+        changes = []
+        router = ProviderRouter(cooldown=0.1, max_consecutive_failures=3,
+                                on_change=lambda: changes.append(router.snapshot()['google']['state']))
+        for _ in range(3):
+            router.record_failure('google')
+        assert router.snapshot()['google']['state'] == 'open'
+        assert changes == ['closed', 'closed', 'open']
+        try:
+            router.route('google', ['google'])
+            print("✗ Expected CircuitOpenError")
+            return False
+        except CircuitOpenError:
+            print("✓ Circuit opens after 3 failures and rejects requests at once")
+
+        time.sleep(0.12)
+        assert router.route('google', ['google']) == ['google']
+        assert router.snapshot()['google']['state'] == 'half-open'
+        try:
+            router.route('google', ['google'])
+            print("✗ Only one probe should be let through")
+            return False
+        except CircuitOpenError:
+            pass
+        router.record_failure('google')
+        assert router.snapshot()['google']['state'] == 'open'
+        print("✓ Single half-open probe; a failed probe reopens the circuit")
+
+        time.sleep(0.12)
+        router.route('google', ['google'])
+        router.record_success('google', 0.2)
+        assert router.snapshot()['google']['state'] == 'closed'
+        assert router.route('google', ['google']) == ['google']
+        assert changes[3:] == ['half-open', 'open', 'half-open', 'closed'], changes
+        print("✓ Successful probe closes the circuit; every change reported")
+
+        return True
+    except Exception as e:
+        print(f"✗ Circuit breaker test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_throttled_provider_failover():
+    """Test that a throttling provider is skipped instead of awaited"""
+    print("\n=== Testing Failover ===")
+    try:
+        import os
+        import tempfile
+        from database import Database
+        from provider_router import CircuitOpenError, ProviderRouter
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, create_session
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                StandInServer(fail_status=429) as throttled, StandInServer() as healthy:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.clients = ClientPool(session=create_session(), provider_options={
+                'google': {'base_url': throttled.url + '/translate_a/single'},
+                'deepl': {'base_url': healthy.url + '/v2/translate'},
+            })
+
+            rejected = 0
+            for i in range(6):
+                try:
+                    ts.translate_or_raise(f'sentence {i}', 'de', 'en')
+                except CircuitOpenError:
+                    rejected += 1
+                except Exception:
+                    pass
+            assert rejected == 3, rejected
+            assert len(throttled.requests) == 3, len(throttled.requests)
+            print("✓ Throttled provider skipped once its circuit opened")
+
+            ts.db.set_setting('deepl_api_key', 'test-key')
+            ts._settings.clear()
+            assert ts.translate_or_raise('platform four', 'de', 'en') == '[DE] PLATFORM FOUR'
+            assert len(throttled.requests) == 3
+            assert ts.router.snapshot()['deepl']['state'] == 'closed'
+            print(f"✓ Traffic routed to DeepL ({ts.router.describe()})")
+
+            ts.db.set_setting('deepl_api_key', '')
+            ts._settings.clear()
+            ts.router = ProviderRouter(cooldown=0.05, max_consecutive_failures=1)
+            ts.router.record_failure('google')
+            time.sleep(0.06)
+            results = ts.translate_batch(['gate two', 'gate three'], 'de', 'en')
+            assert all(result['error'] for result in results)
+            assert ts.router.snapshot()['google']['state'] == 'open'
+            ts.clients = ClientPool(session=create_session(), provider_options={
+                'google': {'base_url': healthy.url + '/translate_a/single'},
+            })
+            time.sleep(0.06)
+            results = ts.translate_batch(['gate two', 'gate three'], 'de', 'en')
+            assert [result['error'] for result in results] == [None, None]
+            assert ts.router.snapshot()['google']['state'] == 'closed'
+            print("✓ Batch requests report the outcome of their half-open probe")
+
+            ts.db.set_setting('translation_api', 'deepl')
+            ts._settings.clear()
+            ts.clients = ClientPool(session=create_session(), provider_options={
+                'google': {'base_url': healthy.url + '/translate_a/single'},
+                'deepl': {'base_url': healthy.url + '/v2/translate'},
+            })
+            assert ts._available_providers('deepl', 'en', 'hi') == ['google']
+            deepl_requests = sum(1 for provider, _ in healthy.requests if provider == 'deepl')
+            assert ts.translate_or_raise('good night', 'hi', 'en')
+            assert healthy.requests[-1][0] == 'google'
+            assert sum(1 for provider, _ in healthy.requests if provider == 'deepl') == deepl_requests
+            print("✓ Hindi, which DeepL does not offer, goes to Google even with DeepL selected")
+
+        return True
+    except Exception as e:
+        print(f"✗ Failover test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Provider Router Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Routing Order", test_routing_order()))
+    results.append(("Circuit Breaker", test_circuit_breaker()))
+    results.append(("Failover", test_throttled_provider_failover()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-provider token-bucket rate limiter
+"""
+
+import sys
+import threading
+import time
+
+
+def test_token_bucket():
+    """Test burst allowance and steady-state rate"""
+    print("\n=== Testing Token Bucket ===")
+    try:
+        from rate_limiter import RateLimiter
+
+        limiter = RateLimiter('google', rate=20, burst=3)
+        start = time.monotonic()
+        waits = [limiter.acquire() for _ in range(7)]
+        elapsed = time.monotonic() - start
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert 0.17 <= elapsed < 0.35, f"4 extra tokens at 20/s took {elapsed:.3f}s"
+        print(f"✓ Burst of 3 immediate, then 20/s ({elapsed * 1000:.0f} ms for 7 requests)")
+
+        return True
+    except Exception as e:
+        print(f"✗ Token bucket test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_priorities():
+    """Test that interactive requests overtake queued batch requests"""
+    print("\n=== Testing Priorities ===")
+    try:
+        from rate_limiter import RateLimiter, INTERACTIVE, BATCH
+
+        limiter = RateLimiter('google', rate=10, burst=1)
+        limiter.acquire()
+        order = []
+
+        def request(name, priority):
+            limiter.acquire(priority)
+            order.append(name)
+
+        threads = [threading.Thread(target=request, args=(f'batch{i}', BATCH)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.005)
+        threads.append(threading.Thread(target=request, args=('voice', INTERACTIVE)))
+        threads[-1].start()
+        for thread in threads:
+            thread.join()
+
+        assert order == ['voice', 'batch0', 'batch1', 'batch2'], order
+        print(f"✓ Served in order {order}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Priority test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_load_shedding():
+    """Test that a full queue sheds requests with a clear error"""
+    print("\n=== Testing Load Shedding ===")
+    try:
+        from rate_limiter import RateLimiter, LoadShedError
+
+        limiter = RateLimiter('google', rate=0.5, burst=1, max_queue=2, max_wait=0.3)
+        limiter.acquire()
+        errors = []
+
+        def request():
+            try:
+                limiter.acquire()
+            except LoadShedError as e:
+                errors.append(e)
+
+        waiting = [threading.Thread(target=request) for _ in range(2)]
+        for thread in waiting:
+            thread.start()
+        time.sleep(0.05)
+        try:
+            limiter.acquire()
+            print("✗ Expected LoadShedError")
+            return False
+        except LoadShedError as e:
+            assert 'too busy' in str(e)
+            print(f"✓ Request beyond queue depth refused at once: {e}")
+        for thread in waiting:
+            thread.join()
+        assert len(errors) == 2 and 'rate limited' in str(errors[0])
+        assert limiter.stats()['shed'] == 3 and limiter.stats()['waiting'] == 0
+        print("✓ Requests that wait past max_wait are shed too")
+
+        return True
+    except Exception as e:
+        print(f"✗ Load shedding test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_deadline_capped_wait():
+    """Test that a queued request gives up at its caller's deadline"""
+    print("\n=== Testing Deadline-Capped Wait ===")
+    try:
+        import os
+        import tempfile
+        from database import Database
+        from rate_limiter import RateLimiter, LoadShedError
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, create_session
+        from translation_engine import AsyncTranslationEngine
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        limiter = RateLimiter('google', rate=0.1, burst=1, max_wait=10.0)
+        limiter.acquire()
+        start = time.monotonic()
+        try:
+            limiter.acquire(deadline=start + 0.1)
+            print("✗ Expected LoadShedError")
+            return False
+        except LoadShedError as e:
+            assert 'deadline' in str(e)
+            assert time.monotonic() - start < 0.2
+            print(f"✓ Wait capped at the deadline, not max_wait: {e}")
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer() as server:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.clients = ClientPool(session=create_session(),
+                                    base_url=server.url + '/translate_a/single')
+            ts.db.set_setting('rate_limit_google', '0.1')
+            ts.db.set_setting('rate_burst_google', '1')
+            engine = AsyncTranslationEngine(ts, timeout=0.3)
+            engine.translate('first', 'fr', 'en')
+            start = time.monotonic()
+            try:
+                engine.translate('second', 'fr', 'en')
+                print("✗ Expected the request to time out")
+                return False
+            except Exception:
+                pass
+            time.sleep(0.1)
+            stats = ts.rate_limit_stats()['google']
+            engine.close()
+            assert stats['waiting'] == 0 and stats['shed'] == 1, stats
+            assert len(server.requests) == 1
+            print(f"✓ Engine deadline released the queued provider call after "
+                  f"{(time.monotonic() - start) * 1000:.0f} ms")
+
+        return True
+    except Exception as e:
+        print(f"✗ Deadline-capped wait test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_service_rate_limit():
+    """Test that TranslationService paces provider calls from settings"""
+    print("\n=== Testing Service Rate Limit ===")
+    try:
+        import os
+        import tempfile
+        from database import Database
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, create_session
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer() as server:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.clients = ClientPool(session=create_session(),
+                                    base_url=server.url + '/translate_a/single')
+            ts.db.set_setting('rate_limit_google', '20')
+            ts.db.set_setting('rate_burst_google', '2')
+
+            start = time.monotonic()
+            for i in range(6):
+                ts.translate_or_raise(f'announcement {i}', 'fr', 'en')
+            elapsed = time.monotonic() - start
+            assert len(server.requests) == 6
+            assert elapsed >= 0.18, f"6 calls at 20/s with burst 2 took only {elapsed:.3f}s"
+            assert ts.rate_limit_stats()['google']['granted'] == 6
+            print(f"✓ Provider calls paced to the configured rate ({elapsed * 1000:.0f} ms for 6)")
+
+        return True
+    except Exception as e:
+        print(f"✗ Service rate limit test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Rate Limiter Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Token Bucket", test_token_bucket()))
+    results.append(("Priorities", test_priorities()))
+    results.append(("Load Shedding", test_load_shedding()))
+    results.append(("Deadline-Capped Wait", test_deadline_capped_wait()))
+    results.append(("Service Rate Limit", test_service_rate_limit()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Test script for speculative translation of partial transcripts
+Uses a slow stand-in service so speculation has something to overlap
+"""
+
+import sys
+import threading
+import time
+
+from rate_limiter import BATCH, INTERACTIVE
+
+
+class SlowService:
+    """Translates after a delay that grows with the text and records every call"""
+
+    def __init__(self, base=0.1, per_word=0.05):
+        self.base = base
+        self.per_word = per_word
+        self.calls = []
+        self.priorities = []
+        self.lock = threading.Lock()
+
+    def translate_or_raise(self, text, target_lang, source_lang='auto', priority=INTERACTIVE, **options):
+        with self.lock:
+            self.calls.append(text)
+            self.priorities.append(priority)
+        time.sleep(self.base + self.per_word * len(text.split()))
+        return f"<{text}>"
+
+
+def feed_all(speculation, partials, pause=0.1):
+    for partial in partials:
+        speculation.feed(partial)
+        time.sleep(pause)
+
+
+def test_unpunctuated():
+    """Test that fragments of an unpunctuated phrase are never translated alone"""
+    print("\n=== Testing Unpunctuated Partials ===")
+    try:
+        from speculative_translation import SpeculativeTranslation
+        from translation_engine import AsyncTranslationEngine
+
+        service = SlowService()
+        engine = AsyncTranslationEngine(service, timeout=5)
+        speculation = SpeculativeTranslation(engine, 'de')
+        feed_all(speculation, ["i would like", "i would like to book", "i would like to book a table",
+                               "i would like to book a table for two",
+                               "i would like to book a table for two tonight"])
+        translation, report = speculation.finish("i would like to book a table for two tonight")
+        engine.close()
+        assert translation == "<i would like to book a table for two tonight>", translation
+        assert service.calls == ["i would like to book a table for two tonight"], service.calls
+        assert service.priorities == [INTERACTIVE]
+        assert report['speculated'] == 0 and report['chunks'] == 1 and report['saved'] == 0.0
+        print("✓ No sentence end, so the final transcript is translated in one piece")
+
+        return True
+    except Exception as e:
+        print(f"✗ Unpunctuated test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_sentences():
+    """Test that stable sentences are translated while the user keeps speaking"""
+    print("\n=== Testing Sentences ===")
+    try:
+        from speculative_translation import SpeculativeTranslation
+        from translation_engine import AsyncTranslationEngine
+
+        service = SlowService()
+        engine = AsyncTranslationEngine(service, timeout=5)
+        words = "Please tell the driver. We need to stop at the hotel. Then the airport".split()
+        speculation = SpeculativeTranslation(engine, 'de')
+        partials = []
+        for count in range(2, len(words) + 1):
+            partials += [' '.join(words[:count])] * 2
+        feed_all(speculation, partials, pause=0.05)
+        parts = []
+        translation, report = speculation.finish(' '.join(words),
+                                                 on_part=lambda part: parts.append((part, time.monotonic())))
+        finished = time.monotonic()
+        engine.close()
+        assert service.calls == ["Please tell the driver.", "We need to stop at the hotel.",
+                                 "Then the airport"], service.calls
+        assert service.priorities == [BATCH, BATCH, INTERACTIVE]
+        assert translation == "<Please tell the driver.> <We need to stop at the hotel.> <Then the airport>"
+        assert report['reused'] == 2 and report['speculated'] == 2 and report['saved'] > 0, report
+        print(f"✓ {len(partials)} partials cost {len(service.calls)} provider calls, one per sentence; "
+              f"saved {report['saved'] * 1000:.0f} ms")
+        print("✓ Speculative sentences sent at batch priority, the rest at interactive")
+        assert [part for part, _ in parts] == ["<Please tell the driver.>", "<We need to stop at the hotel.>",
+                                               "<Then the airport>"]
+        assert finished - parts[0][1] > 0.1
+        print(f"✓ First sentence handed on {(finished - parts[0][1]) * 1000:.0f} ms before the whole answer")
+
+        return True
+    except Exception as e:
+        print(f"✗ Sentences test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_patching():
+    """Test revisions, case changes and the fallback to a fresh translation"""
+    print("\n=== Testing Patching ===")
+    try:
+        from speculative_translation import SpeculativeTranslation, _join
+        from translation_engine import AsyncTranslationEngine
+
+        service = SlowService(base=0.05)
+        engine = AsyncTranslationEngine(service, timeout=5)
+        speculation = SpeculativeTranslation(engine, 'fr')
+        speculation.feed("Where is the station. I need a")
+        speculation.feed("Where is the station. I need a tax")
+        time.sleep(0.3)
+
+        translation, report = speculation.finish("Where is the station. I need a taxi.")
+        assert translation == "<Where is the station.> <I need a taxi.>", translation
+        assert report['reused'] == 1 and report['patched'] == 1, report
+        assert service.calls.count("Where is the station.") == 1
+        print("✓ Sentence reused, the rest translated at finalisation")
+
+        service.calls.clear()
+        speculation = SpeculativeTranslation(engine, 'fr')
+        speculation.feed("Please call a doctor. Now")
+        speculation.feed("Please call a doctor. Now please")
+        speculation.feed("Police called the doctor. Now please")
+        translation, report = speculation.finish("Police called the doctor. Now please")
+        assert translation == "<Police called the doctor. Now please>"
+        assert service.calls == ["Please call a doctor.", "Police called the doctor. Now please"]
+        assert report['reused'] == 0 and report['cancelled'] == 1 and report['saved'] == 0.0
+        print("✓ A revised sentence is cancelled and the transcript translated afresh")
+
+        speculation.feed("police called the doctor again today")
+        assert len(service.calls) == 2, "feed after finish must be ignored"
+
+        service.calls.clear()
+        speculation = SpeculativeTranslation(engine, 'fr')
+        speculation.feed("i met bill. He")
+        speculation.feed("i met bill. He said")
+        time.sleep(0.3)
+        translation, report = speculation.finish("I met Bill. He said")
+        engine.close()
+        assert service.calls == ["i met bill.", "I met Bill. He said"], service.calls
+        assert report['reused'] == 0
+        print("✓ A sentence the recogniser re-cased is translated again")
+
+        assert _join(['你好。', '谢谢。']) == '你好。谢谢。'
+        assert _join(['Hallo.', 'Danke.']) == 'Hallo. Danke.'
+        print("✓ Sentences joined without spaces after CJK full stops")
+
+        return True
+    except Exception as e:
+        print(f"✗ Patching test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_collect_phrase():
+    """Test that streamed audio chunks produce partial transcripts"""
+    print("\n=== Testing Streamed Capture ===")
+    try:
+        import os
+        import tempfile
+        import speech_recognition as sr
+        from asr_backends import ASRBackend
+        from database import Database
+        from voice_processor import VoiceProcessor
+
+        words = "the train to berlin is delayed".split()
+
+        class GrowingBackend(ASRBackend):
+            """One word per half second of audio"""
+            name = 'growing'
+
+            def recognize(self, audio, language='en-US'):
+                time.sleep(0.01)
+                seconds = len(audio.get_raw_data()) / (16000 * 2)
+                return ' '.join(words[:int(seconds * 2)])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            vp = VoiceProcessor()
+            vp.db = Database(os.path.join(tmp, 'test.db'))
+            vp.backend_overrides['dictation'] = GrowingBackend(vp)
+
+            def chunks():
+                for _ in range(30):  # 3 s of audio in 100 ms chunks
+                    yield sr.AudioData(b'\x00\x00' * 1600, 16000, 2)
+                    time.sleep(0.02)
+
+            partials = []
+            audio = vp.collect_phrase(chunks(), partials.append, partial_interval=0.5)
+            time.sleep(0.05)
+            assert len(audio.get_raw_data()) == 30 * 3200
+            assert partials and all(words[:len(p.split())] == p.split() for p in partials)
+            assert len(partials[-1].split()) > len(partials[0].split())
+            print(f"✓ {len(partials)} growing partial transcripts while capturing")
+
+        return True
+    except ImportError as e:
+        print(f"   Skipping test - required module not available: {e}")
+        return True
+    except Exception as e:
+        print(f"✗ Streamed capture test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Speculative Translation Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Unpunctuated Partials", test_unpunctuated()))
+    results.append(("Sentences", test_sentences()))
+    results.append(("Patching", test_patching()))
+    results.append(("Streamed Capture", test_collect_phrase()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Test script for the synthesized speech cache
+Uses stand-in engine and player, so no TTS driver or audio device is needed
+"""
+
+import os
+import sys
+import tempfile
+import time
+import wave
+
+from test_speech_worker import FakeEngine
+
+
+class RenderingEngine(FakeEngine):
+    """FakeEngine that can also render to a file, taking ``render`` seconds
+
+    With ``aiff`` it writes AIFF-like bytes, as the macOS driver does.
+    """
+
+    def __init__(self, render=0.2, rate=200, aiff=False):
+        super().__init__(seconds=render)
+        self.rate = rate
+        self.aiff = aiff
+        self.rendered = []
+        self._files = []
+
+    def getProperty(self, name):
+        return {'voice': 'fake-voice', 'rate': self.rate}[name]
+
+    def save_to_file(self, text, path):
+        self._files.append((text, path))
+
+    def runAndWait(self):
+        files, self._files = self._files, []
+        for text, path in files:
+            deadline = time.monotonic() + self.seconds
+            while time.monotonic() < deadline and not self._stop.is_set():
+                time.sleep(0.005)
+            if self._stop.is_set():
+                break
+            if self.aiff:
+                write_file(path, 4096, b'FORM')
+            else:
+                with wave.open(path, 'wb') as wav:
+                    wav.setnchannels(1)
+                    wav.setsampwidth(2)
+                    wav.setframerate(16000)
+                    wav.writeframes(b'\x00\x00' * 160 * len(text))
+            self.rendered.append(text)
+        super().runAndWait()
+
+    def stop(self):
+        self._files.clear()
+        super().stop()
+
+
+class FakePlayer:
+    """Records what was played; each file takes ``seconds`` unless stopped"""
+
+    def __init__(self, seconds=0.1):
+        self.seconds = seconds
+        self.played = []
+        self.closed = False
+
+    def play(self, path, should_stop=None):
+        with wave.open(path, 'rb') as wav:
+            assert wav.getnframes() > 0
+        deadline = time.monotonic() + self.seconds
+        while time.monotonic() < deadline:
+            if should_stop is not None and should_stop():
+                return False
+            time.sleep(0.005)
+        self.played.append(path)
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+def write_file(path, size, header=b''):
+    with open(path, 'wb') as f:
+        f.write(header + b'\x00' * (size - len(header)))
+
+
+def write_wav(path, size):
+    """Silent 16-bit mono WAV of exactly ``size`` bytes (44-byte header)"""
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b'\x00' * (size - 44))
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_lru_eviction():
+    """Test the size cap, LRU order and reloading from disk"""
+    print("\n=== Testing LRU Eviction ===")
+    try:
+        from speech_cache import SpeechCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SpeechCache(tmp, max_bytes=3000)
+            keys = [SpeechCache.key(text, 'v', 200, 'de') for text in ("eins", "zwei", "drei")]
+            for key in keys:
+                temp = cache.reserve(key)
+                write_wav(temp, 1000)
+                cache.put(key, temp)
+            assert len(cache) == 3 and cache.size == 3000
+            assert cache.get(keys[0]) is not None  # now most recently used
+
+            key = SpeechCache.key("vier", 'v', 200, 'de')
+            temp = cache.reserve(key)
+            write_wav(temp, 1000)
+            cache.put(key, temp)
+            assert cache.get(keys[1]) is None, "least recently used entry should be evicted"
+            assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+            assert cache.size == 3000 and len(os.listdir(tmp)) == 3
+            print("✓ Cache held at 3000 bytes, least recently played file evicted")
+
+            assert SpeechCache.key("Guten  Tag ", 'v', 200, 'de') == SpeechCache.key("Guten Tag", 'v', 200, 'de')
+            assert len({SpeechCache.key("Guten Tag", *variant) for variant in
+                        [('v', 200, 'de'), ('w', 200, 'de'), ('v', 150, 'de'), ('v', 200, 'nl')]}) == 4
+            print("✓ Keys depend on voice, rate and language but not spacing")
+
+            empty = cache.reserve(SpeechCache.key("fünf"))
+            assert cache.put(SpeechCache.key("fünf"), empty) is None and not os.path.exists(empty)
+            aiff = cache.reserve(SpeechCache.key("sechs"))
+            write_file(aiff, 1000, b'FORM')
+            assert cache.put(SpeechCache.key("sechs"), aiff) is None and not os.path.exists(aiff)
+            write_file(os.path.join(tmp, 'stale.tmp'), 10)
+
+            reloaded = SpeechCache(tmp, max_bytes=3000)
+            assert len(reloaded) == 3 and reloaded.size == 3000
+            assert not os.path.exists(os.path.join(tmp, 'stale.tmp'))
+            assert reloaded.get(keys[2]) is not None
+            print("✓ Entries reloaded after restart, leftover renders removed")
+
+        return True
+    except Exception as e:
+        print(f"✗ LRU eviction test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_cached_playback():
+    """Test that a miss is spoken live and repeats play from the cache"""
+    print("\n=== Testing Cached Playback ===")
+    try:
+        from speech_cache import SpeechCache
+        from speech_worker import SpeechWorker
+
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = RenderingEngine(render=0.2)
+            player = FakePlayer(seconds=0.05)
+            cache = SpeechCache(tmp)
+            worker = SpeechWorker(lambda: engine, cache=cache, player=player)
+
+            first = worker.say("Wo ist der Bahnhof?", language='de')
+            assert first.wait(timeout=2) and first.state == 'done' and not first.cached
+            assert engine.spoken == ["Wo ist der Bahnhof?"] and player.played == []
+            assert first.finished - first.started < 0.3, "a miss must not wait for rendering"
+            print(f"✓ Miss spoken live in {(first.finished - first.started) * 1000:.0f} ms")
+
+            assert wait_for(lambda: len(cache) == 1)
+            repeat = worker.say("Wo ist der Bahnhof?", language='de')
+            assert repeat.wait(timeout=2) and repeat.state == 'done' and repeat.cached
+            assert engine.rendered == ["Wo ist der Bahnhof?"] and len(player.played) == 1
+            assert repeat.finished - repeat.started < first.finished - first.started - 0.1
+            print(f"✓ Rendered while idle; repeat played from cache in "
+                  f"{(repeat.finished - repeat.started) * 1000:.0f} ms")
+
+            other = worker.say("Wo ist der Bahnhof?", language='nl')
+            engine.rate = 150
+            slower = worker.say("Wo ist der Bahnhof?", language='de')
+            assert slower.wait(timeout=2) and not other.cached and not slower.cached
+            assert wait_for(lambda: len(engine.rendered) == 3)
+            print("✓ Another language or speech rate is synthesized separately")
+
+            worker.render_chars = 10
+            long_text = "Der Zug nach Berlin hat zehn Minuten Verspätung."
+            job = worker.say(long_text, language='de')
+            assert job.wait(timeout=2)
+            time.sleep(0.3)
+            assert long_text not in engine.rendered
+            job = worker.say(long_text, language='de')
+            assert job.wait(timeout=2) and not job.cached
+            assert wait_for(lambda: long_text in engine.rendered)
+            print("✓ Long phrases rendered only once they repeat")
+
+            worker.close()
+            assert player.closed
+        return True
+    except Exception as e:
+        print(f"✗ Cached playback test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_unplayable_audio():
+    """Test that audio the player cannot open is never cached or is dropped"""
+    print("\n=== Testing Unplayable Audio ===")
+    try:
+        from speech_cache import SpeechCache
+        from speech_worker import SpeechWorker
+
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = RenderingEngine(render=0.05, aiff=True)
+            cache = SpeechCache(tmp)
+            worker = SpeechWorker(lambda: engine, cache=cache, player=FakePlayer(seconds=0.05))
+            job = worker.say("Bonjour")
+            assert job.wait(timeout=2) and wait_for(lambda: engine.rendered == ["Bonjour"])
+            time.sleep(0.05)
+            assert len(cache) == 0 and os.listdir(tmp) == []
+            print("✓ Rendered AIFF rejected instead of cached")
+
+            engine.aiff = False
+            key = SpeechCache.key("Merci", 'fake-voice', 200, None)
+            temp = cache.reserve(key)
+            write_file(temp, 4096, b'FORM')
+            os.replace(temp, os.path.join(tmp, key + '.wav'))
+            cache = SpeechCache(tmp)
+            worker.cache = cache
+            job = worker.say("Merci")
+            assert job.wait(timeout=2) and job.state == 'done' and not job.cached
+            assert engine.spoken[-1] == "Merci"
+            assert wait_for(lambda: key in cache)
+            job = worker.say("Merci")
+            assert job.wait(timeout=2) and job.cached and job.state == 'done'
+            print("✓ Unplayable cache entry dropped, spoken live and rendered again")
+
+            worker.close()
+        return True
+    except Exception as e:
+        print(f"✗ Unplayable audio test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_cancel_while_rendering():
+    """Test that new speech stops an idle render and leaves nothing cached"""
+    print("\n=== Testing Cancel While Rendering ===")
+    try:
+        from speech_cache import SpeechCache
+        from speech_worker import SpeechWorker
+
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = RenderingEngine(render=0.5)
+            player = FakePlayer(seconds=0.5)
+            cache = SpeechCache(tmp)
+            worker = SpeechWorker(lambda: engine, cache=cache, player=player)
+
+            job = worker.say("a long announcement")
+            time.sleep(0.05)
+            assert worker.cancel(job) and job.wait(timeout=1) and job.cancelled
+            time.sleep(0.1)
+            assert len(cache) == 0 and os.listdir(tmp) == []
+            print("✓ Cancelled phrase not rendered")
+
+            first = worker.say("a short one")
+            assert first.wait(timeout=2)
+            time.sleep(0.1)  # now rendering "a short one"
+            start = time.monotonic()
+            urgent = worker.say("urgent", interrupt=True)
+            assert wait_for(lambda: urgent.started is not None, timeout=1)
+            assert urgent.started - start < 0.1, "a render must not delay new speech"
+            assert urgent.wait(timeout=2) and "a short one" not in engine.rendered
+            print(f"✓ Render stopped for new speech after {(urgent.started - start) * 1000:.0f} ms")
+
+            assert wait_for(lambda: len(cache) == 2)
+            job = worker.say("a short one")
+            time.sleep(0.05)
+            start = time.monotonic()
+            worker.interrupt()
+            assert job.wait(timeout=1) and job.cached and job.cancelled
+            assert time.monotonic() - start < 0.1 and player.played == []
+            print("✓ Interrupted render retried when idle; cached playback stops on barge-in")
+
+            worker.close()
+        return True
+    except Exception as e:
+        print(f"✗ Cancel while rendering test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Speech Cache Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("LRU Eviction", test_lru_eviction()))
+    results.append(("Cached Playback", test_cached_playback()))
+    results.append(("Unplayable Audio", test_unplayable_audio()))
+    results.append(("Cancel While Rendering", test_cancel_while_rendering()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Test script for the background speech worker
+Uses a stand-in engine that "speaks" by sleeping, so no audio device is needed
+"""
+
+import sys
+import threading
+import time
+
+
+class FakeEngine:
+    """Mimics pyttsx3: say queues, runAndWait blocks, stop clears and interrupts"""
+
+    def __init__(self, seconds=0.2, fail=False):
+        self.seconds = seconds
+        self.fail = fail
+        self.spoken = []
+        self.interrupted = []
+        self.threads = set()
+        self._pending = []
+        self._stop = threading.Event()
+
+    def say(self, text):
+        self.threads.add(threading.get_ident())
+        self._pending.append(text)
+
+    def runAndWait(self):
+        self.threads.add(threading.get_ident())
+        if self.fail:
+            raise RuntimeError("audio device lost")
+        while self._pending:
+            text = self._pending.pop(0)
+            deadline = time.monotonic() + self.seconds
+            while time.monotonic() < deadline and not self._stop.is_set():
+                time.sleep(0.005)
+            (self.interrupted if self._stop.is_set() else self.spoken).append(text)
+        self._stop.clear()
+
+    def stop(self):
+        self._pending.clear()
+        self._stop.set()
+
+
+def make_worker(**kwargs):
+    engines = []
+    events = []
+
+    def factory():
+        engines.append(FakeEngine(**kwargs))
+        return engines[-1]
+
+    from speech_worker import SpeechWorker
+    worker = SpeechWorker(factory,
+                          on_start=lambda job: events.append(('start', job.text)),
+                          on_end=lambda job: events.append(('end', job.text, job.state)))
+    return worker, engines, events
+
+
+def test_queue_order():
+    """Test that say returns at once and jobs are spoken in order on one engine"""
+    print("\n=== Testing Queue Order ===")
+    try:
+        worker, engines, events = make_worker(seconds=0.1)
+        start = time.monotonic()
+        jobs = [worker.say(text) for text in ("one", "two", "three")]
+        queued = time.monotonic() - start
+        assert queued < 0.05, f"say blocked for {queued:.3f} s"
+        print(f"✓ Three jobs queued in {queued * 1000:.1f} ms")
+
+        assert jobs[-1].wait(timeout=2)
+        assert [job.state for job in jobs] == ['done'] * 3
+        assert len(engines) == 1 and engines[0].spoken == ["one", "two", "three"]
+        assert engines[0].threads == {worker._thread.ident}
+        assert events == [('start', 'one'), ('end', 'one', 'done'), ('start', 'two'),
+                          ('end', 'two', 'done'), ('start', 'three'), ('end', 'three', 'done')]
+        assert all(job.finished - job.started >= 0.1 for job in jobs)
+        print("✓ Spoken in order by one engine on the worker thread, start/end reported")
+
+        worker.close()
+        assert not worker._thread.is_alive()
+        return True
+    except Exception as e:
+        print(f"✗ Queue order test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_cancel():
+    """Test cancelling queued and in-progress jobs"""
+    print("\n=== Testing Cancellation ===")
+    try:
+        worker, engines, events = make_worker(seconds=0.3)
+        first, second, third = (worker.say(text) for text in ("first", "second", "third"))
+        assert worker.cancel(second)
+        assert second.wait(timeout=0) and second.cancelled
+        time.sleep(0.05)
+        assert worker.speaking is first
+        start = time.monotonic()
+        assert worker.cancel(first)
+        assert first.wait(timeout=1)
+        assert time.monotonic() - start < 0.1
+        assert third.wait(timeout=2) and third.state == 'done'
+        assert engines[0].spoken == ["third"] and engines[0].interrupted == ["first"]
+        assert ('start', 'second') not in events and ('end', 'first', 'cancelled') in events
+        assert not worker.cancel(third)
+        print("✓ Queued job skipped, current job stopped mid-utterance")
+
+        worker.close()
+        return True
+    except Exception as e:
+        print(f"✗ Cancellation test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_barge_in():
+    """Test that an interrupting job cuts off everything before it"""
+    print("\n=== Testing Barge-In ===")
+    try:
+        worker, engines, events = make_worker(seconds=0.5)
+        old = [worker.say(text) for text in ("a long answer", "its second sentence")]
+        time.sleep(0.05)
+        start = time.monotonic()
+        new = worker.say("new answer", interrupt=True)
+        assert old[0].wait(timeout=1) and old[1].wait(timeout=0)
+        assert all(job.cancelled for job in old)
+        assert time.monotonic() - start < 0.1
+        print(f"✓ Previous speech stopped after {(time.monotonic() - start) * 1000:.0f} ms")
+
+        assert new.wait(timeout=2) and new.state == 'done'
+        assert engines[0].spoken == ["new answer"]
+        worker.interrupt()
+        assert worker.speaking is None
+        print("✓ Interrupting job spoken; interrupt on an idle worker is harmless")
+
+        worker.close()
+        return True
+    except Exception as e:
+        print(f"✗ Barge-in test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_engine_failure():
+    """Test that a failing engine is replaced for the next job"""
+    print("\n=== Testing Engine Failure ===")
+    try:
+        worker, engines, events = make_worker(seconds=0.05, fail=True)
+        job = worker.say("hello")
+        assert job.wait(timeout=1) and job.state == 'failed' and 'audio device lost' in job.error
+        assert events[-1] == ('end', 'hello', 'failed')
+        worker.engine_factory = lambda: engines.append(FakeEngine(seconds=0.05)) or engines[-1]
+        job = worker.say("hello again")
+        assert job.wait(timeout=1) and job.state == 'done'
+        assert worker.engines_created == 2 and engines[1].spoken == ["hello again"]
+        print("✓ Failed job reported, engine recreated for the next one")
+
+        worker.close()
+        return True
+    except Exception as e:
+        print(f"✗ Engine failure test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_sentence_pipeline():
+    """Test that speech starts with the first translated sentence"""
+    print("\n=== Testing Sentence Pipeline ===")
+    try:
+        from speech_worker import SpeechPipeline
+        from translation_engine import AsyncTranslationEngine
+
+        class SlowService:
+            def translate_or_raise(self, text, target_lang, source_lang='auto', **options):
+                time.sleep(0.3)
+                return text.upper()
+
+        engine = AsyncTranslationEngine(SlowService(), timeout=5)
+        worker, engines, events = make_worker(seconds=0.5)
+        worker.say("previous answer")
+        time.sleep(0.05)
+        pipeline = SpeechPipeline(worker, 'de')
+        sentences = ["One.", "Two.", "Three."]
+        future = engine.submit_segments(sentences, 'de', on_segment=lambda i, r: pipeline.add(r['translation']),
+                                        max_parallel=1)
+        future.result(timeout=5)
+        translated = time.monotonic() - pipeline.created
+        assert pipeline.jobs[-1].wait(timeout=3)
+        engine.close()
+
+        assert engines[0].spoken == ["ONE.", "TWO.", "THREE."]
+        assert engines[0].interrupted == ["previous answer"]
+        first = pipeline.time_to_first_audio
+        assert first < 0.45 and translated >= 0.85, (first, translated)
+        assert pipeline.jobs[0].finished < pipeline.jobs[1].started
+        print(f"✓ First audio after {first * 1000:.0f} ms, translation took {translated * 1000:.0f} ms")
+        print("✓ Sentences spoken in order; the first one cut off the previous answer")
+
+        pipeline = SpeechPipeline(worker, 'de')
+        queued = [pipeline.add("Ich brauche"), pipeline.add("ein Taxi. Jetzt"), pipeline.add("sofort! Danke")]
+        assert [[job.text for job in jobs] for jobs in queued] == [[], ["Ich brauche ein Taxi."], ["Jetzt sofort!"]]
+        assert [job.text for job in pipeline.flush()] == ["Danke"] and pipeline.flush() == []
+        assert pipeline.jobs[-1].wait(timeout=3)
+        assert engines[0].spoken[-3:] == ["Ich brauche ein Taxi.", "Jetzt sofort!", "Danke"]
+        print("✓ Fragments held back until their sentence is complete, the rest spoken on flush")
+
+        worker.close()
+        return True
+    except Exception as e:
+        print(f"✗ Sentence pipeline test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Speech Worker Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Queue Order", test_queue_order()))
+    results.append(("Cancellation", test_cancel()))
+    results.append(("Barge-In", test_barge_in()))
+    results.append(("Engine Failure", test_engine_failure()))
+    results.append(("Sentence Pipeline", test_sentence_pipeline()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
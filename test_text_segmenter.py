@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for the rule-based sentence segmenter
+"""
+
+import sys
+
+
+def test_sentence_boundaries():
+    """Test splitting at sentence ends but not at abbreviations"""
+    print("\n=== Testing Sentence Boundaries ===")
+    try:
+        from text_segmenter import split_sentences
+
+        cases = [
+            ('Hello there. How are you? I am fine!',
+             ['Hello there.', 'How are you?', 'I am fine!']),
+            ('Dr. Smith arrived at 3.15 p.m. on Jan. 5. He was late.',
+             ['Dr. Smith arrived at 3.15 p.m. on Jan. 5.', 'He was late.']),
+            ('I met J. Smith, e.g. at work. "Really?" she asked.',
+             ['I met J. Smith, e.g. at work.', '"Really?" she asked.']),
+            ('Wait... what? Yes!', ['Wait... what?', 'Yes!']),
+            ('First line\nSecond line', ['First line', 'Second line']),
+            ('你好。我很好！谢谢？', ['你好。', '我很好！', '谢谢？']),
+            ('No ending punctuation', ['No ending punctuation']),
+        ]
+        for text, expected in cases:
+            got = split_sentences(text)
+            assert got == expected, f"{text!r}: {got}"
+        print(f"✓ {len(cases)} boundary cases segmented correctly")
+
+        return True
+    except Exception as e:
+        print(f"✗ Sentence boundary test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_reassembly():
+    """Test that segments reassemble to the original layout"""
+    print("\n=== Testing Reassembly ===")
+    try:
+        from text_segmenter import segment_text, join_segments
+
+        text = 'Paragraph one. Still one!\n\nParagraph two?  Yes.\nLast line'
+        segments = segment_text(text)
+        assert join_segments([s for s, _ in segments], [sep for _, sep in segments]) == text
+        print("✓ Paragraph breaks and spacing preserved")
+
+        long_sentence = ', '.join(f'clause number {i}' for i in range(40)) + '.'
+        segments = segment_text(long_sentence, max_chars=100)
+        assert all(len(s) <= 100 for s, _ in segments)
+        assert len(segments) > 1 and all(s.endswith((',', '.')) for s, _ in segments)
+        assert join_segments([s for s, _ in segments], [sep for _, sep in segments]) == long_sentence
+        print(f"✓ Over-long sentence split at commas into {len(segments)} pieces")
+
+        return True
+    except Exception as e:
+        print(f"✗ Reassembly test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Text Segmenter Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Sentence Boundaries", test_sentence_boundaries()))
+    results.append(("Reassembly", test_reassembly()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed transcript cache
+Uses synthetic audio and a temporary database
+"""
+
+import os
+import sys
+import tempfile
+
+
+def make_tones(freqs, seconds=0.3, rate=16000):
+    """Build a clip of consecutive sine tones"""
+    import numpy as np
+    t = np.arange(int(seconds * rate)) / rate
+    return np.concatenate([0.3 * np.sin(2 * np.pi * f * t) for f in freqs]).astype(np.float32)
+
+
+def test_fingerprint_is_robust():
+    """Test that the fingerprint ignores gain and surrounding silence"""
+    print("\n=== Testing Audio Fingerprint ===")
+    try:
+        import numpy as np
+        from transcript_cache import audio_fingerprint
+
+        clip = make_tones([440, 660, 880])
+        padded = np.concatenate([np.zeros(3200, dtype=np.float32), clip * 0.5,
+                                 np.zeros(1600, dtype=np.float32)])
+
+        assert audio_fingerprint(clip) == audio_fingerprint(padded), "Fingerprint changed with gain/silence"
+        print("✓ Same audio with different gain and silence gives the same fingerprint")
+
+        other = make_tones([300, 500, 700])
+        assert audio_fingerprint(clip) != audio_fingerprint(other), "Different audio collided"
+        print("✓ Different audio gives a different fingerprint")
+
+        assert audio_fingerprint(np.zeros(16000, dtype=np.float32)) is None
+        print("✓ Silent audio has no fingerprint")
+
+        return True
+    except ImportError:
+        print("ℹ NumPy not available, skipping fingerprint test")
+        return True
+    except Exception as e:
+        print(f"✗ Fingerprint test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_cache_hits_and_eviction():
+    """Test LRU behaviour, persistence and database counters"""
+    print("\n=== Testing Transcript Cache ===")
+    try:
+        from database import Database
+        from features import log_mel_spectrogram
+        from transcript_cache import TranscriptCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Database(os.path.join(tmp, 'test.db'))
+            cache = TranscriptCache(db, capacity=2, persist=True)
+
+            key_a = cache.key(log_mel_spectrogram(make_tones([440, 660])), 'google', 'en-US')
+            key_b = cache.key(log_mel_spectrogram(make_tones([300, 500])), 'google', 'en-US')
+            key_c = cache.key(log_mel_spectrogram(make_tones([200, 900])), 'google', 'en-US')
+
+            assert cache.get(key_a) is None
+            cache.put(key_a, 'please wait')
+            assert cache.get(key_a) == 'please wait'
+            print("✓ Stored transcript returned on a repeat")
+
+            cache.put(key_b, 'exit on the left')
+            cache.put(key_c, 'doors closing')
+            assert key_a not in cache._entries, "Oldest entry should be evicted"
+            print("✓ Least recently used entry evicted from memory")
+
+            assert cache.get(key_a) == 'please wait', "Persisted entry should survive eviction"
+            print("✓ Evicted entry reloaded from the database")
+
+            assert cache.key(log_mel_spectrogram(make_tones([440, 660])), 'whisper-base', 'en-US') != key_a
+            print("✓ Model name is part of the key")
+
+            assert db.get_stat('transcript_cache_hits') == 2, db.get_stat('transcript_cache_hits')
+            assert db.get_stat('transcript_cache_misses') == 1, db.get_stat('transcript_cache_misses')
+            print("✓ Hit/miss counters recorded in the database")
+
+        return True
+    except ImportError:
+        print("ℹ NumPy not available, skipping cache test")
+        return True
+    except Exception as e:
+        print(f"✗ Transcript cache test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Transcript Cache Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Audio Fingerprint", test_fingerprint_is_robust()))
+    results.append(("Transcript Cache", test_cache_hits_and_eviction()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test script for the two-level translation cache
+Uses a temporary database and a stand-in provider, no network required
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+
+def test_memory_and_persistent_layers():
+    """Test memory hits, database hits and normalised keys"""
+    print("\n=== Testing Cache Layers ===")
+    try:
+        from database import Database
+        from translation_cache import TranslationCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Database(os.path.join(tmp, 'test.db'))
+            cache = TranslationCache(db)
+
+            assert cache.get('Where is the exit', 'en', 'es', 'google') is None
+            cache.put('Where is the exit', 'en', 'es', 'google', '¿Dónde está la salida?')
+
+            assert cache.get('  Where is   the exit ', 'en', 'es', 'google') == '¿Dónde está la salida?'
+            print("✓ Normalised text hits the memory layer")
+
+            assert cache.get('Where is the exit', 'en', 'fr', 'google') is None
+            assert cache.get('Where is the exit', 'en', 'es', 'deepl') is None
+            print("✓ Target language and provider are part of the key")
+
+            fresh = TranslationCache(db)
+            assert fresh.get('Where is the exit', 'en', 'es', 'google') == '¿Dónde está la salida?'
+            assert fresh.stats()['db_hits'] == 1
+            print("✓ New instance served from the persistent layer")
+
+            stats = cache.stats()
+            assert stats['memory_hits'] == 1 and stats['misses'] == 3, stats
+            print(f"✓ Hit-rate statistics: {stats['hit_rate']:.0%}")
+
+            cache.flush_stats()
+            assert db.get_stat('translation_cache_memory_hits') == 1
+            print("✓ Statistics flushed to the database")
+
+            cache.put('Polish', 'en', 'de', 'google', 'Polnisch')
+            assert cache.get('polish', 'en', 'de', 'google') is None
+            assert fresh.get('Polish', 'en', 'de', 'google') == 'Polnisch'
+            print("✓ Case is part of the key (\"Polish\" is not \"polish\")")
+
+        return True
+    except Exception as e:
+        print(f"✗ Cache layer test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_expiry_and_eviction():
+    """Test TTL expiry and size-based eviction"""
+    print("\n=== Testing Expiry and Eviction ===")
+    try:
+        from database import Database
+        from translation_cache import TranslationCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Database(os.path.join(tmp, 'test.db'))
+
+            cache = TranslationCache(db, ttl=0.05)
+            cache.put('please wait', 'en', 'de', 'google', 'bitte warten')
+            time.sleep(0.1)
+            assert cache.get('please wait', 'en', 'de', 'google') is None
+            print("✓ Expired entries are not returned")
+
+            cache = TranslationCache(db, capacity=2, max_rows=3, prune_every=1)
+            for i in range(5):
+                cache.put(f'phrase {i}', 'en', 'de', 'google', f'satz {i}')
+                time.sleep(0.01)
+            assert len(cache._entries) == 2
+            assert cache.get('phrase 0', 'en', 'de', 'google') is None
+            assert cache.get('phrase 4', 'en', 'de', 'google') == 'satz 4'
+            print("✓ Memory and database layers trimmed to their size limits")
+
+        return True
+    except Exception as e:
+        print(f"✗ Expiry test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_service_uses_cache():
+    """Test that TranslationService skips the provider on a cache hit"""
+    print("\n=== Testing Service Integration ===")
+    try:
+        from database import Database
+        from translation_cache import TranslationCache
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+
+            calls = []
+
+            def fake_google(text, target_lang, source_lang='auto'):
+                calls.append(text)
+                return 'hola'
+
+            ts._translate_google = fake_google
+            assert ts.translate('hello', 'es') == 'hola'
+            assert ts.translate(' hello  ', 'es') == 'hola'
+            assert calls == ['hello'], f"Provider called {len(calls)} times"
+            print("✓ Repeat translation served without calling the provider")
+
+            def failing_google(text, target_lang, source_lang='auto'):
+                raise ConnectionError("offline")
+
+            ts._translate_google = failing_google
+            assert ts.translate('goodbye', 'es').startswith('Translation error')
+            assert ts.cache.get('goodbye', 'auto', 'es', 'google') is None
+            print("✓ Errors are not cached")
+
+        return True
+    except Exception as e:
+        print(f"✗ Service integration test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Translation Cache Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Cache Layers", test_memory_and_persistent_layers()))
+    results.append(("Expiry and Eviction", test_expiry_and_eviction()))
+    results.append(("Service Integration", test_service_uses_cache()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Test script for pooled translation clients
+Runs against the local stand-in server, no network required
+"""
+
+import sys
+
+
+def test_google_client_roundtrip():
+    """Test that the Google client parses the provider response"""
+    print("\n=== Testing Google Client ===")
+    try:
+        from translation_clients import GoogleClient, create_session
+        from translation_standin import StandInServer
+
+        with StandInServer() as server:
+            client = GoogleClient('en', 'es', session=create_session(),
+                                  base_url=server.url + '/translate_a/single')
+            assert client.translate('  where is the exit ') == '[es] WHERE IS THE EXIT'
+            assert server.requests[0][1]['sl'] == ['en']
+            print("✓ Translation parsed from the provider response")
+
+            assert client.translate('   ') == ''
+            assert len(server.requests) == 1
+            print("✓ Empty text answered locally")
+
+        return True
+    except Exception as e:
+        print(f"✗ Google client test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_connection_reuse():
+    """Test that repeated calls share one keep-alive connection"""
+    print("\n=== Testing Connection Reuse ===")
+    try:
+        from translation_clients import ClientPool, create_session
+        from translation_standin import StandInServer
+
+        with StandInServer() as server:
+            pool = ClientPool(session=create_session(),
+                              base_url=server.url + '/translate_a/single')
+            client = pool.get('google', 'en', 'de')
+            assert pool.get('google', 'en', 'de') is client
+            assert pool.get('google', 'en', 'fr') is not client
+            print("✓ One long-lived client per language pair")
+
+            for i in range(10):
+                pool.get('google', 'en', 'de' if i % 2 else 'fr').translate(f'phrase {i}')
+            assert server.connections == 1, f"Expected 1 connection, saw {server.connections}"
+            print("✓ 10 calls over 2 language pairs used a single TCP connection")
+
+        return True
+    except Exception as e:
+        print(f"✗ Connection reuse test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_provider_errors():
+    """Test that HTTP errors surface as ProviderError"""
+    print("\n=== Testing Provider Errors ===")
+    try:
+        from translation_clients import GoogleClient, ProviderError, create_session
+        from translation_standin import StandInServer
+
+        with StandInServer(fail_status=429) as server:
+            client = GoogleClient('en', 'es', session=create_session(),
+                                  base_url=server.url + '/translate_a/single')
+            try:
+                client.translate('hello')
+                print("✗ Expected ProviderError")
+                return False
+            except ProviderError as e:
+                assert e.status_code == 429
+                print(f"✓ Throttling reported: {e}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Provider error test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_batch_translation():
+    """Test translate_batch ordering, deduplication, chunking and errors"""
+    print("\n=== Testing Batch Translation ===")
+    try:
+        import os
+        import tempfile
+        from database import Database
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, create_session
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer(fail_on={'broken'}) as server:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.clients = ClientPool(session=create_session(),
+                                    base_url=server.url + '/translate_a/single')
+
+            texts = ['please wait', 'exit', 'please  wait', 'platform two', 'exit']
+            results = ts.translate_batch(texts, 'de', 'en')
+            assert [r['text'] for r in results] == texts
+            assert [r['translation'] for r in results] == [
+                '[de] PLEASE WAIT', '[de] EXIT', '[de] PLEASE WAIT', '[de] PLATFORM TWO', '[de] EXIT']
+            assert len(server.requests) == 1, f"Expected 1 request, got {len(server.requests)}"
+            assert server.requests[0][1]['q'] == ['please wait\nexit\nplatform two']
+            print("✓ 5 texts (3 unique) translated in one request, order preserved")
+
+            ts.translate_batch(texts, 'de', 'en')
+            assert len(server.requests) == 1
+            print("✓ Repeated batch served from the cache")
+
+            results = ts.translate_batch(['US', 'us'], 'de', 'en')
+            assert [r['translation'] for r in results] == ['[de] US', '[de] US']
+            assert server.requests[-1][1]['q'] == ['US\nus']
+            print("✓ Texts differing only in case translated separately")
+
+            ts.clients.get('google', 'en', 'fr').max_chars = 20
+            results = ts.translate_batch(['aaaa bbbb', 'cccc dddd', 'eeee ffff'], 'fr', 'en')
+            assert all(r['error'] is None for r in results)
+            assert len(server.requests) == 4, f"Expected 2 more requests, got {len(server.requests) - 2}"
+            print("✓ Requests split at the provider character limit")
+
+            results = ts.translate_batch(['good', 'broken', 'fine'], 'es', 'en')
+            assert results[0]['translation'] == '[es] GOOD' and results[2]['translation'] == '[es] FINE'
+            assert results[1]['translation'] is None and 'HTTP 500' in results[1]['error']
+            print("✓ Failing item reported without failing its neighbours")
+
+        return True
+    except Exception as e:
+        print(f"✗ Batch translation test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_deepl_client():
+    """Test DeepL language codes, multi-text requests and key handling"""
+    print("\n=== Testing DeepL Client ===")
+    try:
+        import os
+        import tempfile
+        from database import Database
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, DeepLClient, deepl_code, create_session
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        assert deepl_code('auto') is None
+        assert deepl_code('en') == 'EN' and deepl_code('en', target=True) == 'EN-US'
+        assert deepl_code('zh-CN') == 'ZH' and deepl_code('zh-CN', target=True) == 'ZH-HANS'
+        assert deepl_code('pt', target=True) == 'PT-PT'
+        try:
+            deepl_code('hi', target=True)
+            print("✗ Expected ValueError for Hindi")
+            return False
+        except ValueError:
+            pass
+        print("✓ Language codes mapped to DeepL's")
+
+        assert DeepLClient('en', 'de', auth_key='abc:fx').base_url.startswith('https://api-free.')
+        assert DeepLClient('en', 'de', auth_key='abc').base_url.startswith('https://api.deepl')
+        print("✓ Free-plan keys routed to the free endpoint")
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer() as server:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.clients = ClientPool(session=create_session(),
+                                    provider_options={'deepl': {'base_url': server.url + '/v2/translate'}})
+            ts.db.set_setting('translation_api', 'deepl')
+
+            try:
+                ts.translate_or_raise('hello', 'de', 'en')
+                print("✗ Expected an error without an API key")
+                return False
+            except ValueError:
+                assert not server.requests
+                print("✓ Missing API key reported before any request")
+
+            ts.db.set_setting('deepl_api_key', 'test-key')
+            ts._settings.clear()
+            assert ts.translate('good morning', 'de', 'en') == '[DE] GOOD MORNING'
+            provider, body = server.requests[0]
+            assert provider == 'deepl' and body['source_lang'] == 'EN' and body['target_lang'] == 'DE'
+            print("✓ Selecting DeepL in settings uses the DeepL API")
+
+            texts = [f'sentence number {i}' for i in range(120)]
+            results = ts.translate_batch(texts, 'en', 'auto')
+            assert [r['translation'] for r in results] == [f'[EN-US] SENTENCE NUMBER {i}' for i in range(120)]
+            batch_requests = server.requests[1:]
+            assert len(batch_requests) == 3, f"Expected 3 requests, got {len(batch_requests)}"
+            assert [len(body['text']) for _, body in batch_requests] == [50, 50, 20]
+            assert 'source_lang' not in batch_requests[0][1]
+            assert server.connections == 1
+            print("✓ 120 texts sent as 3 multi-text requests on one connection")
+
+        return True
+    except Exception as e:
+        print(f"✗ DeepL client test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_request_coalescing():
+    """Test that identical concurrent translations share one provider call"""
+    print("\n=== Testing Request Coalescing ===")
+    try:
+        import os
+        import tempfile
+        import threading
+        from database import Database
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, create_session
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer(delay=0.2) as server:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.clients = ClientPool(session=create_session(),
+                                    base_url=server.url + '/translate_a/single')
+            ts.translate_or_raise('warm up', 'es', 'en')
+
+            results = []
+            barrier = threading.Barrier(10)
+
+            def worker(text):
+                barrier.wait()
+                results.append(ts.translate_or_raise(text, 'es', 'en'))
+
+            texts = ['The train to Berlin is delayed'] * 7 + [' The train to  Berlin is delayed'] * 3
+            threads = [threading.Thread(target=worker, args=(text,)) for text in texts]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            # Waiters get the leader's result, whichever spelling it sent
+            assert [' '.join(r.split()) for r in results] == ['[es] THE TRAIN TO BERLIN IS DELAYED'] * 10, results
+            assert len(set(results)) == 1, results
+            assert len(server.requests) == 2, f"Expected 1 call after warm-up, got {len(server.requests) - 1}"
+            stats = ts.coalesce_stats()
+            assert stats['calls'] == 2 and stats['coalesced'] == 9, stats
+            assert ts.db.get_stat('translation_coalesced') == 9
+            print("✓ 10 simultaneous requests served by one provider call")
+
+            server.fail_status = 503
+            errors = []
+
+            def failing_worker():
+                barrier.wait()
+                try:
+                    ts.translate_or_raise('Platform change', 'es', 'en')
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=failing_worker) for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len(errors) == 10 and len(server.requests) == 3
+            print("✓ A failed call's error is shared with every waiter")
+
+        return True
+    except Exception as e:
+        print(f"✗ Request coalescing test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Translation Client Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Google Client", test_google_client_roundtrip()))
+    results.append(("Connection Reuse", test_connection_reuse()))
+    results.append(("Provider Errors", test_provider_errors()))
+    results.append(("Batch Translation", test_batch_translation()))
+    results.append(("DeepL Client", test_deepl_client()))
+    results.append(("Request Coalescing", test_request_coalescing()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
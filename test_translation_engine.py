@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Test script for the asyncio translation engine
+Uses stand-in services to simulate slow, flaky and failing providers
+"""
+
+import sys
+import threading
+import time
+
+
+class FlakyService:
+    """Fails with a connection error a given number of times, then succeeds"""
+
+    def __init__(self, failures=0, delay=0.0, error=None):
+        import requests
+        self.failures = failures
+        self.delay = delay
+        self.error = error or requests.ConnectionError("network blip")
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def translate_or_raise(self, text, target_lang, source_lang='auto', **options):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            fail = self.calls <= self.failures
+        try:
+            time.sleep(self.delay)
+            if fail:
+                raise self.error
+            return f"{text}->{target_lang}"
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_retries_with_backoff():
+    """Test that transient errors are retried until success"""
+    print("\n=== Testing Retries ===")
+    try:
+        from translation_engine import AsyncTranslationEngine
+
+        service = FlakyService(failures=2)
+        engine = AsyncTranslationEngine(service, retries=3, backoff_base=0.01, timeout=2)
+        assert engine.translate('hello', 'es') == 'hello->es'
+        assert service.calls == 3, f"Expected 3 attempts, got {service.calls}"
+        print("✓ Two network failures retried, third attempt succeeded")
+
+        service = FlakyService(failures=5, error=ValueError("bad language"))
+        try:
+            engine.service = service
+            engine.translate('hello', 'xx')
+            print("✗ Expected ValueError")
+            return False
+        except ValueError:
+            assert service.calls == 1
+            print("✓ Non-transient errors are not retried")
+        engine.close()
+
+        return True
+    except Exception as e:
+        print(f"✗ Retry test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_deadline():
+    """Test that a stalled provider hits the per-request deadline"""
+    print("\n=== Testing Deadlines ===")
+    try:
+        from translation_engine import AsyncTranslationEngine, TranslationTimeout
+
+        engine = AsyncTranslationEngine(FlakyService(delay=1.0), timeout=0.1)
+        start = time.monotonic()
+        try:
+            engine.translate('hello', 'es')
+            print("✗ Expected TranslationTimeout")
+            return False
+        except TranslationTimeout:
+            elapsed = time.monotonic() - start
+            assert elapsed < 0.5, f"Deadline not enforced ({elapsed:.2f}s)"
+            print(f"✓ Stalled call abandoned after {elapsed * 1000:.0f} ms")
+        engine.close()
+
+        return True
+    except Exception as e:
+        print(f"✗ Deadline test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_concurrency_limit():
+    """Test the global concurrency cap and the callback facade"""
+    print("\n=== Testing Concurrency Limit ===")
+    try:
+        from translation_engine import AsyncTranslationEngine
+
+        service = FlakyService(delay=0.05)
+        engine = AsyncTranslationEngine(service, max_concurrency=3, timeout=5)
+        done = []
+        futures = [engine.submit(f'phrase {i}', 'de', callback=lambda f: done.append(f.result()))
+                   for i in range(12)]
+        results = [f.result(timeout=5) for f in futures]
+        engine.close()
+
+        assert results == [f'phrase {i}->de' for i in range(12)]
+        assert service.max_active <= 3, f"{service.max_active} calls ran at once"
+        time.sleep(0.05)
+        assert len(done) == 12
+        print(f"✓ 12 requests completed with at most {service.max_active} in flight")
+
+        return True
+    except Exception as e:
+        print(f"✗ Concurrency test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_segment_streaming():
+    """Test that segments run in parallel but stream back in order"""
+    print("\n=== Testing Segment Streaming ===")
+    try:
+        from translation_engine import AsyncTranslationEngine
+
+        class SlowFirstService(FlakyService):
+            def translate_or_raise(self, text, target_lang, source_lang='auto', **options):
+                if text == 'broken':
+                    raise ValueError("unsupported")
+                self.delay = 0.2 if text == 'first' else 0.02
+                return super().translate_or_raise(text, target_lang, source_lang)
+
+        service = SlowFirstService()
+        engine = AsyncTranslationEngine(service, max_concurrency=8, timeout=5)
+        streamed = []
+        texts = ['first', 'second', 'broken', 'fourth', 'fifth']
+        results = engine.submit_segments(
+            texts, 'fr', on_segment=lambda i, r: streamed.append(i), max_parallel=2).result(timeout=5)
+        engine.close()
+
+        assert [r['text'] for r in results] == texts
+        assert results[0]['translation'] == 'first->fr'
+        assert results[2]['translation'] is None and results[2]['error'] == 'unsupported'
+        assert results[0]['exception'] is None and isinstance(results[2]['exception'], Exception)
+        assert streamed == [0, 1, 2, 3, 4], streamed
+        assert service.max_active <= 2
+        print("✓ Results streamed in order despite a slow first sentence")
+        print("✓ A failing sentence reported without failing the rest")
+
+        return True
+    except Exception as e:
+        print(f"✗ Segment streaming test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_target_fan_out():
+    """Test that several targets run at once and arrive fastest first"""
+    print("\n=== Testing Target Fan-Out ===")
+    try:
+        from translation_engine import AsyncTranslationEngine
+
+        delays = {'es': 0.2, 'fr': 0.05, 'de': 0.3, 'it': 0.1, 'pt': 0.15}
+
+        class PerTargetService(FlakyService):
+            def translate_or_raise(self, text, target_lang, source_lang='auto', **options):
+                self.delay = delays[target_lang]
+                return super().translate_or_raise(text, target_lang, source_lang)
+
+        engine = AsyncTranslationEngine(PerTargetService(), timeout=5)
+        arrived = []
+        start = time.monotonic()
+        results = engine.submit_targets('hello', list(delays),
+                                        on_target=lambda r: arrived.append(r['target'])).result(timeout=5)
+        elapsed = time.monotonic() - start
+        engine.close()
+
+        assert [r['target'] for r in results] == list(delays)
+        assert all(r['translation'] == f"hello->{r['target']}" for r in results)
+        assert arrived == sorted(delays, key=delays.get), arrived
+        assert elapsed < 0.45, f"5 targets took {elapsed:.2f}s (sum of calls is 0.8s)"
+        print(f"✓ 5 targets in {elapsed * 1000:.0f} ms (slowest call 300 ms, sum 800 ms)")
+        print(f"✓ Results arrived fastest first: {arrived}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Fan-out test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Translation Engine Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Retries", test_retries_with_backoff()))
+    results.append(("Deadlines", test_deadline()))
+    results.append(("Concurrency Limit", test_concurrency_limit()))
+    results.append(("Segment Streaming", test_segment_streaming()))
+    results.append(("Target Fan-Out", test_target_fan_out()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test script for the translation memory (fuzzy near-duplicate reuse)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+
+def test_near_duplicates():
+    """Test that similar sentences match and unrelated ones do not"""
+    print("\n=== Testing Near-Duplicate Lookup ===")
+    try:
+        from database import Database
+        from translation_memory import TranslationMemory
+
+        with tempfile.TemporaryDirectory() as tmp:
+            memory = TranslationMemory(Database(os.path.join(tmp, 'test.db')))
+            memory.add('The train to Berlin is delayed', 'en', 'de', 'Der Zug nach Berlin hat Verspätung')
+            memory.add('Where is the station?', 'en', 'de', 'Wo ist der Bahnhof?')
+
+            match = memory.find('the train to Munich is delayed', 'en', 'de')
+            assert match is not None and match.translation == 'Der Zug nach Berlin hat Verspätung'
+            assert 0.7 <= match.similarity < 1.0
+            print(f"✓ Near-duplicate found: {match}")
+
+            assert memory.find('The train to Berlin is delayed', 'en', 'de') is None
+            assert memory.find('the train to Munich is delayed', 'en', 'fr') is None
+            assert memory.find('good morning everyone', 'en', 'de') is None
+            print("✓ Exact repeats, other language pairs and unrelated text do not match")
+
+            assert memory.find('the train to Munich is delayed', 'en', 'de', threshold=0) is not None
+            assert memory.find('the train to Munich is delayed', 'en', 'de', threshold=1.5) is None
+            assert TranslationMemory(memory.db, threshold=-1).threshold > 0
+            print("✓ Out-of-range thresholds clamped instead of dividing by zero")
+
+        return True
+    except Exception as e:
+        print(f"✗ Near-duplicate test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_pruning_and_speed():
+    """Test the entry cap and time a lookup over a few thousand entries"""
+    print("\n=== Testing Pruning and Lookup Speed ===")
+    try:
+        from database import Database
+        from translation_memory import TranslationMemory
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Database(os.path.join(tmp, 'test.db'))
+            memory = TranslationMemory(db, max_entries=1500, prune_every=500)
+            cities = ['Berlin', 'Munich', 'Hamburg', 'Cologne', 'Dresden', 'Leipzig', 'Bremen', 'Essen']
+            for i in range(2000):
+                memory.add(f'Platform {i} for the train to {cities[i % len(cities)]}', 'en', 'de',
+                           f'Gleis {i} für den Zug nach {cities[i % len(cities)]}')
+
+            import sqlite3
+            conn = sqlite3.connect(db.db_path)
+            entries = conn.execute('SELECT COUNT(*) FROM translation_memory').fetchone()[0]
+            orphans = conn.execute('''
+                SELECT COUNT(*) FROM translation_memory_grams
+                WHERE entry_id NOT IN (SELECT id FROM translation_memory)
+            ''').fetchone()[0]
+            conn.close()
+            assert entries == 1500 and orphans == 0, (entries, orphans)
+            print(f"✓ Memory capped at {entries} entries with no orphaned index rows")
+
+            start = time.perf_counter()
+            for _ in range(20):
+                match = memory.find('Platform 1999 for the train to Essen, please', 'en', 'de')
+            elapsed = (time.perf_counter() - start) / 20
+            assert match is not None and match.text.startswith('Platform 1999')
+            print(f"✓ Fuzzy lookup over {entries} entries: {elapsed * 1000:.1f} ms")
+
+        return True
+    except Exception as e:
+        print(f"✗ Pruning test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_service_memory():
+    """Test that provider translations feed memory_match without network calls"""
+    print("\n=== Testing Service Memory ===")
+    try:
+        from database import Database
+        from translation_cache import TranslationCache
+        from translation_clients import ClientPool, create_session
+        from translation_memory import TranslationMemory
+        from translation_standin import StandInServer
+        from translator import TranslationService
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer() as server:
+            ts = TranslationService()
+            ts.db = Database(os.path.join(tmp, 'test.db'))
+            ts.cache = TranslationCache(ts.db)
+            ts.memory = TranslationMemory(ts.db)
+            ts.clients = ClientPool(session=create_session(),
+                                    base_url=server.url + '/translate_a/single')
+
+            ts.translate_or_raise('the train to Berlin is delayed', 'de', 'en')
+            assert len(server.requests) == 1
+
+            match = ts.memory_match('the train to Munich is delayed', 'de', 'en')
+            assert match is not None and match.translation == '[de] THE TRAIN TO BERLIN IS DELAYED'
+            assert len(server.requests) == 1
+            assert ts.db.get_stat('translation_memory_hits') == 1
+            print(f"✓ Fuzzy match offered locally ({match.similarity:.0%})")
+
+            ts.translate_or_raise('the train to Munich is delayed', 'de', 'en')
+            assert len(server.requests) == 2
+            print("✓ The fresh translation is still fetched")
+
+            ts.db.set_setting('translation_memory', 'false')
+            ts._settings.clear()
+            assert ts.memory_match('the train to Hamburg is delayed', 'de', 'en') is None
+            print("✓ Disabled by the translation_memory setting")
+
+        return True
+    except Exception as e:
+        print(f"✗ Service memory test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Translation Memory Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Near-Duplicate Lookup", test_near_duplicates()))
+    results.append(("Pruning and Lookup Speed", test_pruning_and_speed()))
+    results.append(("Service Memory", test_service_memory()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
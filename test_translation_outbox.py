@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test script for the offline translation outbox
+Simulates an outage with a closed local port, then brings the stand-in up
+"""
+
+import os
+import socket
+import sys
+import tempfile
+import time
+
+
+def closed_port_url():
+    """URL of a local port nothing listens on (connection refused)"""
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return f'http://127.0.0.1:{port}/translate_a/single'
+
+
+def make_service(tmp, base_url):
+    from database import Database
+    from translation_cache import TranslationCache
+    from translation_clients import ClientPool, create_session
+    from translator import TranslationService
+
+    ts = TranslationService()
+    ts.db = Database(os.path.join(tmp, 'test.db'))
+    ts.cache = TranslationCache(ts.db)
+    ts.clients = ClientPool(session=create_session(), base_url=base_url, timeout=1)
+    return ts
+
+
+def test_queue_when_offline():
+    """Test that network failures are queued and retried with backoff"""
+    print("\n=== Testing Queue When Offline ===")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            ts = make_service(tmp, closed_port_url())
+
+            result = ts.translate('where is the hospital', 'es', 'en')
+            assert result.startswith('Translation error') and 'queued' in result
+            pending = ts.outbox.pending()
+            assert [(e.text, e.source, e.target) for e in pending] == [('where is the hospital', 'en', 'es')]
+            print(f"✓ Failed request queued: {pending[0]}")
+
+            assert ts.translate('hello', 'klingon').startswith('Translation error')
+            assert len(ts.outbox.pending()) == 1
+            print("✓ Non-network errors are not queued")
+
+            now = time.time()
+            assert ts.outbox.flush(now) == 0
+            entry = ts.outbox.pending()[0]
+            assert entry.attempts == 1
+            assert ts.db.get_due_outbox_entries(now + 1) == []
+            assert len(ts.db.get_due_outbox_entries(now + ts.outbox.backoff_base + 1)) == 1
+            print("✓ Still offline: entry deferred with backoff")
+
+            delays = [ts.outbox.backoff(attempts) for attempts in range(8)]
+            assert delays[1] >= ts.outbox.backoff_base and max(delays) <= ts.outbox.backoff_max
+            print(f"✓ Backoff grows to at most {ts.outbox.backoff_max:.0f}s")
+
+        return True
+    except Exception as e:
+        print(f"✗ Offline queue test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_flush_when_online():
+    """Test that queued requests are flushed in batches and delivered"""
+    print("\n=== Testing Flush When Online ===")
+    try:
+        from provider_router import ProviderRouter
+        from translation_clients import ClientPool, create_session
+        from translation_standin import StandInServer
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer() as server:
+            ts = make_service(tmp, closed_port_url())
+            texts = ['one', 'two', 'three', 'four', 'five']
+            for text in texts:
+                ts.translate(text, 'fr', 'en')
+            ts.translate('six', 'de', 'en')
+            assert len(ts.outbox.pending()) == 6
+
+            # Network is back
+            ts.clients = ClientPool(session=create_session(),
+                                    base_url=server.url + '/translate_a/single')
+            ts.router = ProviderRouter()
+            delivered = []
+            ts.outbox.on_result = lambda entry, translation, error: delivered.append(
+                (entry.text, translation, error))
+            assert ts.outbox.flush(time.time() + 3600) == 6
+            assert ts.outbox.pending() == []
+            assert sorted(delivered) == sorted(
+                [(text, f'[fr] {text.upper()}', None) for text in texts] + [('six', '[de] SIX', None)])
+            assert len(server.requests) <= 3, server.requests
+            print(f"✓ 6 queued translations delivered in {len(server.requests)} requests")
+
+            ts.outbox.on_result = None
+            ts.outbox.poll_interval = 0.05
+            ts.outbox.enqueue('seven', 'fr', 'en')
+            ts.outbox.start()
+            deadline = time.time() + 2
+            while ts.outbox.pending() and time.time() < deadline:
+                time.sleep(0.02)
+            ts.outbox.close()
+            assert ts.outbox.pending() == []
+            print("✓ Background worker flushes new entries")
+
+        with tempfile.TemporaryDirectory() as tmp, StandInServer(fail_on=['ten']) as server:
+            ts = make_service(tmp, server.url + '/translate_a/single')
+            for text, target in [('nine', 'fr'), ('eight', 'xx'), ('ten', 'fr')]:
+                ts.outbox.enqueue(text, target, 'en')
+            delivered = []
+            ts.outbox.on_result = lambda entry, translation, error: delivered.append((entry.text, error))
+            assert ts.outbox.flush(time.time()) == 1
+            assert [text for text, _ in delivered] == ['nine', 'eight'] and delivered[1][1]
+            assert [entry.text for entry in ts.outbox.pending()] == ['ten']
+            print("✓ Unretryable errors given up on at once, server errors deferred")
+
+        return True
+    except Exception as e:
+        print(f"✗ Flush test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Translation Outbox Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Queue When Offline", test_queue_when_offline()))
+    results.append(("Flush When Online", test_flush_when_online()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
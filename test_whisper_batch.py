@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test script for batched and packed Whisper inference
+Exercises the scheduler and packing logic without loading a model
+"""
+
+import sys
+import threading
+
+
+def test_requests_are_batched():
+    """Test that concurrent submissions are grouped into one batch"""
+    print("\n=== Testing Request Batching ===")
+    try:
+        from whisper_batch import InferenceScheduler
+
+        batch_sizes = []
+
+        def batch_fn(items, key):
+            batch_sizes.append(len(items))
+            return [item.upper() for item in items]
+
+        scheduler = InferenceScheduler(batch_fn, max_batch_size=8, max_wait_ms=50)
+        futures = [scheduler.submit(f'clip {i}') for i in range(5)]
+        results = [f.result(timeout=2) for f in futures]
+        scheduler.close()
+
+        assert results == [f'CLIP {i}' for i in range(5)], f"Unexpected results: {results}"
+        print("✓ Each caller receives its own result in order")
+
+        assert batch_sizes == [5], f"Expected one batch of 5, got {batch_sizes}"
+        print(f"✓ 5 submissions decoded in {len(batch_sizes)} batch")
+
+        return True
+    except Exception as e:
+        print(f"✗ Batching test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_batch_size_and_keys():
+    """Test that batches respect the size limit and never mix keys"""
+    print("\n=== Testing Batch Limits ===")
+    try:
+        from whisper_batch import InferenceScheduler
+
+        batches = []
+        release = threading.Event()
+
+        def batch_fn(items, key):
+            release.wait(2)
+            batches.append((key, list(items)))
+            return items
+
+        scheduler = InferenceScheduler(batch_fn, max_batch_size=2, max_wait_ms=30)
+        futures = [
+            scheduler.submit('a1', 'en'),
+            scheduler.submit('b1', 'ru'),
+            scheduler.submit('a2', 'en'),
+            scheduler.submit('a3', 'en'),
+        ]
+        release.set()
+        for f in futures:
+            f.result(timeout=2)
+        scheduler.close()
+
+        for key, items in batches:
+            assert len(items) <= 2, f"Batch exceeded size limit: {items}"
+            assert all(item[0] == ('a' if key == 'en' else 'b') for item in items), \
+                f"Batch mixed languages: {key} {items}"
+        print(f"✓ Batches respect size limit and language key: {batches}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Batch limit test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_errors_reach_every_caller():
+    """Test that a failing batch propagates the error to each future"""
+    print("\n=== Testing Error Propagation ===")
+    try:
+        from whisper_batch import InferenceScheduler
+
+        def batch_fn(items, key):
+            raise RuntimeError("decoder failure")
+
+        scheduler = InferenceScheduler(batch_fn, max_wait_ms=20)
+        futures = [scheduler.submit(i) for i in range(3)]
+        for f in futures:
+            try:
+                f.result(timeout=2)
+                print("✗ Expected an exception")
+                return False
+            except RuntimeError as e:
+                assert 'decoder failure' in str(e)
+        scheduler.close()
+        print("✓ Batch failure reported to all callers")
+
+        return True
+    except Exception as e:
+        print(f"✗ Error propagation test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_packed_window_plan():
+    """Test that short clips are packed into shared 30-second windows"""
+    print("\n=== Testing Window Packing ===")
+    try:
+        from whisper_batch import plan_packed_windows
+
+        windows = plan_packed_windows([1.5] * 20, gap=0.5, window=30.0)
+        assert len(windows) == 2, f"Expected 2 windows for 20 x 1.5 s clips, got {len(windows)}"
+        assert windows[0][:2] == [(0, 0.0), (1, 2.0)], f"Unexpected offsets: {windows[0][:2]}"
+        print(f"✓ 20 short clips packed into {len(windows)} windows")
+
+        windows = plan_packed_windows([40.0, 2.0], gap=0.5, window=30.0)
+        assert windows == [[(0, 0.0)], [(1, 0.0)]], f"Unexpected plan: {windows}"
+        print("✓ Oversized clip gets a window of its own")
+
+        return True
+    except Exception as e:
+        print(f"✗ Window packing test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_split_packed_words():
+    """Test that timestamped words are split back to their clips"""
+    print("\n=== Testing Transcript Splitting ===")
+    try:
+        from whisper_batch import split_packed_words
+
+        placements = [(0, 0.0), (1, 2.0), (2, 4.5)]
+        durations = [1.5, 2.0, 1.0]
+        words = [
+            (0.1, 0.6, ' turn'), (0.7, 1.4, ' left'),
+            (2.1, 2.8, ' stop'), (2.9, 3.9, ' here'),
+            (4.5, 5.3, ' go'),
+        ]
+        texts = split_packed_words(words, placements, durations, gap=0.5)
+        assert texts == {0: 'turn left', 1: 'stop here', 2: 'go'}, f"Unexpected split: {texts}"
+        print(f"✓ Transcript split back per clip: {texts}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Transcript splitting test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("Batched Whisper Inference Tests")
+    print("=" * 50)
+
+    results = []
+    results.append(("Request Batching", test_requests_are_batched()))
+    results.append(("Batch Limits", test_batch_size_and_keys()))
+    results.append(("Error Propagation", test_errors_reach_every_caller()))
+    results.append(("Window Packing", test_packed_window_plan()))
+    results.append(("Transcript Splitting", test_split_packed_words()))
+
+    print("\n" + "=" * 50)
+    for name, result in results:
+        symbol = "✓" if result else "✗"
+        print(f"{symbol} {name}: {'PASS' if result else 'FAIL'}")
+
+    if all(result for _, result in results):
+        print("\n✓ All tests passed!")
+        return 0
+    print("\n✗ Some tests failed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Rule-based sentence segmentation for translation
+
+Splits text at sentence-final punctuation and line breaks, without
+language models. Abbreviations ("Dr.", "e.g."), initials, decimals and
+sentence punctuation followed by a lower-case word do not end a
+sentence. Each segment keeps the whitespace that followed it so the
+translated text can be reassembled with the original layout.
+"""
+
+import re
+
+# Lower-case abbreviations (without the final dot) that rarely end a sentence
+ABBREVIATIONS = frozenset('''
+    mr mrs ms dr prof sr jr st vs etc e.g i.e cf al inc ltd co corp no nos fig
+    approx dept est min max mt ave rd jan feb mar apr jun jul aug sep sept oct
+    nov dec gen col lt sgt capt rev vol pp ed eds
+'''.split())
+
+# Latin-script terminators need following whitespace; CJK ones do not
+_BOUNDARY = re.compile(
+    r'[.!?…]+[\'"”’»)\]]*(?P<space>\s+|$)'
+    r'|[。！？]+[」』”’)]*(?P<cjk_space>\s*)'
+    r'|(?P<newline>[ \t]*\n\s*)'
+)
+_WORD_BEFORE = re.compile(r'(\S+)\.$')
+_SOFT_BREAK = re.compile(r'[,;:、，]\s+|\s+')
+
+
+def _is_abbreviation(sentence):
+    """True if a sentence candidate ends in an abbreviation or initial"""
+    match = _WORD_BEFORE.search(sentence)
+    if not match:
+        return False
+    word = match.group(1).lstrip('(["\'').lower()
+    return word in ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+def _split_long(sentence, max_chars):
+    """Split an over-long sentence at clause breaks, then at spaces"""
+    pieces = []
+    while len(sentence) > max_chars:
+        clause = space = None
+        for match in _SOFT_BREAK.finditer(sentence, 1, max_chars + 1):
+            if match.group().strip():
+                clause = match
+            else:
+                space = match
+        cut = clause or space
+        if cut is None:
+            pieces.append((sentence[:max_chars], ''))
+            sentence = sentence[max_chars:]
+        else:
+            pieces.append((sentence[:cut.end()].rstrip(), ' '))
+            sentence = sentence[cut.end():]
+    pieces.append((sentence, ''))
+    return pieces
+
+
+def segment_text(text, max_chars=500):
+    """Split text into [(sentence, separator), ...]
+
+    ``''.join(s + sep for s, sep in segment_text(text))`` gives back the
+    text minus leading and trailing whitespace. Sentences longer than
+    ``max_chars`` are broken at commas/semicolons or spaces (those pieces
+    get a single space as separator).
+    """
+    text = text.strip()
+    segments = []
+    start = 0
+    for match in _BOUNDARY.finditer(text):
+        if match.group('newline') is not None:
+            end = match.start()
+            separator = match.group()
+        else:
+            space = match.group('space') if match.group('space') is not None else match.group('cjk_space')
+            end = match.end() - len(space)
+            separator = space
+            following = text[match.end():match.end() + 1]
+            if match.group('space') is not None and (
+                    _is_abbreviation(text[start:end]) or following.islower()):
+                continue
+        sentence = text[start:end]
+        if sentence.strip():
+            segments.append((sentence.strip(), separator))
+        elif segments:
+            last, last_separator = segments[-1]
+            segments[-1] = (last, last_separator + separator)
+        start = match.end()
+    if start < len(text):
+        segments.append((text[start:].strip(), ''))
+
+    result = []
+    for sentence, separator in segments:
+        if len(sentence) > max_chars:
+            pieces = _split_long(sentence, max_chars)
+            pieces[-1] = (pieces[-1][0], separator)
+            result.extend(pieces)
+        else:
+            result.append((sentence, separator))
+    return result
+
+
+def split_sentences(text, max_chars=500):
+    """Just the sentences of ``segment_text``"""
+    return [sentence for sentence, _ in segment_text(text, max_chars)]
+
+
+def join_segments(sentences, separators):
+    """Reassemble (translated) sentences with the original separators"""
+    return ''.join(sentence + separator for sentence, separator in zip(sentences, separators)).strip()
@@ -0,0 +1,114 @@
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from features import log_mel_spectrogram
+
+# Mel bands whose strongest bin is recorded per frame
+PEAK_BANDS = ((0, 10), (10, 20), (20, 35), (35, 55), (55, 80))
+NO_PEAK = 255
+
+
+def fingerprint_log_mel(log_mel, floor=-6.0, frame_range=4.0, peak_range=2.0, min_run=3):
+    """Hash the spectral peaks of the voiced part of a log10 mel spectrogram
+
+    Frames more than ``frame_range`` (40 dB) below the loudest one are
+    trimmed from both ends as silence. Each remaining frame contributes the
+    strongest bin of every band that comes within ``peak_range`` (20 dB) of
+    the frame's loudest bin. Peak patterns held for fewer than ``min_run``
+    frames (onsets, transitions) are dropped and repeats collapsed, so the
+    key survives gain changes and small shifts in where speech starts.
+    Returns None for silent audio.
+    """
+    if log_mel.shape[1] == 0:
+        return None
+    loudness = log_mel.max(axis=0)
+    if loudness.max() < floor:
+        return None
+    voiced = np.flatnonzero(loudness >= loudness.max() - frame_range)
+    frames = log_mel[:, voiced[0]:voiced[-1] + 1]
+    loudness = loudness[voiced[0]:voiced[-1] + 1]
+
+    peaks = np.stack([
+        np.where(frames[lo:hi].max(axis=0) >= loudness - peak_range,
+                 frames[lo:hi].argmax(axis=0) + lo, NO_PEAK)
+        for lo, hi in PEAK_BANDS
+    ], axis=1).astype(np.uint8)
+
+    starts = np.flatnonzero(np.concatenate([[True], np.any(peaks[1:] != peaks[:-1], axis=1)]))
+    runs = np.diff(np.append(starts, len(peaks)))
+    peaks = peaks[starts[runs >= min_run]]
+    if len(peaks) == 0:
+        return None
+    changes = np.concatenate([[True], np.any(peaks[1:] != peaks[:-1], axis=1)])
+    return hashlib.sha1(peaks[changes].tobytes()).hexdigest()
+
+
+def audio_fingerprint(pcm):
+    """Fingerprint a float32 16 kHz clip (see ``fingerprint_log_mel``)"""
+    return fingerprint_log_mel(log_mel_spectrogram(pcm))
+
+
+class TranscriptCache:
+    """LRU cache of recognised transcripts keyed by audio fingerprint
+
+    Keys combine the fingerprint with the recognition model and language so
+    different engines never share entries. With ``persist`` enabled entries
+    are also written to the database and survive restarts. Hits and misses
+    are counted in the database ``stats`` table.
+    """
+
+    def __init__(self, db, capacity=256, persist=False):
+        self.db = db
+        self.capacity = capacity
+        self.persist = persist
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, log_mel, model, language):
+        """Build the cache key for a clip's log-mel frames, or None if it is silent"""
+        fingerprint = fingerprint_log_mel(log_mel)
+        if fingerprint is None:
+            return None
+        return (fingerprint, model, language)
+
+    def get(self, key):
+        """Return the cached transcript for a key, or None on a miss"""
+        with self._lock:
+            transcript = self._entries.get(key)
+            if transcript is not None:
+                self._entries.move_to_end(key)
+
+        if transcript is None and self.persist:
+            transcript = self.db.get_cached_transcript(*key)
+            if transcript is not None:
+                self._remember(key, transcript)
+
+        if transcript is None:
+            self.misses += 1
+            self.db.increment_stat('transcript_cache_misses')
+        else:
+            self.hits += 1
+            self.db.increment_stat('transcript_cache_hits')
+        return transcript
+
+    def put(self, key, transcript):
+        """Store a transcript"""
+        self._remember(key, transcript)
+        if self.persist:
+            self.db.store_cached_transcript(*key, transcript)
+
+    def _remember(self, key, transcript):
+        with self._lock:
+            self._entries[key] = transcript
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_text(text):
+    """Normalise text for cache lookups: trim and collapse whitespace
+
+    Case is kept: "US" and "us" or "Polish" and "polish" translate
+    differently.
+    """
+    return ' '.join(text.split())
+
+
+class TranslationCache:
+    """Two-level translation cache: in-memory LRU in front of SQLite
+
+    Entries are keyed by normalised text, source and target language and
+    provider. The memory layer answers repeat phrases without touching the
+    database; misses fall through to the persistent ``translation_cache``
+    table, which survives restarts. Both layers expire entries after
+    ``ttl`` seconds; the table is trimmed to ``max_rows`` least recently
+    used entries every ``prune_every`` stores.
+    """
+
+    def __init__(self, db, capacity=1024, ttl=30 * 24 * 3600, max_rows=50000,
+                 prune_every=200, stats_flush_every=50):
+        self.db = db
+        self.capacity = capacity
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.prune_every = prune_every
+        self.stats_flush_every = stats_flush_every
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stores = 0
+        self._unflushed = {'memory_hits': 0, 'db_hits': 0, 'misses': 0}
+
+    def get(self, text, source, target, provider):
+        """Return a cached translation, or None on a miss"""
+        key = (normalize_text(text), source, target, provider)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                translation, created = entry
+                if now - created < self.ttl:
+                    self._entries.move_to_end(key)
+                    self._count('memory_hits')
+                    return translation
+                del self._entries[key]
+
+        translation = self.db.get_cached_translation(*key, min_created=now - self.ttl)
+        with self._lock:
+            if translation is None:
+                self._count('misses')
+                return None
+            self._remember(key, translation, now)
+            self._count('db_hits')
+        return translation
+
+    def put(self, text, source, target, provider, translation):
+        """Store a translation in both layers"""
+        key = (normalize_text(text), source, target, provider)
+        with self._lock:
+            self._remember(key, translation, time.time())
+            self._stores += 1
+            prune = self._stores % self.prune_every == 0
+        self.db.store_cached_translation(*key, translation)
+        if prune:
+            self.db.prune_translation_cache(self.max_rows, time.time() - self.ttl)
+
+    def stats(self):
+        """Return hit/miss counters and the overall hit rate"""
+        with self._lock:
+            lookups = self.memory_hits + self.db_hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'db_hits': self.db_hits,
+                'misses': self.misses,
+                'hit_rate': (self.memory_hits + self.db_hits) / lookups if lookups else 0.0,
+                'size': len(self._entries),
+            }
+
+    def flush_stats(self):
+        """Write counters accumulated since the last flush to the stats table"""
+        with self._lock:
+            pending = self._unflushed
+            self._unflushed = {name: 0 for name in pending}
+        for name, amount in pending.items():
+            if amount:
+                self.db.increment_stat(f'translation_cache_{name}', amount)
+
+    def _count(self, name):
+        """Bump a counter (caller holds the lock)"""
+        setattr(self, name, getattr(self, name) + 1)
+        self._unflushed[name] += 1
+        # Written in batches off-thread so a memory hit never waits on SQLite
+        if sum(self._unflushed.values()) >= self.stats_flush_every:
+            threading.Thread(target=self.flush_stats, daemon=True).start()
+
+    def _remember(self, key, translation, created):
+        self._entries[key] = (translation, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
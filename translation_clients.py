@@ -0,0 +1,233 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+GOOGLE_URL = 'https://translate.googleapis.com/translate_a/single'
+DEEPL_URL = 'https://api.deepl.com/v2/translate'
+DEEPL_FREE_URL = 'https://api-free.deepl.com/v2/translate'
+
+# Languages DeepL translates, by the base codes used in translator.py
+DEEPL_LANGUAGES = {
+    'ar', 'bg', 'cs', 'da', 'de', 'el', 'en', 'es', 'et', 'fi', 'fr', 'hu', 'id',
+    'it', 'ja', 'ko', 'lt', 'lv', 'nb', 'nl', 'pl', 'pt', 'ro', 'ru', 'sk', 'sl',
+    'sv', 'tr', 'uk', 'zh',
+}
+# Target codes DeepL wants a regional variant for
+DEEPL_TARGET_VARIANTS = {
+    'en': 'EN-US', 'en-us': 'EN-US', 'en-gb': 'EN-GB',
+    'pt': 'PT-PT', 'pt-pt': 'PT-PT', 'pt-br': 'PT-BR',
+    'zh': 'ZH-HANS', 'zh-cn': 'ZH-HANS', 'zh-tw': 'ZH-HANT',
+}
+
+# Seconds to wait for a provider to connect / answer
+DEFAULT_TIMEOUT = 10
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class ProviderError(Exception):
+    """A translation provider answered with an error status"""
+
+    def __init__(self, provider, status_code, message=''):
+        super().__init__(f"{provider} returned HTTP {status_code} {message}".strip())
+        self.provider = provider
+        self.status_code = status_code
+
+
+def create_session(pool_connections=4, pool_maxsize=16):
+    """Create a keep-alive session with a bounded connection pool
+
+    Up to ``pool_maxsize`` connections per host are kept open and reused;
+    callers beyond that wait for a free connection instead of opening more.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                          pool_block=True, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = 'Mozilla/5.0 (voice_helper)'
+    return session
+
+
+def get_session():
+    """Return the process-wide pooled session shared by all clients"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def deepl_code(code, target=False):
+    """Map a language code such as 'en' or 'zh-CN' to DeepL's code
+
+    Source languages are plain ('EN'); targets that DeepL splits by region
+    get a default variant ('EN-US'). 'auto' maps to None (DeepL detects
+    the source when it is omitted). Raises ValueError for languages DeepL
+    does not offer.
+    """
+    if not code or code == 'auto':
+        if target:
+            raise ValueError("DeepL needs an explicit target language")
+        return None
+    code = code.lower()
+    base = code.split('-')[0]
+    if base == 'no':
+        base = 'nb'
+    if base not in DEEPL_LANGUAGES:
+        raise ValueError(f"DeepL does not support language '{code}'")
+    if target:
+        return DEEPL_TARGET_VARIANTS.get(code, DEEPL_TARGET_VARIANTS.get(base, base.upper()))
+    return base.upper()
+
+
+class TranslationClient:
+    """Long-lived client for one provider and language pair"""
+    provider = None
+    max_chars = 5000  # characters accepted per request
+    max_texts = None  # texts accepted per request (None: no limit)
+
+    def __init__(self, source, target, session=None, timeout=DEFAULT_TIMEOUT, auth_key=None):
+        self.source = source
+        self.target = target
+        self.session = session or get_session()
+        self.timeout = timeout
+        self.auth_key = auth_key
+
+    def translate(self, text):
+        raise NotImplementedError
+
+    def translate_many(self, texts):
+        """Translate several texts in one request, one result per text
+
+        The default packs the texts one per line into a single request and
+        splits the answer on newlines; if the provider merged or split lines
+        the texts are translated one by one instead.
+        """
+        texts = [' '.join(text.split()) for text in texts]
+        parts = self.translate('\n'.join(texts)).split('\n')
+        if len(parts) != len(texts):
+            return [self.translate(text) for text in texts]
+        return [part.strip() for part in parts]
+
+    @classmethod
+    def supports(cls, source, target):
+        """True if the provider offers this language pair"""
+        return True
+
+    def _check(self, response):
+        if response.status_code != 200:
+            raise ProviderError(self.provider, response.status_code, response.reason or '')
+
+
+class GoogleClient(TranslationClient):
+    """Google Translate's free web endpoint over the shared session"""
+    provider = 'google'
+
+    def __init__(self, source, target, session=None, timeout=DEFAULT_TIMEOUT, base_url=GOOGLE_URL):
+        super().__init__(source, target, session, timeout)
+        self.base_url = base_url
+
+    def translate(self, text):
+        text = text.strip()
+        if not text or self.source == self.target:
+            return text
+        response = self.session.get(self.base_url, params={
+            'client': 'gtx', 'sl': self.source, 'tl': self.target, 'dt': 't', 'q': text,
+        }, timeout=self.timeout)
+        self._check(response)
+        # Response is [[["translated", "original", ...], ...], ...]
+        return ''.join(part[0] for part in response.json()[0] if part[0])
+
+
+class DeepLClient(TranslationClient):
+    """DeepL API v2; several texts travel in one request"""
+    provider = 'deepl'
+    max_chars = 30000  # request bodies are capped at 128 KiB
+    max_texts = 50
+
+    def __init__(self, source, target, session=None, timeout=DEFAULT_TIMEOUT, auth_key=None,
+                 base_url=None):
+        super().__init__(source, target, session, timeout, auth_key)
+        self.source_code = deepl_code(source)
+        self.target_code = deepl_code(target, target=True)
+        if base_url is None:
+            # Free-plan keys end in ':fx' and live on a separate host
+            base_url = DEEPL_FREE_URL if (auth_key or '').endswith(':fx') else DEEPL_URL
+        self.base_url = base_url
+
+    @classmethod
+    def supports(cls, source, target):
+        try:
+            deepl_code(source)
+            deepl_code(target, target=True)
+        except ValueError:
+            return False
+        return True
+
+    def translate(self, text):
+        return self.translate_many([text])[0]
+
+    def translate_many(self, texts):
+        texts = [' '.join(text.split()) for text in texts]
+        if not any(texts) or self.source_code == self.target_code.split('-')[0]:
+            return texts
+        if not self.auth_key:
+            raise ValueError("DeepL API key is not set (Settings > DeepL API key)")
+        body = {'text': texts, 'target_lang': self.target_code}
+        if self.source_code:
+            body['source_lang'] = self.source_code
+        response = self.session.post(self.base_url, json=body, timeout=self.timeout,
+                                     headers={'Authorization': f'DeepL-Auth-Key {self.auth_key}'})
+        self._check(response)
+        translations = [item['text'] for item in response.json()['translations']]
+        if len(translations) != len(texts):
+            raise ProviderError(self.provider, response.status_code,
+                                f"sent {len(texts)} texts, got {len(translations)} back")
+        return translations
+
+
+CLIENTS = {
+    GoogleClient.provider: GoogleClient,
+    DeepLClient.provider: DeepLClient,
+}
+
+
+class ClientPool:
+    """Keeps one client per (provider, source, target), all on one session
+
+    ``client_options`` go to every client; ``provider_options`` maps a
+    provider name to extra options for that provider only.
+    """
+
+    def __init__(self, session=None, provider_options=None, **client_options):
+        self.session = session
+        self.client_options = client_options
+        self.provider_options = provider_options or {}
+        self._auth_keys = {}
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def set_auth_key(self, provider, auth_key):
+        """Use a new API key for a provider, replacing its existing clients"""
+        with self._lock:
+            if self._auth_keys.get(provider) == auth_key:
+                return
+            self._auth_keys[provider] = auth_key
+            self._clients = {key: client for key, client in self._clients.items()
+                             if key[0] != provider}
+
+    def get(self, provider, source, target):
+        """Return the long-lived client for a provider and language pair"""
+        key = (provider, source, target)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                options = dict(self.client_options, **self.provider_options.get(provider, {}))
+                if provider in self._auth_keys:
+                    options['auth_key'] = self._auth_keys[provider]
+                client = CLIENTS[provider](source, target, self.session or get_session(),
+                                           **options)
+                self._clients[key] = client
+            return client
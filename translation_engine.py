@@ -0,0 +1,180 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from translation_clients import ProviderError
+
+
+class TranslationTimeout(Exception):
+    """A translation did not finish before its deadline"""
+    pass
+
+
+def is_retryable(error):
+    """Network failures, throttling and server errors are worth retrying"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, ProviderError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+class AsyncTranslationEngine:
+    """Runs translations on a private asyncio loop with deadlines and retries
+
+    Every request gets an overall deadline, failed attempts are retried with
+    jittered exponential backoff while time remains, and a global semaphore
+    caps the number of provider calls in flight. Blocking provider calls
+    run on a thread pool of the same size, so a stalled endpoint can never
+    pile up more than ``max_concurrency`` threads.
+
+    Kivy code uses the thread-safe facade: ``submit`` returns a
+    concurrent.futures.Future (optionally calling ``callback(future)`` when
+    done) and ``translate`` blocks for the result.
+    """
+
+    def __init__(self, service, max_concurrency=6, timeout=8.0, retries=2,
+                 backoff_base=0.5, backoff_max=4.0):
+        self.service = service
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix='translate')
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    async def translate_async(self, text, target_lang, source_lang='auto', timeout=None, **options):
+        """Translate within ``timeout`` seconds, retrying transient failures
+
+        Extra keyword ``options`` are passed through to the service's
+        ``translate_or_raise``, together with ``deadline``: the
+        ``time.monotonic()`` time at which this request gives up, so the
+        service can stop waiting (e.g. for a rate limit) in time.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.timeout)
+        attempt = 0
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TranslationTimeout(f"Translation timed out after {attempt} attempt(s)")
+            try:
+                async with self._semaphore:
+                    call_deadline = time.monotonic() + (deadline - loop.time())
+                    call = loop.run_in_executor(
+                        self._executor,
+                        lambda: self.service.translate_or_raise(text, target_lang, source_lang,
+                                                                deadline=call_deadline, **options))
+                    return await asyncio.wait_for(call, deadline - loop.time())
+            except asyncio.TimeoutError:
+                raise TranslationTimeout(f"Translation timed out after {attempt + 1} attempt(s)")
+            except Exception as e:
+                if attempt >= self.retries or not is_retryable(e):
+                    raise
+                delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+                delay *= random.uniform(0.5, 1.5)
+                if loop.time() + delay >= deadline:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def translate_segments_async(self, texts, target_lang, source_lang='auto',
+                                       on_segment=None, max_parallel=3, timeout=None):
+        """Translate several texts concurrently, at most ``max_parallel`` at once
+
+        Returns one dict per text ({'text', 'translation', 'error',
+        'exception'}) in input order. ``on_segment(index, result)`` is called in input order as soon
+        as every earlier text is done, so callers can stream results.
+        """
+        limit = asyncio.Semaphore(max_parallel)
+        results = [None] * len(texts)
+        next_index = 0
+
+        async def translate_one(index, text):
+            nonlocal next_index
+            async with limit:
+                try:
+                    translation = await self.translate_async(text, target_lang, source_lang, timeout)
+                    results[index] = {'text': text, 'translation': translation, 'error': None,
+                                      'exception': None}
+                except Exception as e:
+                    results[index] = {'text': text, 'translation': None,
+                                      'error': str(e) or type(e).__name__, 'exception': e}
+            while next_index < len(results) and results[next_index] is not None:
+                if on_segment:
+                    on_segment(next_index, results[next_index])
+                next_index += 1
+
+        await asyncio.gather(*(translate_one(i, text) for i, text in enumerate(texts)))
+        return results
+
+    async def translate_targets_async(self, text, target_langs, source_lang='auto',
+                                      on_target=None, timeout=None):
+        """Translate one text into several languages concurrently
+
+        Returns one dict per target ({'target', 'translation', 'error',
+        'exception'}) in ``target_langs`` order. ``on_target(result)`` is called as each
+        translation arrives, fastest first, so the total wait is that of
+        the slowest target (within ``max_concurrency``).
+        """
+        async def translate_one(target_lang):
+            try:
+                translation = await self.translate_async(text, target_lang, source_lang, timeout)
+                result = {'target': target_lang, 'translation': translation, 'error': None,
+                          'exception': None}
+            except Exception as e:
+                result = {'target': target_lang, 'translation': None,
+                          'error': str(e) or type(e).__name__, 'exception': e}
+            if on_target:
+                on_target(result)
+            return result
+
+        return list(await asyncio.gather(*(translate_one(target) for target in target_langs)))
+
+    def run(self, coroutine):
+        """Schedule a coroutine on the engine loop and return a Future"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def submit(self, text, target_lang, source_lang='auto', callback=None, timeout=None, **options):
+        """Start a translation from any thread; returns a concurrent Future"""
+        future = self.run(self.translate_async(text, target_lang, source_lang, timeout, **options))
+        if callback:
+            future.add_done_callback(callback)
+        return future
+
+    def submit_segments(self, texts, target_lang, source_lang='auto', on_segment=None,
+                        callback=None, max_parallel=3):
+        """Start ``translate_segments_async`` from any thread; returns a Future"""
+        future = self.run(self.translate_segments_async(texts, target_lang, source_lang,
+                                                        on_segment, max_parallel))
+        if callback:
+            future.add_done_callback(callback)
+        return future
+
+    def submit_targets(self, text, target_langs, source_lang='auto', on_target=None,
+                       callback=None):
+        """Start ``translate_targets_async`` from any thread; returns a Future"""
+        future = self.run(self.translate_targets_async(text, target_langs, source_lang, on_target))
+        if callback:
+            future.add_done_callback(callback)
+        return future
+
+    def translate(self, text, target_lang, source_lang='auto', timeout=None, **options):
+        """Blocking translation (do not call from the Kivy main thread)"""
+        timeout = timeout or self.timeout
+        return self.submit(text, target_lang, source_lang, timeout=timeout, **options).result()
+
+    def close(self):
+        """Stop the loop and release worker threads"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2)
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,101 @@
+"""
+Translation memory: reuse translations of near-duplicate sentences
+
+Every translation fetched from a provider is stored with the character
+trigrams of its normalised source text. A new sentence that is not in the
+cache is looked up by its trigrams; the stored sentence with the highest
+Dice similarity above ``threshold`` is offered as a fuzzy match
+("the train to Munich is delayed" for "the train to Berlin is delayed"),
+so the caller can show it at once while the real translation is fetched.
+"""
+
+import threading
+
+from translation_cache import normalize_text
+
+# Thresholds are clamped to [MIN_THRESHOLD, 1]; 0 would match everything
+# and make the candidate length bounds divide by zero
+MIN_THRESHOLD = 0.05
+
+
+def clamp_threshold(threshold):
+    """Similarity threshold limited to [MIN_THRESHOLD, 1]"""
+    return min(1.0, max(MIN_THRESHOLD, threshold))
+
+
+def trigrams(text):
+    """Distinct character trigrams of normalised, casefolded, space-padded text"""
+    padded = f' {normalize_text(text).casefold()} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class MemoryMatch:
+    """A stored translation whose source text resembles the query"""
+
+    def __init__(self, text, translation, similarity):
+        self.text = text
+        self.translation = translation
+        self.similarity = similarity
+
+    def __repr__(self):
+        return f"MemoryMatch({self.text!r}, similarity={self.similarity:.2f})"
+
+
+class TranslationMemory:
+    """Near-duplicate lookup over the ``translation_memory`` tables
+
+    ``find`` narrows candidates with the trigram index in SQLite (only
+    entries of a compatible length that share trigrams are counted) and
+    returns the best match with Dice similarity of at least ``threshold``
+    (clamped to [MIN_THRESHOLD, 1]).
+    The tables are trimmed to ``max_entries`` most recently stored entries
+    every ``prune_every`` stores.
+    """
+
+    def __init__(self, db, threshold=0.7, candidates=20, max_entries=20000, prune_every=200):
+        self.db = db
+        self.threshold = clamp_threshold(threshold)
+        self.candidates = candidates
+        self.max_entries = max_entries
+        self.prune_every = prune_every
+        self._lock = threading.Lock()
+        self._stores = 0
+
+    def add(self, text, source, target, translation):
+        """Remember a provider translation"""
+        grams = trigrams(text)
+        if not grams:
+            return
+        self.db.store_memory_entry(normalize_text(text), source, target, translation, grams)
+        with self._lock:
+            self._stores += 1
+            prune = self._stores % self.prune_every == 0
+        if prune:
+            self.db.prune_translation_memory(self.max_entries)
+
+    def find(self, text, source, target, threshold=None):
+        """Best near-duplicate stored sentence, or None
+
+        None too when the text itself is stored: exact repeats are the
+        translation cache's job, and its answer is not fuzzy.
+        """
+        threshold = self.threshold if threshold is None else clamp_threshold(threshold)
+        grams = trigrams(text)
+        if not grams:
+            return None
+        normalized = normalize_text(text)
+        size = len(grams)
+        # Dice >= t needs the other gram count within [size*t/(2-t), size*(2-t)/t]
+        candidates = self.db.find_memory_candidates(
+            grams, source, target,
+            min_grams=size * threshold / (2 - threshold),
+            max_grams=size * (2 - threshold) / threshold,
+            limit=self.candidates)
+        best = None
+        for stored_text, translation, stored_size, shared in candidates:
+            if stored_text == normalized:
+                return None
+            similarity = 2 * shared / (size + stored_size)
+            if similarity >= threshold and (best is None or similarity > best.similarity):
+                best = MemoryMatch(stored_text, translation, similarity)
+        return best
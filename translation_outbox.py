@@ -0,0 +1,166 @@
+"""
+Outbox for translations that failed while the network was down
+
+Requests that fail for network reasons are stored in the
+``translation_outbox`` table instead of being lost. A worker thread
+flushes them once connectivity returns: one queued request is sent first
+as a probe, and only if it succeeds are the rest translated in batches
+per language pair. Every failure pushes the entry's next attempt back with
+jittered exponential backoff. Results are handed to ``on_result`` so the
+UI can put them in the log.
+"""
+
+import random
+import threading
+import time
+
+from provider_router import CircuitOpenError
+from translation_engine import TranslationTimeout, is_retryable
+
+
+def should_queue(error):
+    """Errors that mean "try again when the network is back" """
+    return is_retryable(error) or isinstance(error, (CircuitOpenError, TranslationTimeout))
+
+
+class OutboxEntry:
+    """A queued translation request"""
+
+    def __init__(self, id, text, source, target, attempts=0, last_error=None, created=None):
+        self.id = id
+        self.text = text
+        self.source = source
+        self.target = target
+        self.attempts = attempts
+        self.last_error = last_error
+        self.created = created
+
+    def __repr__(self):
+        return f"OutboxEntry({self.id}, {self.text!r}, {self.source}->{self.target})"
+
+
+class TranslationOutbox:
+    """Persistent queue of translations to retry, flushed in the background
+
+    ``service`` is the TranslationService; its ``db`` holds the queue and
+    its ``translate_or_raise``/``translate_batch`` do the work.
+    ``on_result(entry, translation, error)`` is called from the worker
+    thread for every entry that leaves the queue: translated, or given up
+    on after ``max_attempts``.
+    """
+
+    def __init__(self, service, batch_size=20, poll_interval=5.0, backoff_base=5.0,
+                 backoff_max=300.0, max_attempts=20, on_result=None):
+        self.service = service
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_attempts = max_attempts
+        self.on_result = on_result
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+    def enqueue(self, text, target_lang, source_lang='auto', error=None):
+        """Queue a request for later; returns its OutboxEntry"""
+        entry_id = self.service.db.add_outbox_entry(
+            text, source_lang, target_lang, str(error) if error else None)
+        return OutboxEntry(entry_id, text, source_lang, target_lang, 0, str(error) if error else None)
+
+    def pending(self):
+        """All queued entries, oldest first"""
+        return [OutboxEntry(*row) for row in self.service.db.get_outbox_entries()]
+
+    def flush(self, now=None):
+        """Send due entries; returns the number delivered
+
+        Stops early (deferring the rest) if the probe request shows the
+        network is still down. Entries that fail for a reason retrying
+        cannot fix (see should_queue) are given up on at once.
+        """
+        with self._flush_lock:
+            now = time.time() if now is None else now
+            due = [OutboxEntry(*row) for row in self.service.db.get_due_outbox_entries(now)]
+            if not due:
+                return 0
+
+            probe, rest = due[0], due[1:]
+            try:
+                translation = self.service.translate_or_raise(probe.text, probe.target, probe.source)
+            except Exception as e:
+                if should_queue(e):
+                    for entry in due:
+                        self._defer(entry, e, now)
+                else:
+                    self._finish(probe, None, str(e))
+                    self._wake.set()
+                return 0
+            self._finish(probe, translation, None)
+            delivered = 1
+
+            groups = {}
+            for entry in rest:
+                groups.setdefault((entry.source, entry.target), []).append(entry)
+            for (source, target), entries in groups.items():
+                for start in range(0, len(entries), self.batch_size):
+                    batch = entries[start:start + self.batch_size]
+                    try:
+                        results = self.service.translate_batch([entry.text for entry in batch],
+                                                               target, source)
+                    except Exception as e:
+                        results = [{'error': str(e), 'exception': e}] * len(batch)
+                    for entry, result in zip(batch, results):
+                        if result['error'] is None:
+                            self._finish(entry, result['translation'], None)
+                            delivered += 1
+                        elif should_queue(result['exception']):
+                            self._defer(entry, result['error'], now)
+                        else:
+                            self._finish(entry, None, result['error'])
+            return delivered
+
+    def start(self):
+        """Start the background worker (idempotent)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='translation-outbox', daemon=True)
+            self._thread.start()
+
+    def wake(self):
+        """Flush now instead of at the next poll (e.g. after enqueueing)"""
+        self._wake.set()
+
+    def close(self):
+        self._closed.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def backoff(self, attempts):
+        """Delay before attempt number ``attempts + 1``, jittered between half and full"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempts))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _run(self):
+        while not self._closed.is_set():
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            if self._closed.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Outbox flush error: {e}")
+
+    def _defer(self, entry, error, now):
+        attempts = entry.attempts + 1
+        if attempts >= self.max_attempts:
+            self._finish(entry, None, str(error))
+            return
+        self.service.db.defer_outbox_entry(entry.id, now + self.backoff(entry.attempts), str(error))
+
+    def _finish(self, entry, translation, error):
+        self.service.db.delete_outbox_entry(entry.id)
+        if self.on_result:
+            self.on_result(entry, translation, error)
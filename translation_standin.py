@@ -0,0 +1,135 @@
+"""
+Local HTTP stand-in for translation providers
+
+Used by tests and benchmarks to exercise the real HTTP clients without
+network access. Translations are fake (the text is upper-cased and
+tagged with the target language) but the wire format matches the
+provider's, and the server counts requests and TCP connections so
+connection reuse can be checked.
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+def fake_translation(text, target):
+    return f"[{target}] {text.upper()}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; avoid Nagle stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        self._respond_google(params)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length) or b'{}')
+        self._respond_deepl(body)
+
+    def _respond_deepl(self, body):
+        standin = self.server.standin
+        standin.on_request('deepl', body)
+        if not self.headers.get('Authorization', '').startswith('DeepL-Auth-Key '):
+            return self._send(403, {'message': 'Authorization failure'})
+        texts = body.get('text', [])
+        if standin.fail_status or standin.fail_on.intersection(texts):
+            return self._send(standin.fail_status or 500, {'message': 'stand-in failure'})
+        target = body.get('target_lang', 'EN-US')
+        source = body.get('source_lang', 'EN')
+        self._send(200, {'translations': [
+            {'detected_source_language': source, 'text': fake_translation(text, target)}
+            for text in texts]})
+
+    def _respond_google(self, params):
+        standin = self.server.standin
+        standin.on_request('google', params)
+        text = params.get('q', [''])[0]
+        if standin.fail_status or standin.fail_on.intersection(text.split('\n')):
+            return self._send(standin.fail_status or 500, {'error': 'stand-in failure'})
+        target = params.get('tl', ['en'])[0]
+        source = params.get('sl', ['auto'])[0]
+        # Google answers one segment per line, each keeping its newline
+        lines = text.split('\n')
+        segments = [[fake_translation(line, target) + ('\n' if i < len(lines) - 1 else ''),
+                     line, None, None] for i, line in enumerate(lines)]
+        body = [segments, None, source if source != 'auto' else 'en']
+        self._send(200, body)
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StandInServer:
+    """Threaded local server speaking the providers' HTTP formats
+
+    GET requests are answered like Google's endpoint, POST requests like
+    DeepL's v2/translate (which also checks for an Authorization header).
+
+    ``delay`` adds artificial latency per request; ``fail_status`` makes
+    every request fail with that HTTP status and ``fail_on`` fails (HTTP 500)
+    any request containing one of the given texts.
+    """
+
+    def __init__(self, delay=0.0, fail_status=None, fail_on=()):
+        self.delay = delay
+        self.fail_status = fail_status
+        self.fail_on = set(fail_on)
+        self.requests = []
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.lock = threading.Lock()
+        self._httpd.connections = 0
+        self._httpd.standin = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def connections(self):
+        return self._httpd.connections
+
+    def on_request(self, provider, params):
+        with self._httpd.lock:
+            self.requests.append((provider, params))
+        if self.delay:
+            time.sleep(self.delay)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
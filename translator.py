@@ -1,44 +1,365 @@
-try:
-    from deep_translator import GoogleTranslator
-    TRANSLATOR_AVAILABLE = True
-except ImportError:
-    TRANSLATOR_AVAILABLE = False
-    
-import requests
+import time
+from command_grammar import CommandGrammar
 from database import Database
+from hedging import Hedger, LatencyTracker
+from language_id import LANGUAGE_ID
+from language_index import LANGUAGES
+from provider_router import ProviderRouter
+from rate_limiter import RateLimiterPool, LoadShedError, INTERACTIVE, BATCH
+from single_flight import SingleFlight
+from translation_cache import TranslationCache, normalize_text
+from translation_clients import CLIENTS, ClientPool
+from translation_engine import is_retryable
+from translation_memory import TranslationMemory
+from translation_outbox import TranslationOutbox, should_queue
+
+# How long settings read from the database are reused (seconds)
+SETTINGS_TTL = 2.0
+
+# Compiled once; parsing a command is a single pass over its words.
+# Language names come from the index; misheard names and codes in a
+# language slot are resolved through it too.
+COMMAND_GRAMMAR = CommandGrammar(LANGUAGES.phrase_names(), resolve=LANGUAGES.lookup,
+                                 fuzzy=LANGUAGES.fuzzy)
 
 class TranslationService:
     def __init__(self):
         self.db = Database()
+        self.cache = TranslationCache(self.db)
+        self.memory = TranslationMemory(self.db)
+        self.clients = ClientPool()
+        self.latency = LatencyTracker()
+        self.hedger = Hedger(retryable=is_retryable)
+        self.router = ProviderRouter()
+        self.flights = SingleFlight()
+        self.limits = RateLimiterPool()
+        self.outbox = TranslationOutbox(self)
+        self._settings = {}
     
     def translate(self, text, target_lang, source_lang='auto'):
-        """Translate text from source language to target language"""
-        api = self.db.get_setting('translation_api')
+        """Translate text from source language to target language
         
+        Requests that fail because the network is down are queued in the
+        outbox and translated once it is back.
+        """
         try:
-            if api == 'google':
-                return self._translate_google(text, target_lang, source_lang)
-            elif api == 'deepl':
-                return self._translate_deepl(text, target_lang, source_lang)
-            else:
-                return self._translate_google(text, target_lang, source_lang)
+            return self.translate_or_raise(text, target_lang, source_lang)
         except Exception as e:
+            if should_queue(e):
+                self.outbox.enqueue(text, target_lang, source_lang, e)
+                return f"Translation error: {e} (queued, will retry when online)"
             return f"Translation error: {e}"
     
+    def translate_or_raise(self, text, target_lang, source_lang='auto', priority=INTERACTIVE,
+                           deadline=None):
+        """Translate text, raising provider/network errors instead of
+        returning an error string (used by the async engine to retry)
+        
+        ``priority`` orders the request in the provider's rate-limit queue
+        (INTERACTIVE before BATCH); a request still queued there at
+        ``deadline`` (a ``time.monotonic()`` time) is shed. Unknown
+        language codes raise ValueError before any cache or network work.
+        Text whose explicit source equals the target is returned as is. An
+        'auto' source is still sent to the provider as 'auto': the local
+        identifier only knows a few languages and labels unknown ones as
+        their nearest known neighbour, so its guess is used only to file
+        the result in the cache and translation memory.
+        """
+        target_lang = LANGUAGES.validate(target_lang)
+        source_lang = LANGUAGES.validate(source_lang, allow_auto=True)
+        if source_lang == target_lang:
+            self.db.increment_stat('translation_short_circuit')
+            return text
+        key_source = source_lang
+        if source_lang == 'auto':
+            key_source = self._detect_source(text, target_lang)
+        api = self._get_setting('translation_api')
+        
+        cached = self.cache.get(text, key_source, target_lang, api)
+        if cached is not None:
+            return cached
+        
+        # Identical requests already in flight share that call's result
+        result, shared = self.flights.do(
+            (normalize_text(text), key_source, target_lang, api),
+            lambda: self._fetch(api, text, target_lang, source_lang, priority, deadline,
+                                key_source))
+        if shared:
+            self.db.increment_stat('translation_coalesced')
+        return result
+    
+    def _fetch(self, api, text, target_lang, source_lang, priority=INTERACTIVE, deadline=None,
+               key_source=None):
+        """Translate via the provider(s) chosen by the router and cache it
+        under ``key_source`` (defaults to ``source_lang``)"""
+        order = self.router.route(api, self._available_providers(api, source_lang, target_lang))
+        if self._get_setting('translation_hedging') == 'true':
+            result = self._translate_hedged(order, text, target_lang, source_lang, priority, deadline)
+        else:
+            result = self._translate_routed(order, text, target_lang, source_lang, priority, deadline)
+        
+        self._store(text, key_source or source_lang, target_lang, api, result)
+        return result
+    
+    def _store(self, text, source_lang, target_lang, api, translation):
+        """Cache a provider translation and add it to the translation memory"""
+        self.cache.put(text, source_lang, target_lang, api, translation)
+        if self._get_setting('translation_memory') == 'true':
+            self.memory.add(text, source_lang, target_lang, translation)
+    
+    def detect_language(self, text):
+        """Source language identified locally, or None to leave it to the provider"""
+        if self._get_setting('local_language_id') != 'true':
+            return None
+        return LANGUAGE_ID.detect(text)
+    
+    def _detect_source(self, text, target_lang):
+        """Locally detected source for an 'auto' request, else 'auto'
+        
+        Only a hint for cache and translation memory lookups; providers are
+        still sent 'auto' and detect the source themselves.
+        
+        A detection equal to the target is more likely a related language
+        the identifier does not know than a request to translate text into
+        its own language, so the provider decides.
+        """
+        detected = self.detect_language(text)
+        if detected is None or detected == target_lang:
+            return 'auto'
+        return detected
+    
+    def memory_match(self, text, target_lang, source_lang='auto'):
+        """Stored translation of a near-duplicate sentence, or None
+        
+        Returns a MemoryMatch (text, translation, similarity) that callers
+        can show at once, marked as fuzzy, while the real translation is
+        fetched. Local lookup only; never calls a provider.
+        """
+        if self._get_setting('translation_memory') != 'true':
+            return None
+        try:
+            target_lang = LANGUAGES.validate(target_lang)
+            source_lang = LANGUAGES.validate(source_lang, allow_auto=True)
+        except ValueError:
+            return None
+        if source_lang == 'auto':
+            source_lang = self._detect_source(text, target_lang)
+        try:
+            threshold = float(self._get_setting('translation_memory_threshold'))
+        except (TypeError, ValueError):
+            threshold = None
+        match = self.memory.find(text, source_lang, target_lang, threshold)
+        if match is not None:
+            self.db.increment_stat('translation_memory_hits')
+        return match
+    
+    def translate_batch(self, texts, target_lang, source_lang='auto'):
+        """Translate many texts with as few provider requests as possible
+        
+        Identical inputs (after normalisation) are translated once, cached
+        results are reused, and the rest are packed into requests up to the
+        provider's character limit. Order is preserved. Returns one dict per
+        input: {'text', 'translation', 'error', 'exception'} ('exception' is
+        the error raised, for should_queue); a failed request falls back to
+        per-item calls so one bad text does not fail its neighbours.
+        """
+        target_lang = LANGUAGES.validate(target_lang)
+        source_lang = LANGUAGES.validate(source_lang, allow_auto=True)
+        api = self._get_setting('translation_api')
+        provider = self.router.route(api, self._available_providers(api, source_lang, target_lang))[0]
+        client = self._client(provider, source_lang, target_lang)
+        
+        # Deduplicate: normalised text -> first original spelling
+        unique = {}
+        for text in texts:
+            unique.setdefault(normalize_text(text), text)
+        
+        done = {}
+        pending = []
+        for key, text in unique.items():
+            cached = self.cache.get(text, source_lang, target_lang, api)
+            if cached is not None:
+                done[key] = (cached, None)
+            else:
+                pending.append((key, text))
+        
+        for chunk in self._chunk_for(client, pending):
+            try:
+                self._throttle(provider, BATCH)
+                translations = self._call_provider(
+                    provider, lambda: client.translate_many([text for _, text in chunk]), len(chunk))
+                for (key, text), translation in zip(chunk, translations):
+                    done[key] = (translation, None)
+                    self._store(text, source_lang, target_lang, api, translation)
+            except Exception:
+                for key, text in chunk:
+                    try:
+                        self._throttle(provider, BATCH)
+                        translation = self._call_provider(provider, lambda: client.translate(text))
+                        done[key] = (translation, None)
+                        self._store(text, source_lang, target_lang, api, translation)
+                    except Exception as e:
+                        done[key] = (None, e)
+        
+        results = []
+        for text in texts:
+            translation, error = done[normalize_text(text)]
+            results.append({'text': text, 'translation': translation,
+                            'error': None if error is None else str(error), 'exception': error})
+        return results
+    
+    def coalesce_stats(self):
+        """How many provider calls ran and how many requests shared one"""
+        return self.flights.stats()
+    
+    def rate_limit_stats(self):
+        """Granted, queued and shed requests per provider"""
+        return self.limits.stats()
+    
+    def hedge_stats(self):
+        """How often hedged requests fired and how often the backup won"""
+        return self.hedger.stats()
+    
+    def _available_providers(self, preferred=None, source_lang='auto', target_lang=None):
+        """Providers that can take requests with the current settings
+        
+        The configured provider is always included so that a setup problem
+        (such as a missing DeepL key) is reported rather than routed around.
+        Providers that do not offer the language pair are left out, even the
+        configured one; the request then goes to one that does.
+        """
+        providers = ['google']
+        if preferred == 'deepl' or self._get_setting('deepl_api_key'):
+            providers.append('deepl')
+        if target_lang is None:
+            return providers
+        return [api for api in providers if CLIENTS[api].supports(source_lang, target_lang)]
+    
+    def _throttle(self, api, priority, deadline=None):
+        """Wait for the provider's rate limit (settings rate_limit_<api>
+        requests/second, bursts of rate_burst_<api>), at most until ``deadline``"""
+        rate = float(self._get_setting(f'rate_limit_{api}') or 5)
+        burst = int(self._get_setting(f'rate_burst_{api}') or 10)
+        try:
+            self.limits.get(api, rate, burst).acquire(priority, deadline)
+        except LoadShedError:
+            self.db.increment_stat('translation_shed')
+            raise
+    
+    def _translate_with(self, api, text, target_lang, source_lang, priority=INTERACTIVE, deadline=None):
+        """Call one provider within its rate limit, recording latency and health"""
+        self._throttle(api, priority, deadline)
+        if api == 'deepl':
+            return self._call_provider(api, lambda: self._translate_deepl(text, target_lang, source_lang))
+        return self._call_provider(api, lambda: self._translate_google(text, target_lang, source_lang))
+    
+    def _call_provider(self, api, call, texts=None):
+        """Run one provider request and report its outcome to the router
+        
+        Batched requests (``texts`` items) report their latency per text and
+        are left out of the latency tracker used for hedging.
+        """
+        start = time.monotonic()
+        try:
+            result = call()
+        except Exception as e:
+            # Only network/throttling/server errors count against the provider
+            if is_retryable(e):
+                self.router.record_failure(api)
+            raise
+        elapsed = time.monotonic() - start
+        if texts is None:
+            self.latency.record(api, elapsed)
+        self.router.record_success(api, elapsed / (texts or 1))
+        return result
+    
+    def _translate_routed(self, order, text, target_lang, source_lang, priority=INTERACTIVE,
+                          deadline=None):
+        """Try providers in routing order, failing over on provider errors"""
+        first_error = None
+        for api in order:
+            try:
+                return self._translate_with(api, text, target_lang, source_lang, priority, deadline)
+            except Exception as e:
+                # Only provider trouble fails over; bad input or settings surface
+                if not is_retryable(e):
+                    raise
+                first_error = first_error or e
+        raise first_error
+    
+    def _translate_hedged(self, order, text, target_lang, source_lang, priority=INTERACTIVE,
+                          deadline=None):
+        """Race a backup provider against a primary that is slower than usual
+        
+        The backup (the next provider in routing order, or the primary
+        again when it is the only one) fires once the primary has taken
+        longer than the ``hedge_percentile`` of its recent latencies, so
+        roughly that share of calls never hedge and the extra load stays
+        small.
+        """
+        api = order[0]
+        backup_api = order[1] if len(order) > 1 else api
+        percentile = float(self._get_setting('hedge_percentile') or 95)
+        result, fired, won = self.hedger.call(
+            lambda: self._translate_with(api, text, target_lang, source_lang, priority, deadline),
+            lambda: self._translate_with(backup_api, text, target_lang, source_lang, priority, deadline),
+            self.latency.percentile(api, percentile))
+        if fired:
+            self.db.increment_stat('hedge_fired')
+        if won:
+            self.db.increment_stat('hedge_won')
+        return result
+    
+    def _chunk_for(self, client, items):
+        """Split (key, text) pairs into groups fitting the client's request limit"""
+        chunk = []
+        size = 0
+        for item in items:
+            length = len(item[1]) + 1  # newline separator
+            full = client.max_texts is not None and len(chunk) >= client.max_texts
+            if chunk and (full or size + length > client.max_chars):
+                yield chunk
+                chunk = []
+                size = 0
+            chunk.append(item)
+            size += length
+        if chunk:
+            yield chunk
+    
+    def _get_setting(self, key):
+        """Read a setting, reusing recent reads so cache hits skip SQLite"""
+        now = time.monotonic()
+        entry = self._settings.get(key)
+        if entry is None or now - entry[1] > SETTINGS_TTL:
+            entry = (self.db.get_setting(key), now)
+            self._settings[key] = entry
+        return entry[0]
+    
+    def _client(self, api, source_lang, target_lang):
+        """Pooled client for a provider, with its API key from settings"""
+        if api == 'deepl':
+            self.clients.set_auth_key('deepl', self._get_setting('deepl_api_key') or '')
+        return self.clients.get(api, source_lang, target_lang)
+    
     def _translate_google(self, text, target_lang, source_lang='auto'):
         """Translate using Google Translate (free)"""
-        if not TRANSLATOR_AVAILABLE:
-            return f"Translation not available - install deep-translator: pip install deep-translator"
-        translator = GoogleTranslator(source=source_lang, target=target_lang)
-        return translator.translate(text)
+        return self._client('google', source_lang, target_lang).translate(text)
     
     def _translate_deepl(self, text, target_lang, source_lang='auto'):
-        """Translate using DeepL free API"""
-        # Note: This would require a DeepL API key
-        # For now, fall back to Google
-        return self._translate_google(text, target_lang, source_lang)
+        """Translate using the DeepL API (key from the deepl_api_key setting)"""
+        return self._client('deepl', source_lang, target_lang).translate(text)
     
-    def parse_translate_command(self, command):
+    def parse_command(self, command):
+        """Parse a text or voice command into an Intent (see command_grammar)
+        
+        Unnamed targets default to the target_language setting, or to
+        secondary_target_language when the source already is that language.
+        """
+        return COMMAND_GRAMMAR.parse(command,
+                                     self._get_setting('target_language') or 'en',
+                                     self._get_setting('secondary_target_language') or None)
+    
+    def parse_translate_command(self, command, all_targets=False):
         """Parse translate command to extract source and target languages
         
         Returns tuple: (source_lang, target_lang)
@@ -47,44 +368,20 @@ class TranslationService:
         - "translate from [lang1] to [lang2]" -> (lang1, lang2)
         - "translate russian to english" -> (ru, en)
         - "translate english to russian" -> (en, ru)
+        - "how do you say ... in [language]" -> (auto, language)
+        Defaults to (auto, en) when no language is named (see
+        parse_command); the target is None (no targets) when the named
+        source is the default target and no secondary target is set.
+        
+        With ``all_targets`` the second item is the list of every target
+        named: "translate to spanish, french and german" -> (auto, [es, fr, de]).
         """
-        command_lower = command.lower()
-        
-        # Check for "from X to Y" pattern
-        if 'from' in command_lower and 'to' in command_lower:
-            # Split by 'from' and 'to'
-            parts = command_lower.split('from')
-            if len(parts) > 1:
-                from_to_parts = parts[1].split('to')
-                if len(from_to_parts) >= 2:
-                    source_lang = from_to_parts[0].strip()
-                    target_lang = from_to_parts[1].strip().split()[0]
-                    return (self._language_to_code(source_lang), self._language_to_code(target_lang))
-        
-        # Check for simple "to [language]" pattern
-        if 'to' in command_lower:
-            parts = command_lower.split('to')
-            if len(parts) > 1:
-                target_lang = parts[1].strip().split()[0]
-                return ('auto', self._language_to_code(target_lang))
-        
-        # Default to auto-detect to English
-        return ('auto', 'en')
+        intent = self.parse_command(command)
+        if all_targets:
+            return (intent.source, intent.targets)
+        return (intent.source, intent.target)
     
     def _language_to_code(self, language):
-        """Convert language name to code"""
-        lang_map = {
-            'english': 'en',
-            'spanish': 'es',
-            'french': 'fr',
-            'german': 'de',
-            'italian': 'it',
-            'portuguese': 'pt',
-            'russian': 'ru',
-            'chinese': 'zh-CN',
-            'japanese': 'ja',
-            'korean': 'ko',
-            'arabic': 'ar',
-            'hindi': 'hi',
-        }
-        return lang_map.get(language, language)
+        """Convert language name (English, native, misheard) or code to a code"""
+        match = LANGUAGES.lookup(language)
+        return match[0] if match else language
@@ -17,6 +17,10 @@ import sys
 import signal
 from contextlib import contextmanager
 from database import Database
+from whisper_batch import WhisperBatchScheduler, PackedTranscriber, audio_data_to_pcm
+from transcript_cache import TranscriptCache, NUMPY_AVAILABLE
+from features import LogMelStream, N_FRAMES
+from asr_backends import create_backend
 
 
 @contextmanager
@@ -94,10 +98,26 @@ class VoiceProcessor:
         self.is_listening = False
         self.db = Database()
         self.whisper_model = None
+        self.whisper_scheduler = None
         self.listen_thread = None
         self.on_trigger_detected = None
         self.on_command_received = None
         self.audio_available = self._check_audio_availability()
+        
+        # Recognition engine per pipeline stage, chosen in settings
+        self._backends = {}
+        self.backend_overrides = {}
+        
+        # One log-mel front end on the capture stream, read by every consumer
+        self.features = LogMelStream() if NUMPY_AVAILABLE else None
+        self._last_audio = None
+        self._last_frames = None
+        
+        # Repeated audio (canned prompts, announcements) skips recognition
+        self.transcript_cache = None
+        if NUMPY_AVAILABLE and self.db.get_setting('transcript_cache') != 'false':
+            persist = self.db.get_setting('transcript_cache_persist') == 'true'
+            self.transcript_cache = TranscriptCache(self.db, persist=persist)
     
     def _check_audio_availability(self):
         """Check if audio input devices are available
@@ -170,12 +190,89 @@ class VoiceProcessor:
         if active_model:
             try:
                 self.whisper_model = whisper.load_model(active_model)
+                # Utterances from every caller share one batched inference queue
+                if self.whisper_scheduler:
+                    self.whisper_scheduler.close()
+                self.whisper_scheduler = WhisperBatchScheduler(self.whisper_model)
                 return True
             except Exception as e:
                 print(f"Error loading model: {e}")
                 return False
         return False
     
+    def transcribe_whisper(self, audio, language=None):
+        """Transcribe captured AudioData with the loaded Whisper model
+        
+        Requests go through the batch scheduler, so concurrent callers
+        share a single encoder pass instead of decoding one by one.
+        """
+        if not self.whisper_scheduler and not self.load_whisper_model():
+            return None
+        start, end = self._capture_features(audio)
+        if self.whisper_model.dims.n_mels == self.features.n_mels and end - start <= N_FRAMES:
+            return self.whisper_scheduler.transcribe(self.features.whisper_mel(start, end), language)
+        return self.whisper_scheduler.transcribe(audio_data_to_pcm(audio), language)
+    
+    def transcribe_batch(self, audio_list, packed=True, language=None):
+        """Transcribe many captured clips offline (e.g. replaying recordings)
+        
+        With ``packed`` set, short clips share 30-second Whisper windows;
+        otherwise they are submitted to the batch scheduler individually.
+        """
+        if not self.whisper_scheduler and not self.load_whisper_model():
+            return None
+        pcm_list = [audio_data_to_pcm(audio) for audio in audio_list]
+        if packed:
+            return PackedTranscriber(self.whisper_model, language=language).transcribe(pcm_list)
+        futures = [self.whisper_scheduler.submit(pcm, language) for pcm in pcm_list]
+        return [future.result() for future in futures]
+    
+    def _capture_features(self, audio):
+        """Feed captured audio into the shared feature stream once
+        
+        Returns the ``(start, end)`` log-mel frame range covering the audio;
+        later consumers of the same AudioData reuse the range. Each phrase
+        starts a new segment of the stream, so its features (and transcript
+        cache key) do not depend on the phrase heard before it.
+        """
+        if audio is not self._last_audio:
+            self.features.reset()
+            self._last_frames = self.features.feed(audio_data_to_pcm(audio))
+            self._last_audio = audio
+        return self._last_frames
+    
+    def get_backend(self, stage):
+        """Return the recognition backend configured for a pipeline stage
+        
+        Stages are 'trigger', 'command' and 'dictation'; each reads its
+        engine from the ``asr_<stage>`` setting unless overridden in
+        ``backend_overrides`` (e.g. with a FakeBackend in tests).
+        """
+        if stage in self.backend_overrides:
+            return self.backend_overrides[stage]
+        name = self.db.get_setting(f'asr_{stage}') or 'google'
+        if name not in self._backends:
+            self._backends[name] = create_backend(name, self)
+        return self._backends[name]
+    
+    def _recognize(self, audio, stage, language='en-US'):
+        """Recognise captured audio, reusing the transcript of audio heard before"""
+        backend = self.get_backend(stage)
+        key = None
+        if self.transcript_cache:
+            start, end = self._capture_features(audio)
+            key = self.transcript_cache.key(self.features.log_mel(start, end),
+                                            backend.cache_id, language)
+            if key:
+                cached = self.transcript_cache.get(key)
+                if cached is not None:
+                    return cached
+        
+        text = backend.recognize(audio, language)
+        if key:
+            self.transcript_cache.put(key, text)
+        return text
+    
     def start_listening(self):
         """Start listening for trigger phrase"""
         if not SR_AVAILABLE:
@@ -244,8 +341,7 @@ class VoiceProcessor:
                             print("Listening for trigger phrase...")
                             audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=5)
                     
-                        # Use Google Speech Recognition for trigger detection
-                        text = self.recognizer.recognize_google(audio).lower()
+                        text = self._recognize(audio, 'trigger').lower()
                         print(f"Heard: {text}")
                         
                         if trigger_phrase in text:
@@ -288,7 +384,7 @@ class VoiceProcessor:
                         print("Listening for command...")
                         audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
                     
-                    text = self.recognizer.recognize_google(audio)
+                    text = self._recognize(audio, 'command')
                     print(f"Command: {text}")
                     
                     if self.on_command_received:
@@ -299,8 +395,14 @@ class VoiceProcessor:
                 except Exception as e:
                     print(f"Error listening for command: {e}")
     
-    def listen_once(self):
-        """Listen for a single phrase (for translation input)"""
+    def listen_once(self, on_partial=None, partial_interval=1.0):
+        """Listen for a single phrase (for translation input)
+        
+        With ``on_partial``, the phrase is recorded as a stream and the audio
+        so far is recognised every ``partial_interval`` seconds while the
+        user is still speaking; ``on_partial(text)`` gets each partial
+        transcript (from a worker thread).
+        """
         if not SR_AVAILABLE:
             print("Error: SpeechRecognition not available")
             return None
@@ -318,9 +420,14 @@ class VoiceProcessor:
                     with microphone as source:
                         self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
                         print("Listening...")
-                        audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
+                        if on_partial is None:
+                            audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
+                        else:
+                            chunks = self.recognizer.listen(source, timeout=5, phrase_time_limit=10,
+                                                            stream=True)
+                            audio = self.collect_phrase(chunks, on_partial, partial_interval)
                     
-                    text = self.recognizer.recognize_google(audio)
+                    text = self._recognize(audio, 'dictation')
                     return text
                 except AbortException:
                     print("Error: Audio hardware assertion failure")
@@ -328,3 +435,43 @@ class VoiceProcessor:
                 except Exception as e:
                     print(f"Error in listen_once: {e}")
                     return None
+    
+    def collect_phrase(self, chunks, on_partial, partial_interval=1.0):
+        """Join streamed AudioData chunks, recognising partial audio on the way
+        
+        Every ``partial_interval`` seconds of audio, the phrase so far is
+        recognised on a worker thread (skipped while the previous partial
+        is still being recognised, so capture never waits) and the text is
+        passed to ``on_partial``. Returns the whole phrase as AudioData.
+        """
+        backend = self.get_backend('dictation')
+        busy = threading.Event()
+        raw = []
+        seconds = 0.0
+        last_partial = 0.0
+        sample_rate = sample_width = None
+        
+        def recognize_partial(audio):
+            try:
+                text = backend.recognize(audio)
+                if text:
+                    on_partial(text)
+            except Exception:
+                pass  # no speech yet, or a transient error: wait for the next one
+            finally:
+                busy.clear()
+        
+        for chunk in chunks:
+            data = chunk.get_raw_data()
+            sample_rate, sample_width = chunk.sample_rate, chunk.sample_width
+            raw.append(data)
+            seconds += len(data) / (sample_rate * sample_width)
+            if seconds - last_partial >= partial_interval and not busy.is_set():
+                last_partial = seconds
+                busy.set()
+                audio = sr.AudioData(b''.join(raw), sample_rate, sample_width)
+                threading.Thread(target=recognize_partial, args=(audio,), daemon=True).start()
+        
+        if sample_rate is None:
+            raise sr.WaitTimeoutError("no audio captured")
+        return sr.AudioData(b''.join(raw), sample_rate, sample_width)
@@ -0,0 +1,271 @@
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import torch
+    import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+SAMPLE_RATE = 16000
+
+
+def audio_data_to_pcm(audio):
+    """Convert a speech_recognition AudioData into float32 PCM at 16 kHz
+
+    Whisper expects mono float samples in [-1, 1] at 16 kHz, which is
+    what every consumer of captured audio in this module works with.
+    """
+    raw = audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2)
+    return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+class InferenceScheduler:
+    """Collects pending requests for a short window and runs them as one batch
+
+    Callers submit single items and get a Future back. A worker thread waits
+    up to ``max_wait_ms`` after the first pending item for more to arrive,
+    then hands up to ``max_batch_size`` items sharing the same key to
+    ``batch_fn(items, key)``, which must return one result per item.
+    """
+
+    def __init__(self, batch_fn, max_batch_size=8, max_wait_ms=15):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.batches_run = 0
+        self.items_run = 0
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, item, key=None):
+        """Queue an item for batched inference and return its Future"""
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Inference scheduler is closed")
+            self._pending.append((item, key, future))
+            self._cond.notify()
+        return future
+
+    def close(self, timeout=2):
+        """Stop the worker; items still pending are cancelled"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._worker.join(timeout=timeout)
+        with self._cond:
+            while self._pending:
+                self._pending.popleft()[2].cancel()
+
+    def _next_batch(self):
+        """Wait for work and return a list of (item, key, future) sharing a key"""
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return None
+
+            # Give other callers a few milliseconds to join this batch
+            deadline = time.monotonic() + self.max_wait
+            while len(self._pending) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            key = self._pending[0][1]
+            batch = []
+            kept = deque()
+            while self._pending and len(batch) < self.max_batch_size:
+                entry = self._pending.popleft()
+                if entry[1] == key:
+                    batch.append(entry)
+                else:
+                    kept.append(entry)
+            kept.extend(self._pending)
+            self._pending = kept
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            # Skip items whose callers already gave up
+            batch = [entry for entry in batch if entry[2].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            try:
+                results = self.batch_fn([entry[0] for entry in batch], batch[0][1])
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.batches_run += 1
+            self.items_run += len(batch)
+            for (_, _, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+def whisper_batch_fn(model):
+    """Build a batch function that decodes several utterances in one pass
+
+    Items are either float32 PCM, which is padded to Whisper's 30-second
+    window and converted here, or a ready (n_mels, 3000) log-mel window
+    taken from the shared feature stream. The spectrograms are stacked into
+    a single tensor and ``whisper.decode`` runs the encoder and the decoding
+    loop over the whole batch at once.
+    """
+    fp16 = model.device.type != 'cpu'
+
+    def to_mel(item):
+        if item.ndim == 2:
+            return torch.from_numpy(item)
+        return whisper.log_mel_spectrogram(whisper.pad_or_trim(item), model.dims.n_mels)
+
+    def decode(items, language):
+        mels = [to_mel(item) for item in items]
+        batch = torch.stack(mels).to(model.device)
+        options = whisper.DecodingOptions(language=language, fp16=fp16, without_timestamps=True)
+        results = whisper.decode(model, batch, options)
+        return [result.text.strip() for result in results]
+
+    return decode
+
+
+class WhisperBatchScheduler(InferenceScheduler):
+    """Batched Whisper transcription shared by every caller of one model"""
+
+    def __init__(self, model, max_batch_size=8, max_wait_ms=15):
+        super().__init__(whisper_batch_fn(model), max_batch_size, max_wait_ms)
+        self.model = model
+
+    def transcribe(self, audio, language=None, timeout=None):
+        """Transcribe PCM or a log-mel window, blocking until its batch finishes"""
+        return self.submit(audio, language).result(timeout=timeout)
+
+
+def trim_silence(pcm, threshold=0.01, frame=320):
+    """Strip leading and trailing low-energy frames from float32 PCM
+
+    A simple energy VAD: frames of ``frame`` samples whose RMS is below
+    ``threshold`` are dropped from both ends of the clip.
+    """
+    n_frames = len(pcm) // frame
+    if n_frames == 0:
+        return pcm
+    frames = pcm[:n_frames * frame].reshape(n_frames, frame)
+    voiced = np.flatnonzero(np.sqrt((frames ** 2).mean(axis=1)) >= threshold)
+    if len(voiced) == 0:
+        return pcm[:0]
+    return pcm[voiced[0] * frame:(voiced[-1] + 1) * frame]
+
+
+def plan_packed_windows(durations, gap=0.5, window=30.0):
+    """Greedily pack clip durations (seconds) into Whisper-sized windows
+
+    Returns a list of windows, each a list of ``(clip_index, offset)`` pairs
+    where ``offset`` is the clip's start time inside the window. Clips are
+    separated by ``gap`` seconds of silence; a clip that does not fit in an
+    empty window gets a window of its own.
+    """
+    windows = []
+    current = []
+    cursor = 0.0
+    for index, duration in enumerate(durations):
+        if current and cursor + duration > window:
+            windows.append(current)
+            current = []
+            cursor = 0.0
+        current.append((index, cursor))
+        cursor += duration + gap
+    if current:
+        windows.append(current)
+    return windows
+
+
+def split_packed_words(words, placements, durations, gap=0.5):
+    """Assign timestamped words from a packed window back to their clips
+
+    ``words`` is a list of ``(start, end, text)`` tuples. Each word goes to
+    the clip whose span, widened by half the separating gap, contains the
+    word's midpoint. Returns ``{clip_index: transcript}``.
+    """
+    texts = {index: [] for index, _ in placements}
+    for start, end, text in words:
+        middle = (start + end) / 2
+        owner = placements[0][0]
+        for index, offset in placements:
+            if middle >= offset - gap / 2:
+                owner = index
+            if middle < offset + durations[index] + gap / 2:
+                break
+        texts[owner].append(text)
+    return {index: ''.join(parts).strip() for index, parts in texts.items()}
+
+
+class PackedTranscriber:
+    """Offline transcription that packs short clips into shared 30 s windows
+
+    Whisper pads every input to 30 seconds, so decoding short commands one
+    at a time wastes most of the encoder work. Clips are silence-trimmed,
+    concatenated with short gaps, decoded once with word timestamps and
+    the transcript is split back to the original clips.
+    """
+
+    def __init__(self, model, gap=0.5, language=None):
+        self.model = model
+        self.gap = gap
+        self.language = language
+        self.windows_decoded = 0
+
+    def transcribe(self, clips):
+        """Transcribe a list of float32 16 kHz PCM clips, one string per clip"""
+        clips = [trim_silence(pcm) for pcm in clips]
+        durations = [len(pcm) / SAMPLE_RATE for pcm in clips]
+        window = whisper.audio.CHUNK_LENGTH
+        silence = np.zeros(int(self.gap * SAMPLE_RATE), dtype=np.float32)
+
+        results = [''] * len(clips)
+        for placements in plan_packed_windows(durations, self.gap, window):
+            parts = []
+            for index, _ in placements:
+                parts.extend([clips[index], silence])
+            # A lone clip longer than the window is left for transcribe() to chunk
+            packed = np.concatenate(parts[:-1])
+
+            output = self.model.transcribe(
+                packed,
+                language=self.language,
+                word_timestamps=True,
+                condition_on_previous_text=False,
+                fp16=self.model.device.type != 'cpu',
+            )
+            self.windows_decoded += 1
+
+            words = []
+            for segment in output['segments']:
+                if segment.get('words'):
+                    words.extend((w['start'], w['end'], w['word']) for w in segment['words'])
+                else:
+                    words.append((segment['start'], segment['end'], segment['text']))
+
+            for index, text in split_packed_words(words, placements, durations, self.gap).items():
+                results[index] = text
+        return results